@@ -1,4 +1,5 @@
 
+from dataclasses import dataclass
 from typing import AsyncGenerator, Generator
 from functools import lru_cache
 
@@ -19,6 +20,8 @@ from app.database.repositories import (
     WatchlistRepository,
     MarketTrendAnalysisRepository,
 )
+from app.config import settings
+from app.ml.batching import ForecastBatcher
 from app.ml.predictor import AgriculturalPredictor
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -26,10 +29,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async for session in get_async_session():
         yield session
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-
-    async for session in get_async_session():
-        yield session
+get_db_session = get_db
 
 async def get_current_user(request: Request) -> dict:
 
@@ -83,6 +83,34 @@ async def get_market_trend_analysis_repo(
 
     return MarketTrendAnalysisRepository(db)
 
+@dataclass(frozen=True, slots=True)
+class Repos:
+    commodity: CommodityRepository
+    market: MarketRepository
+    market_price: MarketPriceRepository
+    alert: AlertRepository
+    inventory: InventoryRepository
+    prediction_metrics: PredictionMetricsRepository
+    prediction: PredictionRepository
+    discussion: DiscussionRepository
+    watchlist: WatchlistRepository
+    market_trend_analysis: MarketTrendAnalysisRepository
+
+async def get_repos(db: AsyncSession = Depends(get_db)) -> Repos:
+
+    return Repos(
+        commodity=CommodityRepository(db),
+        market=MarketRepository(db),
+        market_price=MarketPriceRepository(db),
+        alert=AlertRepository(db),
+        inventory=InventoryRepository(db),
+        prediction_metrics=PredictionMetricsRepository(db),
+        prediction=PredictionRepository(db),
+        discussion=DiscussionRepository(db),
+        watchlist=WatchlistRepository(db),
+        market_trend_analysis=MarketTrendAnalysisRepository(db),
+    )
+
 _predictor_instance = None
 
 @lru_cache()
@@ -102,6 +130,11 @@ def get_predictor() -> AgriculturalPredictor:
     
     return _predictor_instance
 
+@lru_cache()
+def get_forecast_batcher() -> ForecastBatcher:
+
+    return ForecastBatcher(get_predictor(), settings.forecast_batch_max_requests)
+
 def reset_predictor() -> None:
 
     global _predictor_instance
@@ -1,33 +1,39 @@
 
-from datetime import timedelta
-from pathlib import Path
+import asyncio
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Optional
+from zlib import crc32
 
 import numpy as np
-import pandas as pd
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlalchemy import select, desc
 
-from app.config import settings
-
 from app.api.dependencies import (
+    Repos,
+    get_repos,
     get_predictor,
+    get_forecast_batcher,
     get_commodity_repo,
     get_market_repo,
     get_market_price_repo,
     get_inventory_repo,
-    get_prediction_metrics_repo,
 )
-from app.core.utils import get_current_timestamp
+from app.core.cache import COMMODITIES_CACHE_KEY, MARKETS_CACHE_KEY, cached
+from app.core.responses import ORJSONResponse
+from app.core.utils import get_current_timestamp, synthetic_demand
+from app.database.connection import run_with_session
 from app.database.repositories import (
     CommodityRepository,
     MarketRepository,
     MarketPriceRepository,
     InventoryRepository,
-    PredictionMetricsRepository,
 )
 from app.database.models import MarketPrice
+from app.ml.batching import ForecastBatcher
 from app.ml.predictor import AgriculturalPredictor
 from app.models.schemas import (
     ForecastRequest,
@@ -60,8 +66,8 @@ async def _get_or_create_entities(
 
     commodity = await commodity_repo.get_by_name(request.product)
     if not commodity:
-        commodity = await commodity_repo.create(
-            name=request.product,
+        commodity = await commodity_repo.get_or_create(
+            request.product,
             category=request.category or "General",
             unit="Quintal",
         )
@@ -69,8 +75,8 @@ async def _get_or_create_entities(
 
     market = await market_repo.get_by_name(request.market)
     if not market:
-        market = await market_repo.create(
-            name=request.market,
+        market = await market_repo.get_or_create(
+            request.market,
             state=request.state or request.city or "Unknown",
             district=request.city or request.state or "",
         )
@@ -81,6 +87,21 @@ async def _get_or_create_entities(
 
     return commodity, market
 
+# Seeds the deterministic fallback prices, so it must stay stable across
+# processes (unlike the built-in hash())
+def _name_hash(name: str) -> int:
+
+    return crc32(name.encode("utf-8"))
+
+def _price_array(records, modal_first: bool = False) -> np.ndarray:
+
+    # Missing prices come through as 0 so callers can mask them out of the array
+    if modal_first:
+        values = (p.modal_price or p.price or 0.0 for p in records)
+    else:
+        values = (p.price or p.modal_price or 0.0 for p in records)
+    return np.fromiter(values, dtype=np.float64, count=len(records))
+
 @router.post(
     "/forecast",
     response_model=ForecastResponse,
@@ -89,16 +110,14 @@ async def _get_or_create_entities(
 async def generate_forecast(
     request: ForecastRequest,
     predictor: AgriculturalPredictor = Depends(get_predictor),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
-    metrics_repo: PredictionMetricsRepository = Depends(get_prediction_metrics_repo),
+    batcher: ForecastBatcher = Depends(get_forecast_batcher),
+    repos: Repos = Depends(get_repos),
 ) -> ForecastResponse:
 
     try:
-        commodity, market = await _get_or_create_entities(request, commodity_repo, market_repo)
+        commodity, market = await _get_or_create_entities(request, repos.commodity, repos.market)
 
-        history = await market_price_repo.get_price_history(
+        history = await repos.market_price.get_price_history(
             commodity_id=commodity.id,
             market_id=market.id,
             days=120,
@@ -106,89 +125,76 @@ async def generate_forecast(
 
         if not history:
             logger.warning("No historical prices found; using conservative fallback")
-            commodity_hash = sum(ord(c) for c in commodity.name)
+            commodity_hash = _name_hash(commodity.name)
             base_price = 1500 + (commodity_hash % 1500)
             base_arrival = 800.0
-            price_series = [base_price]
+            price_series = np.array([base_price], dtype=np.float64)
         else:
-            price_series = [p.price or p.modal_price or 0 for p in history if (p.price or p.modal_price)]
-            base_price = float(price_series[-1]) if price_series else 2400.0
+            price_series = _price_array(history)
+            price_series = price_series[price_series > 0]
+            base_price = float(price_series[-1]) if price_series.size else 2400.0
             base_arrival = float(history[-1].arrival or 900.0)
 
-        avg_price = float(np.mean(price_series)) if price_series else base_price
+        avg_price = float(price_series.mean()) if price_series.size else base_price
         slope = 0.0
-        if len(price_series) >= 2:
-            slope = (price_series[-1] - price_series[0]) / max(len(price_series) - 1, 1)
+        if price_series.size >= 2:
+            slope = float(price_series[-1] - price_series[0]) / (price_series.size - 1)
         trend = "up" if slope > 0 else "down" if slope < 0 else "flat"
 
-        forecasts: List[ForecastPoint] = []
         horizon = int(request.forecast_range)
         start_date = get_current_timestamp().date()
 
-        use_model_predictions = True
-        model_dir = Path(settings.model_dir)
-        # Check if models are loaded in the predictor (they should be via dependency injection)
-        if predictor.ensemble.models and predictor.ensemble.preprocessor:
-            # Models are loaded, use them for predictions
-            logger.info(f"Using {len(predictor.ensemble.models)} loaded models for forecasts")
-        else:
-            # Models not loaded, use fallback pricing
-            use_model_predictions = False
+        use_model_predictions = predictor.is_ready
+        if not use_model_predictions:
             logger.info("No trained models available; using fallback pricing for forecasts")
 
-        for offset in range(1, horizon + 1):
-            target_date = start_date + timedelta(days=offset)
-            payload = {
-                "date": target_date,
-                "commodity_id": commodity.id,
-                "market_id": market.id,
-                "price": base_price,
-                "arrival": base_arrival,
-            }
+        target_dates = np.datetime64(start_date, "D") + np.arange(1, horizon + 1)
 
-            price_pred = base_price
-            lower = price_pred * 0.96
-            upper = price_pred * 1.05
-            confidence = 0.82
+        # Fallback pricing, replaced below when the models produce a forecast
+        points = [(base_price, base_price * 0.96, base_price * 1.05, 0.82)] * horizon
 
+        if use_model_predictions:
             try:
-                df = pd.DataFrame([payload])
-                features = predictor.preprocessor.prepare_prediction_data(
-                    df,
-                    date_col="date",
-                    categorical_cols=predictor.preprocessor.categorical_features or None,
+                results = await batcher.predict_horizon(
+                    target_dates, commodity.id, market.id, base_price, base_arrival
                 )
-                result = predictor.predict(features, include_individual=False, include_confidence=True)
-                if "prediction" in result:
-                    price_pred = float(result.get("prediction", price_pred))
-                    lower = float(result.get("lower_bound", lower))
-                    upper = float(result.get("upper_bound", upper))
-                    confidence = float(result.get("confidence", confidence) or confidence)
+                points = [
+                    (
+                        float(result["prediction"]),
+                        float(result["lower_bound"]),
+                        float(result["upper_bound"]),
+                        float(result["confidence"] or 0.82),
+                    )
+                    for result in results
+                ]
             except Exception as exc:
                 logger.warning(f"Prediction fallback for {commodity.name}: {exc}")
 
-            forecasts.append(
-                ForecastPoint(
-                    date=target_date.isoformat(),
-                    predicted_price=price_pred,
-                    lower_bound=lower,
-                    upper_bound=upper,
-                    confidence=confidence,
-                )
+        # Built from server-side values, so field validation is skipped here;
+        # FastAPI still checks the whole payload against response_model
+        forecasts: List[ForecastPoint] = [
+            ForecastPoint.model_construct(
+                date=target_date,
+                predicted_price=price_pred,
+                lower_bound=lower,
+                upper_bound=upper,
+                confidence=confidence,
             )
+            for target_date, (price_pred, lower, upper, confidence) in zip(target_dates.astype(str).tolist(), points)
+        ]
 
-        ensemble_metrics = await metrics_repo.get_latest_metrics(model_name="ensemble")
+        ensemble_metrics = await repos.prediction_metrics.get_latest_metrics(model_name="ensemble")
         model_accuracy = float(
             (ensemble_metrics.accuracy * 100) if ensemble_metrics and ensemble_metrics.accuracy and ensemble_metrics.accuracy <= 1 else (ensemble_metrics.accuracy if ensemble_metrics and ensemble_metrics.accuracy else 85.0)
         )
 
         notes = [
             f"Trend: {trend} based on recent prices",
-            f"Using {len(price_series)} days of history",
+            f"Using {price_series.size} days of history",
             f"Model confidence ~{model_accuracy:.1f}%",
         ]
 
-        return ForecastResponse(
+        return ForecastResponse.model_construct(
             product=commodity.name,
             market=market.name,
             state=market.state,
@@ -211,12 +217,11 @@ async def generate_forecast(
     status_code=status.HTTP_200_OK,
 )
 async def generate_ai_insights(
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
+    repos: Repos = Depends(get_repos),
 ) -> List[InsightItemResponse]:
 
     try:
-        recent_prices = await market_price_repo.get_recent_prices(days=30)
+        recent_prices = await repos.market_price.get_recent_prices(days=30)
 
         if not recent_prices:
             return []
@@ -224,7 +229,7 @@ async def generate_ai_insights(
         commodity_cache = {}
         for price in recent_prices:
             if price.commodity_id not in commodity_cache:
-                commodity = await commodity_repo.get_by_id(price.commodity_id)
+                commodity = await repos.commodity.get_by_id(price.commodity_id)
                 commodity_cache[price.commodity_id] = commodity.name if commodity else "Commodity"
 
         insights: List[InsightItemResponse] = []
@@ -275,15 +280,12 @@ async def generate_ai_insights(
     status_code=status.HTTP_200_OK,
 )
 async def model_accuracy_summary(
-    metrics_repo: PredictionMetricsRepository = Depends(get_prediction_metrics_repo),
+    repos: Repos = Depends(get_repos),
     predictor: AgriculturalPredictor = Depends(get_predictor),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
 ) -> ModelAccuracySummary:
 
     try:
-        latest = await metrics_repo.get_latest_metrics(model_name="ensemble")
+        latest = await repos.prediction_metrics.get_latest_metrics(model_name="ensemble")
         if latest:
             ai_accuracy = latest.accuracy if latest.accuracy is not None else None
             if ai_accuracy and ai_accuracy <= 1:
@@ -317,14 +319,14 @@ async def model_accuracy_summary(
             target_commodity = None
             target_market = None
             
-            commodities = await commodity_repo.get_all(limit=5)
-            markets = await market_repo.get_all(limit=5)
+            commodities = await repos.commodity.get_all(limit=5)
+            markets = await repos.market.get_all(limit=5)
             
             found_prices = []
             
             for comm in commodities:
                 for mark in markets:
-                    prices = await market_price_repo.get_price_history(comm.id, mark.id, days=7)
+                    prices = await repos.market_price.get_price_history(comm.id, mark.id, days=7)
                     if prices and len(prices) >= 3:
                         found_prices = prices
                         target_commodity = comm
@@ -387,15 +389,13 @@ async def model_accuracy_summary(
     status_code=status.HTTP_200_OK,
 )
 async def inventory_dashboard(
-    inventory_repo: InventoryRepository = Depends(get_inventory_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
 ) -> List[InventoryDashboardItem]:
 
     try:
-        inventory_items = await inventory_repo.get_all(skip=skip, limit=limit)
+        inventory_items = await repos.inventory.get_all(skip=skip, limit=limit)
 
         if not inventory_items:
             return []
@@ -403,8 +403,8 @@ async def inventory_dashboard(
         response: list[InventoryDashboardItem] = []
 
         for item in inventory_items:
-            commodity = await commodity_repo.get_by_id(item.commodity_id)
-            market = await market_repo.get_by_id(item.market_id)
+            commodity = await repos.commodity.get_by_id(item.commodity_id)
+            market = await repos.market.get_by_id(item.market_id)
 
             suggested = item.optimal_stock or (item.current_stock * 1.1)
             risk_ratio = item.current_stock / suggested if suggested else 1
@@ -438,9 +438,7 @@ async def inventory_dashboard(
     status_code=status.HTTP_200_OK,
 )
 async def filter_inventory(
-    inventory_repo: InventoryRepository = Depends(get_inventory_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
     market: Optional[str] = Query(None, description="Filter by market name"),
     category: Optional[str] = Query(None, description="Filter by commodity category"),
     product: Optional[str] = Query(None, description="Filter by product name"),
@@ -450,17 +448,17 @@ async def filter_inventory(
 ) -> List[InventoryDashboardItem]:
 
     try:
-        inventory_items = await inventory_repo.get_all(skip=skip, limit=limit)
+        inventory_items = await repos.inventory.get_all(skip=skip, limit=limit)
 
         if not inventory_items:
             return []
 
         response: list[InventoryDashboardItem] = []
+        market_needle = market.lower() if market else None
+        category_needle = category.lower() if category else None
+        product_needle = product.lower() if product else None
 
         for item in inventory_items:
-            commodity = await commodity_repo.get_by_id(item.commodity_id)
-            market_obj = await market_repo.get_by_id(item.market_id)
-
             suggested = item.optimal_stock or (item.current_stock * 1.1)
             risk_ratio = item.current_stock / suggested if suggested else 1
             if risk_ratio < 0.7:
@@ -470,13 +468,17 @@ async def filter_inventory(
             else:
                 item_risk = "Low"
 
-            if market and market_obj and market.lower() not in market_obj.name.lower():
+            if risk and risk != item_risk:
                 continue
-            if category and commodity and category.lower() not in (commodity.category or "").lower():
+
+            commodity = await repos.commodity.get_by_id(item.commodity_id)
+            market_obj = await repos.market.get_by_id(item.market_id)
+
+            if market_needle and market_obj and market_needle not in market_obj.name.lower():
                 continue
-            if product and commodity and product.lower() not in commodity.name.lower():
+            if category_needle and commodity and category_needle not in (commodity.category or "").lower():
                 continue
-            if risk and risk != item_risk:
+            if product_needle and commodity and product_needle not in commodity.name.lower():
                 continue
 
             response.append(
@@ -555,34 +557,38 @@ async def get_product_analysis(
     commodity_name: Optional[str] = Query(None, description="Commodity name to analyze"),
     market_name: Optional[str] = Query(None, description="Market name to analyze"),
     days: int = Query(7, description="Number of days for analysis"),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    inventory_repo: InventoryRepository = Depends(get_inventory_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
+    repos: Repos = Depends(get_repos),
 ) -> ProductAnalysisResponse:
 
     try:
-        commodities = await commodity_repo.get_all(limit=5)
-        markets = await market_repo.get_all(limit=3)
+        # Each read runs on its own session and returns its connection when done.
+        # The request session has not checked one out yet, so no request ever
+        # holds a connection while waiting for another. The inventory rows serve
+        # both the stock metrics and the recommendation table.
+        commodities, markets, all_inventory_items = await asyncio.gather(
+            run_with_session(lambda db: CommodityRepository(db).get_all(limit=5)),
+            run_with_session(lambda db: MarketRepository(db).get_all(limit=3)),
+            run_with_session(lambda db: InventoryRepository(db).get_all(limit=10)),
+        )
         
         if not commodities or not markets:
             raise HTTPException(status_code=404, detail="No data available. Please run data seeding first.")
         
         if commodity_name:
-            selected_commodity = await commodity_repo.get_by_name(commodity_name)
+            selected_commodity = await repos.commodity.get_by_name(commodity_name)
             if not selected_commodity:
                 selected_commodity = commodities[0]
         else:
             selected_commodity = commodities[0]
         
         if market_name:
-            selected_market = await market_repo.get_by_name(market_name)
+            selected_market = await repos.market.get_by_name(market_name)
             if not selected_market:
                 selected_market = markets[0]
         else:
             selected_market = markets[0]
         
-        price_history = await market_price_repo.get_price_history(
+        price_history = await repos.market_price.get_price_history(
             commodity_id=selected_commodity.id,
             market_id=selected_market.id,
             days=days * 2
@@ -594,9 +600,8 @@ async def get_product_analysis(
             forecastRange=f"Next {days} Days"
         )
         
-        inventories = await inventory_repo.get_all(limit=1)
-        if inventories:
-            inv = inventories[0]
+        if all_inventory_items:
+            inv = all_inventory_items[0]
             current = int(inv.current_stock or 0)
             optimal = int(inv.optimal_stock or current * 1.2)
             stock_metrics = StockMetrics(
@@ -633,30 +638,29 @@ async def get_product_analysis(
                     forecast_price = int(actual_price * 1.05)
                     day_idx = i % 7
                     demand_graph.append(
-                        DemandGraphPoint(day=day_names[day_idx], actual=actual_price, forecast=forecast_price)
+                        DemandGraphPoint.model_construct(day=day_names[day_idx], actual=actual_price, forecast=forecast_price)
                     )
         else:
-            commodity_hash = sum(ord(c) for c in selected_commodity.name)
+            commodity_hash = _name_hash(selected_commodity.name)
             base_demand = 1500 + (commodity_hash % 1500)
             
-            for i in range(days):
-                variation = 0.9 + (((commodity_hash + i * 7) % 20) / 100)
-                actual = int(base_demand * variation)
-                forecast = int(actual * 1.05)
-                demand_graph.append(
-                    DemandGraphPoint(day=day_names[i % 7], actual=actual, forecast=forecast)
-                )
+            demand = synthetic_demand(base_demand, commodity_hash, days).tolist()
+            demand_graph = [
+                DemandGraphPoint.model_construct(day=day_names[i % 7], actual=actual, forecast=forecast)
+                for i, (actual, forecast) in enumerate(demand)
+            ]
         
         festival_impacts = []
         weather_impacts = []
         
         if price_history and len(price_history) > 7:
-            recent_prices = [float(p.modal_price or p.price or 0) for p in price_history[:7] if p.modal_price or p.price]
-            older_prices = [float(p.modal_price or p.price or 0) for p in price_history[7:14] if p.modal_price or p.price]
+            prices = _price_array(price_history[:14], modal_first=True)
+            recent_prices = prices[:7][prices[:7] > 0]
+            older_prices = prices[7:][prices[7:] > 0]
             
-            if recent_prices and older_prices:
-                recent_avg = np.mean(recent_prices)
-                older_avg = np.mean(older_prices)
+            if recent_prices.size and older_prices.size:
+                recent_avg = float(recent_prices.mean())
+                older_avg = float(older_prices.mean())
                 price_change = ((recent_avg - older_avg) / older_avg * 100) if older_avg > 0 else 0
                 
                 festival_impacts.append({
@@ -664,7 +668,7 @@ async def get_product_analysis(
                     "impact": f"+{price_change:.1f}%" if price_change > 0 else f"{price_change:.1f}%"
                 })
                 
-                volatility = float(np.std(recent_prices)) if len(recent_prices) > 1 else 0
+                volatility = float(recent_prices.std()) if recent_prices.size > 1 else 0
                 weather_impacts.append({
                     "condition": "Price Volatility",
                     "impact": f"±{volatility:.1f}%"
@@ -675,11 +679,14 @@ async def get_product_analysis(
             weather=weather_impacts
         )
         
-        all_inventory_items = await inventory_repo.get_all(limit=10)
+        recommendation_items = all_inventory_items[:5]
+        commodities_by_id = await repos.commodity.get_by_ids(
+            [item.commodity_id for item in recommendation_items]
+        )
         recommendations = []
         
-        for item in all_inventory_items[:5]:
-            item_commodity = await commodity_repo.get_by_id(item.commodity_id)
+        for item in recommendation_items:
+            item_commodity = commodities_by_id.get(item.commodity_id)
             suggested = int(item.optimal_stock or (item.current_stock * 1.1))
             buffer = int(suggested - item.current_stock)
             
@@ -692,7 +699,7 @@ async def get_product_analysis(
                 risk = "Low"
             
             recommendations.append(
-                RecommendationRow(
+                RecommendationRow.model_construct(
                     product=item_commodity.name if item_commodity else "Product",
                     current=int(item.current_stock),
                     suggested=suggested,
@@ -712,7 +719,7 @@ async def get_product_analysis(
         logger.exception(f"Product analysis failed: {exc}")
         raise HTTPException(status_code=500, detail="Unable to fetch product analysis data")
 
-CATEGORY_MAPPING = {
+CATEGORY_MAPPING = MappingProxyType({
     "Wheat": "Cereals", "Rice": "Cereals", "Maize": "Cereals", "Bajra": "Cereals",
     "Jowar": "Cereals", "Barley": "Cereals", "Ragi": "Cereals",
     "Potato": "Vegetables", "Onion": "Vegetables", "Tomato": "Vegetables",
@@ -730,8 +737,9 @@ CATEGORY_MAPPING = {
     "Grapes": "Fruits", "Papaya": "Fruits", "Guava": "Fruits", "Pomegranate": "Fruits",
     "Turmeric": "Spices", "Red Chilli": "Spices", "Chilli (Dry)": "Spices",
     "Cumin": "Spices", "Coriander Seeds": "Spices",
-}
+})
 
+@lru_cache(maxsize=1024)
 def get_commodity_category(name: str, existing_category: str = None) -> str:
     if existing_category and existing_category not in ("", "Other", None):
         return existing_category
@@ -742,7 +750,11 @@ def get_commodity_category(name: str, existing_category: str = None) -> str:
     response_model=List[dict],
     status_code=status.HTTP_200_OK,
 )
-async def get_commodities(commodity_repo: CommodityRepository = Depends(get_commodity_repo)):
+@cached(COMMODITIES_CACHE_KEY, as_json=True)
+async def get_commodities(
+    request: Request,
+    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
+):
 
     try:
         commodities = await commodity_repo.get_all()
@@ -787,7 +799,8 @@ async def init_user(request: "Request"):
     response_model=List[dict],
     status_code=status.HTTP_200_OK,
 )
-async def get_markets(market_repo: MarketRepository = Depends(get_market_repo)):
+@cached(MARKETS_CACHE_KEY, as_json=True)
+async def get_markets(request: Request, market_repo: MarketRepository = Depends(get_market_repo)):
 
     try:
         markets = await market_repo.get_all()
@@ -809,8 +822,10 @@ async def get_weather(
         from app.services.weather_service import get_weather_service
         
         weather_service = get_weather_service()
-        current_weather = await weather_service.get_current_weather(state)
-        forecast = await weather_service.get_forecast(state, days=5)
+        current_weather, forecast = await asyncio.gather(
+            weather_service.get_current_weather(state),
+            weather_service.get_forecast(state, days=5),
+        )
         impact = weather_service.get_agricultural_impact(current_weather)
         
         return {
@@ -835,9 +850,7 @@ async def get_price_history(
     commodity: Optional[str] = Query(None, description="Commodity name (alias)"),
     market: Optional[str] = Query(None, description="Market name (alias)"),
     days: int = Query(default=30, ge=1, le=90, description="Number of days"),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
+    repos: Repos = Depends(get_repos),
 ):
     """Get historical price data for charting."""
     try:
@@ -848,16 +861,9 @@ async def get_price_history(
         if not commodity_search or not market_search:
             raise HTTPException(status_code=422, detail="Both commodity and market are required")
         
-        # Try exact match first, then case-insensitive
-        commodity_obj = await commodity_repo.get_by_name(commodity_search)
-        if not commodity_obj:
-            commodity_obj = await commodity_repo.get_by_name(commodity_search.title())
-        if not commodity_obj:
-            commodity_obj = await commodity_repo.get_by_name(commodity_search.capitalize())
-        
-        market_obj = await market_repo.get_by_name(market_search)
-        if not market_obj:
-            market_obj = await market_repo.get_by_name(market_search.title())
+        # get_by_name already matches case-insensitively
+        commodity_obj = await repos.commodity.get_by_name(commodity_search)
+        market_obj = await repos.market.get_by_name(market_search)
         
         if not commodity_obj or not market_obj:
             # Return empty data instead of 404 to prevent frontend errors
@@ -870,7 +876,7 @@ async def get_price_history(
                 "message": "No data found for the specified commodity/market combination"
             }
         
-        history = await market_price_repo.get_price_history(
+        history = await repos.market_price.get_price_history(
             commodity_id=commodity_obj.id,
             market_id=market_obj.id,
             days=days,
@@ -885,31 +891,33 @@ async def get_price_history(
                 .order_by(desc(MarketPrice.date))
                 .limit(1)
             )
-            latest_result = await market_price_repo.db.execute(latest_market_query)
+            latest_result = await repos.market_price.db.execute(latest_market_query)
             fallback_market_id = latest_result.scalar_one_or_none()
 
             if fallback_market_id and fallback_market_id != market_obj.id:
-                fallback_history = await market_price_repo.get_price_history(
+                fallback_history = await repos.market_price.get_price_history(
                     commodity_id=commodity_obj.id,
                     market_id=fallback_market_id,
                     days=days,
                 )
 
                 if fallback_history:
-                    fallback_market = await market_repo.get_by_id(fallback_market_id)
+                    fallback_market = await repos.market.get_by_id(fallback_market_id)
                     history = fallback_history
                     market_obj = fallback_market or market_obj
                     notice = (
                         "No data for selected market. Showing latest available market data instead."
                     )
         
-        return {
+        # Returned as a response so the rows skip jsonable_encoder; orjson
+        # writes the dates in the same ISO format
+        return ORJSONResponse(content={
             "commodity": commodity_obj.name,
             "market": market_obj.name,
             "days": days,
             "prices": [
                 {
-                    "date": p.date.isoformat(),
+                    "date": p.date,
                     "price": float(p.price or p.modal_price or 0),
                     "min_price": float(p.min_price) if p.min_price else None,
                     "max_price": float(p.max_price) if p.max_price else None,
@@ -919,7 +927,7 @@ async def get_price_history(
             ],
             "count": len(history),
             "notice": notice,
-        }
+        })
     except HTTPException:
         raise
     except Exception as exc:  # noqa: BLE001
@@ -933,23 +941,21 @@ async def get_price_history(
 )
 async def get_market_comparison(
     commodity: str = Query(..., description="Commodity name to compare across markets"),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
+    repos: Repos = Depends(get_repos),
 ):
     """Get price comparison for a commodity across different markets."""
     try:
-        commodity_obj = await commodity_repo.get_by_name(commodity)
+        commodity_obj = await repos.commodity.get_by_name(commodity)
         if not commodity_obj:
             raise HTTPException(status_code=404, detail=f"Commodity '{commodity}' not found")
         
         # Get all markets
-        markets = await market_repo.get_all(limit=50)
+        markets = await repos.market.get_all(limit=50)
         
         comparison_data = []
         for market in markets:
             # Get latest price for this commodity in this market
-            history = await market_price_repo.get_price_history(
+            history = await repos.market_price.get_price_history(
                 commodity_id=commodity_obj.id,
                 market_id=market.id,
                 days=7,
@@ -998,61 +1004,64 @@ async def export_prices(
     days: int = Query(30, description="Number of days of price data to export"),
     commodity_name: Optional[str] = Query(None, description="Filter by commodity"),
     market_name: Optional[str] = Query(None, description="Filter by market"),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
+    repos: Repos = Depends(get_repos),
 ):
     """Export price history data for download."""
     try:
-        from datetime import datetime, timedelta
-        
-        # Get all commodities and markets
-        commodities = await commodity_repo.get_all(limit=100)
-        markets = await market_repo.get_all(limit=100)
+        commodities = await repos.commodity.get_all(limit=100)
+        markets = await repos.market.get_all(limit=100)
         
         if not commodities or not markets:
             return []
         
-        export_data = []
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
         # Filter commodities and markets if specified
-        commodity_filter = [c for c in commodities if not commodity_name or c.name.lower() == commodity_name.lower()]
-        market_filter = [m for m in markets if not market_name or m.name.lower() == market_name.lower()]
+        commodity_needle = commodity_name.lower() if commodity_name else None
+        market_needle = market_name.lower() if market_name else None
+        commodity_filter = [c for c in commodities if not commodity_needle or c.name.lower() == commodity_needle]
+        market_filter = [m for m in markets if not market_needle or m.name.lower() == market_needle]
         
         # Limit to first few combinations to avoid timeout
-        for commodity in commodity_filter[:10]:
-            for market in market_filter[:5]:
-                prices = await market_price_repo.get_price_history(
-                    commodity_id=commodity.id,
-                    market_id=market.id,
-                    days=days,
-                )
-                
-                for price in prices:
-                    try:
-                        date_val = price.date.isoformat() if hasattr(price, 'date') and price.date else ""
-                        export_data.append({
-                            "date": date_val,
-                            "commodity": commodity.name,
-                            "market": market.name,
-                            "state": getattr(market, 'state', ''),
-                            "min_price": float(price.min_price) if price.min_price else 0,
-                            "max_price": float(price.max_price) if price.max_price else 0,
-                            "modal_price": float(price.modal_price) if price.modal_price else 0,
-                        })
-                    except Exception as e:
-                        logger.warning(f"Error processing price record: {e}")
-                        continue
+        commodity_names = {c.id: c.name for c in commodity_filter[:10]}
+        market_lookup = {m.id: (m.name, getattr(m, "state", "")) for m in market_filter[:5]}
         
-        export_data.sort(key=lambda x: x["date"], reverse=True)
+        rows = await repos.market_price.get_export_rows(
+            commodity_ids=list(commodity_names),
+            market_ids=list(market_lookup),
+            days=days,
+        )
         
-        return export_data
+        return StreamingResponse(
+            _iter_export_json(rows, commodity_names, market_lookup),
+            media_type="application/json",
+        )
     except Exception as exc:
         logger.exception(f"Export prices failed: {exc}")
         raise HTTPException(status_code=500, detail="Unable to export price data")
 
+def _iter_export_json(rows, commodity_names: dict, market_lookup: dict, chunk_size: int = 500):
+    
+    yield b"["
+    chunk = []
+    first = True
+    for row in rows:
+        market, state = market_lookup[row.market_id]
+        chunk.append(orjson.dumps({
+            "date": row.date.isoformat() if row.date else "",
+            "commodity": commodity_names[row.commodity_id],
+            "market": market,
+            "state": state,
+            "min_price": float(row.min_price) if row.min_price else 0,
+            "max_price": float(row.max_price) if row.max_price else 0,
+            "modal_price": float(row.modal_price) if row.modal_price else 0,
+        }))
+        if len(chunk) >= chunk_size:
+            yield (b"" if first else b",") + b",".join(chunk)
+            first = False
+            chunk = []
+    if chunk:
+        yield (b"" if first else b",") + b",".join(chunk)
+    yield b"]"
+
 
 @router.post("/refresh-data")
 async def refresh_market_data():
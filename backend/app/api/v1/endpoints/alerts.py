@@ -6,9 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from loguru import logger
 
 from app.api.dependencies import (
+    Repos,
+    get_repos,
     get_alert_repo,
-    get_commodity_repo,
-    get_market_repo,
 )
 from app.models.schemas import (
     AlertRequest,
@@ -17,8 +17,6 @@ from app.models.schemas import (
 )
 from app.database.repositories import (
     AlertRepository,
-    CommodityRepository,
-    MarketRepository,
 )
 from app.database.models import Alert
 from app.core.utils import get_current_timestamp
@@ -28,14 +26,12 @@ router = APIRouter(prefix="/alerts", tags=["alerts"])
 @router.post("/", response_model=AlertResponse, status_code=status.HTTP_201_CREATED)
 async def create_alert(
     request: AlertRequest,
-    alert_repo: AlertRepository = Depends(get_alert_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> AlertResponse:
 
     try:
         if request.commodity_id:
-            commodity = await commodity_repo.get_by_id(request.commodity_id)
+            commodity = await repos.commodity.get_by_id(request.commodity_id)
             if not commodity:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -43,7 +39,7 @@ async def create_alert(
                 )
 
         if request.market_id:
-            market = await market_repo.get_by_id(request.market_id)
+            market = await repos.market.get_by_id(request.market_id)
             if not market:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -61,7 +57,7 @@ async def create_alert(
             message=request.message,
         )
 
-        created = await alert_repo.create(alert)
+        created = await repos.alert.create(alert)
 
         logger.info(
             f"Alert created: type={created.alert_type}, "
@@ -6,10 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from loguru import logger
 
 from app.api.dependencies import (
+    Repos,
+    get_repos,
     get_alert_repo,
-    get_commodity_repo,
-    get_market_repo,
-    get_market_price_repo,
 )
 from app.models.schemas import (
     BuySellAlertRequest,
@@ -24,9 +23,6 @@ from app.models.schemas import (
 )
 from app.database.repositories import (
     AlertRepository,
-    CommodityRepository,
-    MarketRepository,
-    MarketPriceRepository,
 )
 from app.database.models import Alert
 from app.core.utils import get_current_timestamp
@@ -77,20 +73,18 @@ def determine_price_trend(
 @router.post("", response_model=BuySellAlertResponse, status_code=status.HTTP_201_CREATED)
 async def create_buysell_alert(
     request: BuySellAlertRequest,
-    alert_repo: AlertRepository = Depends(get_alert_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> BuySellAlertResponse:
 
     try:
-        commodity = await commodity_repo.get_by_id(request.commodity_id)
+        commodity = await repos.commodity.get_by_id(request.commodity_id)
         if not commodity:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Commodity {request.commodity_id} not found"
             )
 
-        market = await market_repo.get_by_id(request.market_id)
+        market = await repos.market.get_by_id(request.market_id)
         if not market:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -120,8 +114,8 @@ async def create_buysell_alert(
             message=request.message or f"Buy/Sell alert for {commodity.name} at {market.name}",
         )
 
-        created = await alert_repo.create(alert)
-        await alert_repo.db.commit()
+        created = await repos.alert.create(alert)
+        await repos.alert.db.commit()
 
         logger.info(
             f"Buy/Sell alert created: commodity={commodity.name}, "
@@ -156,24 +150,21 @@ async def create_buysell_alert(
 @router.get("/{alert_id}", response_model=BuySellAlertResponse)
 async def get_buysell_alert(
     alert_id: int,
-    alert_repo: AlertRepository = Depends(get_alert_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
+    repos: Repos = Depends(get_repos),
 ) -> BuySellAlertResponse:
 
     try:
-        alert = await alert_repo.get_by_id(alert_id)
+        alert = await repos.alert.get_by_id(alert_id)
         if not alert or alert.alert_type != "BUY_SELL":
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Buy/Sell alert {alert_id} not found"
             )
 
-        commodity = await commodity_repo.get_by_id(alert.commodity_id)
-        market = await market_repo.get_by_id(alert.market_id)
+        commodity = await repos.commodity.get_by_id(alert.commodity_id)
+        market = await repos.market.get_by_id(alert.market_id)
 
-        current_price_record = await market_price_repo.get_latest_price(
+        current_price_record = await repos.market_price.get_latest_price(
             commodity_id=alert.commodity_id,
             market_id=alert.market_id,
         )
@@ -228,14 +219,11 @@ async def list_buysell_alerts(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     enabled_only: bool = Query(True),
-    alert_repo: AlertRepository = Depends(get_alert_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
+    repos: Repos = Depends(get_repos),
 ) -> BuySellAlertListResponse:
 
     try:
-        alerts = await alert_repo.get_all()
+        alerts = await repos.alert.get_all()
         buysell_alerts = [
             a for a in alerts 
             if a.alert_type == "BUY_SELL" and (not enabled_only or a.status == "ACTIVE")
@@ -248,10 +236,10 @@ async def list_buysell_alerts(
         triggered_count = 0
 
         for alert in paginated:
-            commodity = await commodity_repo.get_by_id(alert.commodity_id)
-            market = await market_repo.get_by_id(alert.market_id)
+            commodity = await repos.commodity.get_by_id(alert.commodity_id)
+            market = await repos.market.get_by_id(alert.market_id)
 
-            current_price_record = await market_price_repo.get_latest_price(
+            current_price_record = await repos.market_price.get_latest_price(
                 commodity_id=alert.commodity_id,
                 market_id=alert.market_id,
             )
@@ -317,14 +305,11 @@ async def list_buysell_alerts(
 async def update_buysell_alert(
     alert_id: int,
     request: BuySellAlertUpdateRequest,
-    alert_repo: AlertRepository = Depends(get_alert_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
+    repos: Repos = Depends(get_repos),
 ) -> BuySellAlertResponse:
 
     try:
-        alert = await alert_repo.get_by_id(alert_id)
+        alert = await repos.alert.get_by_id(alert_id)
         if not alert or alert.alert_type != "BUY_SELL":
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -354,13 +339,13 @@ async def update_buysell_alert(
             alert.message = request.message
 
         alert.updated_at = get_current_timestamp()
-        await alert_repo.db.flush()
-        await alert_repo.db.commit()
+        await repos.alert.db.flush()
+        await repos.alert.db.commit()
 
-        commodity = await commodity_repo.get_by_id(updated.commodity_id)
-        market = await market_repo.get_by_id(updated.market_id)
+        commodity = await repos.commodity.get_by_id(updated.commodity_id)
+        market = await repos.market.get_by_id(updated.market_id)
 
-        current_price_record = await market_price_repo.get_latest(
+        current_price_record = await repos.market_price.get_latest(
             commodity_id=updated.commodity_id,
             market_id=updated.market_id,
         )
@@ -16,7 +16,8 @@ from app.models.schemas import (
     CommentListResponse,
 )
 from app.database.repositories import DiscussionRepository
-from app.database.models import Discussion, Comment, DiscussionLike
+from app.database.models import Discussion, DiscussionLike
+from app.database.models_discussion_comments import DiscussionComment
 from app.core.utils import get_current_timestamp
 
 router = APIRouter(prefix="/discussions", tags=["Discussions"])
@@ -161,13 +162,12 @@ async def create_discussion(
             content=request.content,
             commodity=request.commodity,
             market=request.market,
+            commodity_id=await repo.get_commodity_id(request.commodity),
+            market_id=await repo.get_market_id(request.market),
             author=request.author,
             avatar_url=avatar_url,
             tags=request.tags or [],
             status="PUBLISHED",
-            likes_count=0,
-            replies_count=0,
-            views_count=0,
             is_pinned=False,
         )
 
@@ -354,8 +354,16 @@ async def get_comments(
 ) -> CommentListResponse:
     """Get comments for a discussion."""
     from sqlalchemy import select
+    from sqlalchemy.orm import raiseload
     try:
-        stmt = select(Comment).where(Comment.discussion_id == discussion_id).order_by(Comment.created_at.desc()).offset(skip).limit(limit)
+        stmt = (
+            select(DiscussionComment)
+            .where(DiscussionComment.discussion_id == discussion_id)
+            .options(raiseload(DiscussionComment.replies))
+            .order_by(DiscussionComment.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
         result = await db.execute(stmt)
         comments = result.scalars().all()
         
@@ -364,6 +372,7 @@ async def get_comments(
                 id=c.id,
                 discussion_id=c.discussion_id,
                 author=c.author,
+                author_id=c.author_id,
                 avatar_url=c.avatar_url,
                 content=c.content,
                 likes_count=c.likes_count,
@@ -395,19 +404,16 @@ async def create_comment(
         
         avatar_url = request.avatar_url or f"https://api.dicebear.com/7.x/avataaars/svg?seed={request.author}"
         
-        comment = Comment(
+        comment = DiscussionComment(
             discussion_id=discussion_id,
-            author=request.author,
+            author=request.author or "Anonymous",
+            author_id=request.author_id,
             avatar_url=avatar_url,
             content=request.content,
-            likes_count=0,
         )
         
         db.add(comment)
         
-        # Increment replies count on discussion
-        discussion.replies_count = (discussion.replies_count or 0) + 1
-        
         await db.flush()
         await db.commit()
         await db.refresh(comment)
@@ -418,6 +424,7 @@ async def create_comment(
             id=comment.id,
             discussion_id=comment.discussion_id,
             author=comment.author,
+            author_id=comment.author_id,
             avatar_url=comment.avatar_url,
             content=comment.content,
             likes_count=comment.likes_count,
@@ -456,16 +463,16 @@ async def toggle_like(
         if existing_like:
             # Unlike
             await db.delete(existing_like)
-            discussion.likes_count = max(0, (discussion.likes_count or 0) - 1)
             liked = False
         else:
             # Like
             new_like = DiscussionLike(discussion_id=discussion_id, user_id=user_id)
             db.add(new_like)
-            discussion.likes_count = (discussion.likes_count or 0) + 1
             liked = True
         
+        # likes_count is maintained by a trigger on discussion_likes
         await db.flush()
+        await db.refresh(discussion, attribute_names=["likes_count"])
         await db.commit()
         
         return {
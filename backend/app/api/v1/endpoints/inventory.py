@@ -7,10 +7,8 @@ from loguru import logger
 import numpy as np
 
 from app.api.dependencies import (
-    get_inventory_repo,
-    get_commodity_repo,
-    get_market_repo,
-    get_market_price_repo,
+    Repos,
+    get_repos,
     get_predictor,
 )
 from app.models.schemas import (
@@ -19,12 +17,6 @@ from app.models.schemas import (
     InventorySuggestionResponse,
     InventoryUpdateRequest,
 )
-from app.database.repositories import (
-    InventoryRepository,
-    CommodityRepository,
-    MarketRepository,
-    MarketPriceRepository,
-)
 from app.ml.predictor import AgriculturalPredictor
 from app.database.models import Inventory
 from app.core.utils import get_current_timestamp
@@ -39,27 +31,25 @@ async def list_inventory(
     low_stock_only: bool = False,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    inventory_repo: InventoryRepository = Depends(get_inventory_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> List[InventoryResponse]:
 
     try:
         if low_stock_only:
             threshold = settings.inventory_reorder_threshold
-            items = await inventory_repo.get_low_stock_items(threshold_pct=threshold)
+            items = await repos.inventory.get_low_stock_items(threshold_pct=threshold)
         elif commodity_id and market_id:
-            item = await inventory_repo.get_by_commodity_market(commodity_id, market_id)
+            item = await repos.inventory.get_by_commodity_market(commodity_id, market_id)
             items = [item] if item else []
         elif commodity_id:
-            items = await inventory_repo.get_by_commodity(commodity_id)
+            items = await repos.inventory.get_by_commodity(commodity_id)
         else:
-            items = await inventory_repo.get_all(skip=skip, limit=limit)
+            items = await repos.inventory.get_all(skip=skip, limit=limit)
 
         responses = []
         for item in items:
-            commodity = await commodity_repo.get_by_id(item.commodity_id)
-            market = await market_repo.get_by_id(item.market_id)
+            commodity = await repos.commodity.get_by_id(item.commodity_id)
+            market = await repos.market.get_by_id(item.market_id)
 
             responses.append(
                 InventoryResponse(
@@ -93,10 +83,7 @@ async def list_inventory(
 async def get_inventory_suggestions(
     request: InventorySuggestionRequest,
     predictor: AgriculturalPredictor = Depends(get_predictor),
-    inventory_repo: InventoryRepository = Depends(get_inventory_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
+    repos: Repos = Depends(get_repos),
 ) -> InventorySuggestionResponse:
 
     try:
@@ -105,27 +92,27 @@ async def get_inventory_suggestions(
             f"market={request.market_id}"
         )
 
-        commodity = await commodity_repo.get_by_id(request.commodity_id)
+        commodity = await repos.commodity.get_by_id(request.commodity_id)
         if not commodity:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Commodity {request.commodity_id} not found"
             )
 
-        market = await market_repo.get_by_id(request.market_id)
+        market = await repos.market.get_by_id(request.market_id)
         if not market:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Market {request.market_id} not found"
             )
 
-        inventory = await inventory_repo.get_by_commodity_market(
+        inventory = await repos.inventory.get_by_commodity_market(
             request.commodity_id, request.market_id
         )
 
         current_stock = inventory.current_stock if inventory else 0
 
-        historical_prices = await market_price_repo.get_price_history(
+        historical_prices = await repos.market_price.get_price_history(
             commodity_id=request.commodity_id,
             market_id=request.market_id,
             days=90
@@ -218,13 +205,11 @@ async def get_inventory_suggestions(
 async def update_inventory(
     inventory_id: int,
     request: InventoryUpdateRequest,
-    inventory_repo: InventoryRepository = Depends(get_inventory_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> InventoryResponse:
 
     try:
-        inventory = await inventory_repo.get_by_id(inventory_id)
+        inventory = await repos.inventory.get_by_id(inventory_id)
         
         if not inventory:
             raise HTTPException(
@@ -240,10 +225,10 @@ async def update_inventory(
         if request.reorder_point is not None:
             update_data['reorder_point'] = request.reorder_point
 
-        updated = await inventory_repo.update(inventory_id, update_data)
+        updated = await repos.inventory.update(inventory_id, update_data)
 
-        commodity = await commodity_repo.get_by_id(updated.commodity_id)
-        market = await market_repo.get_by_id(updated.market_id)
+        commodity = await repos.commodity.get_by_id(updated.commodity_id)
+        market = await repos.market.get_by_id(updated.market_id)
 
         return InventoryResponse(
             id=updated.id,
@@ -6,9 +6,10 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from loguru import logger
 
 from app.api.dependencies import (
+    Repos,
+    get_repos,
     get_commodity_repo,
     get_market_repo,
-    get_market_price_repo,
 )
 from app.models.schemas import (
     CommodityResponse,
@@ -19,7 +20,6 @@ from app.models.schemas import (
 from app.database.repositories import (
     CommodityRepository,
     MarketRepository,
-    MarketPriceRepository,
 )
 from app.core.utils import get_current_timestamp
 
@@ -159,9 +159,7 @@ async def get_market_prices(
     end_date: Optional[date] = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> MarketDataListResponse:
 
     try:
@@ -171,18 +169,18 @@ async def get_market_prices(
             start_date = end_date - timedelta(days=30)
 
         if commodity_id and market_id:
-            prices = await market_price_repo.get_price_history(
+            prices = await repos.market_price.get_price_history(
                 commodity_id=commodity_id,
                 market_id=market_id,
                 days=(end_date - start_date).days
             )
         elif market_id:
-            prices = await market_price_repo.get_market_prices(
+            prices = await repos.market_price.get_market_prices(
                 market_id=market_id,
                 date=end_date
             )
         else:
-            prices = await market_price_repo.get_all(skip=skip, limit=limit)
+            prices = await repos.market_price.get_all(skip=skip, limit=limit)
 
         total = len(prices)
         prices = prices[skip:skip + limit]
@@ -192,12 +190,12 @@ async def get_market_prices(
 
         for price in prices:
             if price.commodity_id not in commodity_map:
-                commodity = await commodity_repo.get_by_id(price.commodity_id)
+                commodity = await repos.commodity.get_by_id(price.commodity_id)
                 if commodity:
                     commodity_map[price.commodity_id] = commodity.name
 
             if price.market_id not in market_map:
-                market = await market_repo.get_by_id(price.market_id)
+                market = await repos.market.get_by_id(price.market_id)
                 if market:
                     market_map[price.market_id] = market.name
 
@@ -239,13 +237,11 @@ async def get_market_prices(
 async def get_latest_price(
     commodity_id: int,
     market_id: int,
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> MarketPriceResponse:
 
     try:
-        price = await market_price_repo.get_latest_price(
+        price = await repos.market_price.get_latest_price(
             commodity_id=commodity_id,
             market_id=market_id
         )
@@ -256,8 +252,8 @@ async def get_latest_price(
                 detail=f"No price data found for commodity {commodity_id} in market {market_id}"
             )
 
-        commodity = await commodity_repo.get_by_id(commodity_id)
-        market = await market_repo.get_by_id(market_id)
+        commodity = await repos.commodity.get_by_id(commodity_id)
+        market = await repos.market.get_by_id(market_id)
 
         return MarketPriceResponse(
             id=price.id,
@@ -7,7 +7,7 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 import numpy as np
 
-from app.api.dependencies import get_db
+from app.api.dependencies import Repos, get_db, get_repos
 from app.models.schemas import (
     MarketTrendAnalysisResponse,
     MarketTrendComparisonResponse,
@@ -74,22 +74,21 @@ async def get_trend_comparison(
     commodity_id: int,
     market_id: int,
     repo: MarketTrendAnalysisRepository = Depends(get_trend_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> MarketTrendComparisonResponse:
 
     try:
-        commodity = await commodity_repo.get_by_id(commodity_id)
-        market = await market_repo.get_by_id(market_id)
+        commodity = await repos.commodity.get_by_id(commodity_id)
+        market = await repos.market.get_by_id(market_id)
         
         if not commodity or not market:
             raise HTTPException(status_code=404, detail="Commodity or market not found")
         
         trends_data = await repo.get_trend_comparison(commodity_id, market_id)
         
-        trends_7d = await _build_trend_response(trends_data["7d"], commodity_repo, market_repo) if trends_data["7d"] else None
-        trends_14d = await _build_trend_response(trends_data["14d"], commodity_repo, market_repo) if trends_data["14d"] else None
-        trends_30d = await _build_trend_response(trends_data["30d"], commodity_repo, market_repo) if trends_data["30d"] else None
+        trends_7d = await _build_trend_response(trends_data["7d"], repos.commodity, repos.market) if trends_data["7d"] else None
+        trends_14d = await _build_trend_response(trends_data["14d"], repos.commodity, repos.market) if trends_data["14d"] else None
+        trends_30d = await _build_trend_response(trends_data["30d"], repos.commodity, repos.market) if trends_data["30d"] else None
         
         trend_change = "STABLE"
         recommendation = "HOLD"
@@ -129,8 +128,7 @@ async def get_trend_for_period(
     market_id: int,
     period_days: int = Path(..., ge=1, le=365),
     repo: MarketTrendAnalysisRepository = Depends(get_trend_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> MarketTrendAnalysisResponse:
 
     try:
@@ -139,7 +137,7 @@ async def get_trend_for_period(
         if not trend_analysis:
             raise HTTPException(status_code=404, detail="No trend analysis available for this period")
         
-        return await _build_trend_response(trend_analysis, commodity_repo, market_repo)
+        return await _build_trend_response(trend_analysis, repos.commodity, repos.market)
     except HTTPException:
         raise
     except Exception as e:
@@ -153,8 +151,7 @@ async def get_trend_history(
     period_days: int = Query(7, ge=7, le=365),
     days_back: int = Query(90, ge=1, le=365),
     repo: MarketTrendAnalysisRepository = Depends(get_trend_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> List[MarketTrendAnalysisResponse]:
 
     try:
@@ -167,7 +164,7 @@ async def get_trend_history(
         
         responses = []
         for trend in trend_history:
-            responses.append(await _build_trend_response(trend, commodity_repo, market_repo))
+            responses.append(await _build_trend_response(trend, repos.commodity, repos.market))
         
         return responses
     except Exception as e:
@@ -179,13 +176,12 @@ async def analyze_market_trends(
     commodity_id: int,
     market_id: int,
     price_repo: MarketPriceRepository = Depends(get_price_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> dict:
 
     try:
-        commodity = await commodity_repo.get_by_id(commodity_id)
-        market = await market_repo.get_by_id(market_id)
+        commodity = await repos.commodity.get_by_id(commodity_id)
+        market = await repos.market.get_by_id(market_id)
         
         if not commodity or not market:
             raise HTTPException(status_code=404, detail="Commodity or market not found")
@@ -1,4 +1,5 @@
 
+import asyncio
 from typing import Any, List, Optional
 from datetime import datetime, timedelta
 
@@ -8,10 +9,9 @@ import numpy as np
 import pandas as pd
 
 from app.api.dependencies import (
+    Repos,
+    get_repos,
     get_predictor,
-    get_commodity_repo,
-    get_market_repo,
-    get_market_price_repo,
     get_prediction_repo,
 )
 from app.models.schemas import (
@@ -26,9 +26,6 @@ from app.models.schemas import (
 )
 from app.ml.predictor import AgriculturalPredictor
 from app.database.repositories import (
-    CommodityRepository,
-    MarketRepository,
-    MarketPriceRepository,
     PredictionRepository,
 )
 from app.database.models import Prediction
@@ -40,10 +37,7 @@ router = APIRouter(prefix="/predict", tags=["predictions"])
 async def predict_price(
     request: PredictionRequest,
     predictor: AgriculturalPredictor = Depends(get_predictor),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
-    prediction_repo: PredictionRepository = Depends(get_prediction_repo),
+    repos: Repos = Depends(get_repos),
 ) -> PredictionResponse:
 
     try:
@@ -52,14 +46,14 @@ async def predict_price(
             f"market_id={request.market_id}, date={request.prediction_date}"
         )
 
-        commodity = await commodity_repo.get_by_id(request.commodity_id)
+        commodity = await repos.commodity.get_by_id(request.commodity_id)
         if not commodity:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Commodity {request.commodity_id} not found. Check your catalog or seed fresh data."
             )
 
-        market = await market_repo.get_by_id(request.market_id)
+        market = await repos.market.get_by_id(request.market_id)
         if not market:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -68,7 +62,7 @@ async def predict_price(
 
         request_label = f"{commodity.name} @ {market.name} on {request.prediction_date}"
 
-        historical_prices = await market_price_repo.get_price_history(
+        historical_prices = await repos.market_price.get_price_history(
             commodity_id=request.commodity_id,
             market_id=request.market_id,
             days=90
@@ -113,11 +107,16 @@ async def predict_price(
         )
 
         try:
-            prediction_result = predictor.predict(
+            prediction_result = await predictor.predict_async(
                 features,
                 include_individual=True,
                 include_confidence=True
             )
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"Prediction for {request_label} timed out. Try again shortly."
+            )
         except ZeroDivisionError as zdiv_e:
             logger.error(f"Division by zero in prediction: {zdiv_e}", exc_info=True)
             prediction_result = {
@@ -199,9 +198,9 @@ async def predict_price(
                 prediction_date=pred_date,
                 predicted_price=prediction_result['prediction'],
                 confidence=prediction_result.get('confidence', 0.85),
-                model_used="ensemble",
+                model_id=await repos.prediction_metrics.get_model_id("ensemble", model_metadata.model_version),
             )
-            await prediction_repo.create(prediction_record)
+            await repos.prediction.create(prediction_record)
         except Exception as e:
             logger.warning(f"Could not persist prediction to database: {e}")
 
@@ -225,10 +224,7 @@ async def predict_price(
 async def batch_predict_prices(
     request: BatchPredictionRequest,
     predictor: AgriculturalPredictor = Depends(get_predictor),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    market_price_repo: MarketPriceRepository = Depends(get_market_price_repo),
-    prediction_repo: PredictionRepository = Depends(get_prediction_repo),
+    repos: Repos = Depends(get_repos),
 ) -> BatchPredictionResponse:
 
     try:
@@ -241,10 +237,7 @@ async def batch_predict_prices(
                 result = await predict_price(
                     request=pred_request,
                     predictor=predictor,
-                    commodity_repo=commodity_repo,
-                    market_repo=market_repo,
-                    market_price_repo=market_price_repo,
-                    prediction_repo=prediction_repo,
+                    repos=repos,
                 )
                 predictions.append(result)
             except Exception as e:
@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_db
+from app.api.dependencies import Repos, get_db, get_repos
 from app.models.schemas import (
     WatchlistCreate,
     WatchlistUpdate,
@@ -44,23 +44,20 @@ async def get_user_watchlist(
     user_id: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    repo: WatchlistRepository = Depends(get_watchlist_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
-    price_repo: MarketPriceRepository = Depends(get_market_price_repo),
+    repos: Repos = Depends(get_repos),
 ) -> WatchlistListResponse:
 
     try:
-        watchlist_items = await repo.get_user_watchlist(user_id, skip, limit)
+        watchlist_items = await repos.watchlist.get_user_watchlist(user_id, skip, limit)
         
         responses = []
         for item in watchlist_items:
-            commodity = await commodity_repo.get_by_id(item.commodity_id)
-            market = await market_repo.get_by_id(item.market_id) if item.market_id else None
+            commodity = await repos.commodity.get_by_id(item.commodity_id)
+            market = await repos.market.get_by_id(item.market_id) if item.market_id else None
             
             current_price = None
             if market and commodity:
-                latest_price = await price_repo.get_latest_price(item.commodity_id, item.market_id)
+                latest_price = await repos.market_price.get_latest_price(item.commodity_id, item.market_id)
                 current_price = latest_price.price if latest_price else None
             
             responses.append(
@@ -91,26 +88,24 @@ async def get_user_watchlist(
 @router.post("", response_model=WatchlistResponse, status_code=status.HTTP_201_CREATED)
 async def add_to_watchlist(
     request: WatchlistCreate,
-    repo: WatchlistRepository = Depends(get_watchlist_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> WatchlistResponse:
 
     try:
-        commodity = await commodity_repo.get_by_id(request.commodity_id)
+        commodity = await repos.commodity.get_by_id(request.commodity_id)
         if not commodity:
             raise HTTPException(status_code=404, detail="Commodity not found")
         
         market = None
         if request.market_id:
-            market = await market_repo.get_by_id(request.market_id)
+            market = await repos.market.get_by_id(request.market_id)
             if not market:
                 raise HTTPException(status_code=404, detail="Market not found")
         
-        if await repo.exists(request.user_id, request.commodity_id, request.market_id):
+        if await repos.watchlist.exists(request.user_id, request.commodity_id, request.market_id):
             raise HTTPException(status_code=400, detail="Item already in watchlist")
         
-        watchlist_item = await repo.create(
+        watchlist_item = await repos.watchlist.create(
             user_id=request.user_id,
             commodity_id=request.commodity_id,
             market_id=request.market_id,
@@ -144,13 +139,11 @@ async def add_to_watchlist(
 async def update_watchlist_entry(
     watchlist_id: int,
     request: WatchlistUpdate,
-    repo: WatchlistRepository = Depends(get_watchlist_repo),
-    commodity_repo: CommodityRepository = Depends(get_commodity_repo),
-    market_repo: MarketRepository = Depends(get_market_repo),
+    repos: Repos = Depends(get_repos),
 ) -> WatchlistResponse:
 
     try:
-        watchlist_item = await repo.get_by_id(watchlist_id)
+        watchlist_item = await repos.watchlist.get_by_id(watchlist_id)
         if not watchlist_item:
             raise HTTPException(status_code=404, detail="Watchlist entry not found")
         
@@ -162,10 +155,10 @@ async def update_watchlist_entry(
             watchlist_item.price_change_threshold = request.price_change_threshold
         
         watchlist_item.updated_at = get_current_timestamp()
-        await repo.db.flush()
+        await repos.watchlist.db.flush()
         
-        commodity = await commodity_repo.get_by_id(watchlist_item.commodity_id)
-        market = await market_repo.get_by_id(watchlist_item.market_id) if watchlist_item.market_id else None
+        commodity = await repos.commodity.get_by_id(watchlist_item.commodity_id)
+        market = await repos.market.get_by_id(watchlist_item.market_id) if watchlist_item.market_id else None
         
         logger.info(f"Updated watchlist entry: {watchlist_id}")
         
@@ -41,8 +41,12 @@ class Settings(BaseSettings):
     
     database_url: str = "sqlite+aiosqlite:///./data/agritech.db"
     db_echo: bool = False
-    db_pool_size: int = 5
+    db_pool_size: int = 20
     db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_query_cache_size: int = 2000
+    db_insert_page_size: int = 10000
     
     redis_host: str = "localhost"
     redis_port: int = 6379
@@ -67,12 +71,15 @@ class Settings(BaseSettings):
         "random_forest": 0.30
     }
     model_retrain_interval_days: int = 7
+    model_refresh_min_interval_seconds: float = 5.0
     
     scrape_timeout: int = 30
     scrape_retry_attempts: int = 3
     scrape_retry_delay: int = 5
     scrape_rate_limit: int = 10
+    scrape_max_workers: int = 8
     scrape_user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    scrape_http_cache_path: str = "data/.http_cache.sqlite"
     agmarknet_base_url: str = "https://agmarknet.gov.in"
     
     data_raw_dir: str = "data/raw"
@@ -95,6 +102,9 @@ class Settings(BaseSettings):
     
     prediction_confidence_threshold: float = 0.7
     prediction_timeout_seconds: int = 10
+    prediction_max_workers: int = 4
+    ensemble_max_workers: int = 8
+    forecast_batch_max_requests: int = 32
     
     @field_validator("cors_origins", mode="before")
     @classmethod
@@ -0,0 +1,251 @@
+
+import asyncio
+import hashlib
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+from fastapi.responses import Response
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.responses import ORJSONResponse
+
+try:
+    from redis import asyncio as redis_asyncio
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+_REDIS_RETRY_SECONDS = 30.0
+
+_client = None
+_unavailable_until = 0.0
+
+_local: dict[str, tuple[float, Any]] = {}
+
+# Bumped by every invalidation; a fill that started under an older generation
+# read pre-commit data and is returned without being cached
+_generations: dict[str, int] = {}
+
+_listener: Optional[asyncio.Task] = None
+_pending: set[asyncio.Task] = set()
+
+# Reference lists, dropped after commit whenever a row is added
+COMMODITIES_CACHE_KEY = "ref:commodities"
+MARKETS_CACHE_KEY = "ref:markets"
+
+# Invalidated keys are published here so every worker drops its local entry
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Session.info entry holding the keys to invalidate once the session commits
+_SESSION_KEYS = "cache_invalidate_keys"
+
+def get_redis():
+
+    global _client
+
+    if not settings.cache_enabled or not HAS_REDIS:
+        return None
+    if time.monotonic() < _unavailable_until:
+        return None
+
+    if _client is None:
+        _client = redis_asyncio.Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    return _client
+
+def _mark_unavailable(exc: Exception) -> None:
+
+    global _unavailable_until
+
+    _unavailable_until = time.monotonic() + _REDIS_RETRY_SECONDS
+    logger.warning(f"Redis cache unavailable, bypassing for {_REDIS_RETRY_SECONDS:.0f}s: {exc}")
+
+async def cache_get(key: str) -> Optional[Any]:
+
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        raw = await client.get(key)
+    except Exception as exc:
+        _mark_unavailable(exc)
+        return None
+
+    return orjson.loads(raw) if raw is not None else None
+
+async def cache_set(key: str, value: Any, ttl: Optional[int] = None) -> None:
+
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        await client.setex(key, ttl or settings.cache_ttl_seconds, orjson.dumps(value, default=str))
+    except Exception as exc:
+        _mark_unavailable(exc)
+
+def _drop_local(keys) -> None:
+
+    for key in keys:
+        _local.pop(key, None)
+        _generations[key] = _generations.get(key, 0) + 1
+
+async def invalidate(*keys: str) -> None:
+
+    _drop_local(keys)
+
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        await client.delete(*keys)
+        await client.publish(INVALIDATION_CHANNEL, orjson.dumps(keys))
+    except Exception as exc:
+        _mark_unavailable(exc)
+
+def invalidate_after_commit(session, *keys: str) -> None:
+
+    # Invalidating before the commit lets a concurrent read cache the old rows
+    # again; the keys wait on the session until the transaction lands
+    session.info.setdefault(_SESSION_KEYS, set()).update(keys)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session) -> None:
+
+    keys = session.info.pop(_SESSION_KEYS, None)
+    if not keys:
+        return
+
+    _drop_local(keys)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(invalidate(*keys))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session) -> None:
+
+    session.info.pop(_SESSION_KEYS, None)
+
+async def _listen_for_invalidations() -> None:
+
+    while True:
+        client = get_redis()
+        if client is None:
+            await asyncio.sleep(_REDIS_RETRY_SECONDS)
+            continue
+
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            # Messages sent while this worker was not subscribed are lost
+            _local.clear()
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is not None:
+                    _drop_local(orjson.loads(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            _mark_unavailable(exc)
+        finally:
+            await pubsub.aclose()
+
+def start_invalidation_listener() -> None:
+
+    global _listener
+
+    if settings.cache_enabled and HAS_REDIS and _listener is None:
+        _listener = asyncio.get_running_loop().create_task(_listen_for_invalidations())
+
+def _json_response(rendered: tuple[bytes, str], expiry: float, request) -> Response:
+
+    body, etag = rendered
+    max_age = max(int(expiry - time.monotonic()), 0)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    if request is not None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _render(content: Any) -> tuple[bytes, str]:
+
+    body = ORJSONResponse(content=content).body
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+# With as_json the local entry holds the rendered body and its ETag, so a hit
+# skips response_model validation, encoding and serialization entirely, and
+# a client holding the same ETag (passed in as the endpoint's request) gets a 304
+def cached(key: str, ttl: Optional[int] = None, as_json: bool = False):
+
+    def decorator(func: Callable[..., Awaitable[Any]]):
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+
+            if not settings.cache_enabled:
+                return await func(*args, **kwargs)
+
+            expiry = ttl or settings.cache_ttl_seconds
+            entry = _local.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                if as_json:
+                    return _json_response(entry[1], entry[0], kwargs.get("request"))
+                return entry[1]
+
+            generation = _generations.get(key, 0)
+            hit = await cache_get(key)
+            if hit is None:
+                hit = await func(*args, **kwargs)
+                # Invalidated while loading: serve the result without caching it
+                if _generations.get(key, 0) != generation:
+                    if as_json:
+                        return _json_response(_render(hit), 0.0, kwargs.get("request"))
+                    return hit
+                await cache_set(key, hit, ttl)
+
+            if as_json:
+                rendered = _render(hit)
+                expires = time.monotonic() + expiry
+                _local[key] = (expires, rendered)
+                return _json_response(rendered, expires, kwargs.get("request"))
+
+            _local[key] = (time.monotonic() + expiry, hit)
+            return hit
+
+        return wrapper
+
+    return decorator
+
+def clear_local_cache() -> None:
+
+    _local.clear()
+
+async def close_cache() -> None:
+
+    global _client, _listener
+
+    if _listener is not None:
+        _listener.cancel()
+        try:
+            await _listener
+        except asyncio.CancelledError:
+            pass
+        _listener = None
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -8,8 +8,24 @@ class FestivalCalendar:
     def __init__(self):
         self.festivals = self._initialize_festivals()
         self.market_events = self._initialize_market_events()
+        self._festival_days = self._build_festival_days()
         logger.info("Festival calendar ready with Indian holidays and agricultural events")
 
+    def __setstate__(self, state: Dict) -> None:
+        
+        # Calendars pickled inside older preprocessor artifacts predate the lookup set
+        self.__dict__.update(state)
+        if "_festival_days" not in state:
+            self._festival_days = self._build_festival_days()
+
+    def _build_festival_days(self) -> frozenset:
+        
+        return frozenset(
+            (event_month, event_day)
+            for events in self.festivals.values()
+            for event_month, event_day, _ in events
+        )
+
     def _initialize_festivals(self) -> Dict[str, List[Tuple[int, int, str]]]:
         
         return {
@@ -69,13 +85,7 @@ class FestivalCalendar:
 
     def is_festival_day(self, date: datetime) -> bool:
         
-        month, day = date.month, date.day
-        
-        for category, events in self.festivals.items():
-            for event_month, event_day, _ in events:
-                if month == event_month and day == event_day:
-                    return True
-        return False
+        return (date.month, date.day) in self._festival_days
 
     def is_harvest_season(self, date: datetime) -> bool:
         
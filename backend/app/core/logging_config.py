@@ -8,6 +8,10 @@ from loguru import logger
 
 from app.config import settings
 
+# Refreshed by setup_logging(); lets per-request logging skip building records
+# that every sink would drop
+INFO_ENABLED = True
+
 class InterceptHandler(logging.Handler):
 
     def emit(self, record: logging.LogRecord) -> None:
@@ -65,7 +69,10 @@ def format_record(record: dict[str, Any]) -> str:
 
 def setup_logging() -> None:
 
+    global INFO_ENABLED
+
     logger.remove()
+    INFO_ENABLED = logger.level(settings.log_level.upper()).no <= logger.level("INFO").no
 
     log_path = Path(settings.log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
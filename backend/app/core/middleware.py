@@ -0,0 +1,42 @@
+import time
+
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.core import logging_config
+
+class TimingMiddleware:
+
+    def __init__(self, app: ASGIApp):
+
+        self.app = app
+        self.version_header = (b"x-api-version", settings.app_version.encode())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", f"{process_time:.3f}".encode()))
+                headers.append(self.version_header)
+                message["headers"] = headers
+
+                if logging_config.INFO_ENABLED:
+                    # Arguments are formatted by loguru only once a sink accepts the record
+                    logger.info(
+                        "{} {} completed in {:.3f}s with status {}",
+                        scope["method"], scope["path"], process_time, message["status"],
+                    )
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,15 +1,28 @@
 
 import hashlib
-import json
-from datetime import datetime, timedelta
-from typing import Any, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+from functools import lru_cache
 from pathlib import Path
 
-import pytz
+import numpy as np
+import orjson
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
 
 def get_current_timestamp() -> datetime:
 
-    return datetime.now(pytz.UTC)
+    return datetime.now(timezone.utc)
 
 def format_timestamp(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
 
@@ -19,6 +32,10 @@ def parse_timestamp(date_str: str, format_str: str = "%Y-%m-%d") -> datetime:
 
     return datetime.strptime(date_str, format_str)
 
+def parse_date(date_str: str) -> date:
+
+    return date.fromisoformat(date_str)
+
 def days_ago(days: int) -> datetime:
 
     return get_current_timestamp() - timedelta(days=days)
@@ -29,7 +46,7 @@ def days_ahead(days: int) -> datetime:
 
 def generate_hash(data: str) -> str:
 
-    return hashlib.sha256(data.encode()).hexdigest()
+    return hashlib.blake2b(data.encode(), digest_size=32).hexdigest()
 
 def safe_division(numerator: float, denominator: float, default: float = 0.0) -> float:
 
@@ -53,14 +70,40 @@ def ensure_dir(path: str | Path) -> Path:
 
 def load_json(file_path: str | Path) -> dict[str, Any]:
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(file_path, "rb") as f:
+        return orjson.loads(f.read())
 
 def save_json(data: dict[str, Any], file_path: str | Path, indent: int = 2) -> None:
 
     ensure_dir(Path(file_path).parent)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, default=str)
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    with open(file_path, "wb") as f:
+        f.write(orjson.dumps(data, default=str, option=option))
+
+def save_json_records(
+    records: Iterable[dict[str, Any]],
+    file_path: str | Path,
+    chunk_size: int = 1000,
+) -> int:
+
+    ensure_dir(Path(file_path).parent)
+    count = 0
+    chunk = []
+    with open(file_path, "wb", buffering=1 << 20) as f:
+        f.write(b"[")
+        for record in records:
+            chunk.append(orjson.dumps(record, default=str, option=orjson.OPT_SERIALIZE_NUMPY))
+            if len(chunk) >= chunk_size:
+                f.write((b",\n" if count else b"") + b",\n".join(chunk))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            f.write((b",\n" if count else b"") + b",\n".join(chunk))
+            count += len(chunk)
+        f.write(b"]")
+    return count
 
 def truncate_string(text: str, max_length: int = 100, suffix: str = "...") -> str:
 
@@ -68,15 +111,18 @@ def truncate_string(text: str, max_length: int = 100, suffix: str = "...") -> st
         return text
     return text[: max_length - len(suffix)] + suffix
 
+@lru_cache(maxsize=32)
+def _z_score(confidence: float) -> float:
+
+    from scipy import stats
+
+    return float(stats.norm.ppf((1 + confidence) / 2))
+
 def calculate_confidence_interval(
     mean: float, std: float, confidence: float = 0.95
 ) -> tuple[float, float]:
 
-    import numpy as np
-    from scipy import stats
-
-    z_score = stats.norm.ppf((1 + confidence) / 2)
-    margin = z_score * std
+    margin = _z_score(confidence) * std
 
     return (mean - margin, mean + margin)
 
@@ -103,30 +149,84 @@ def is_holiday(date: datetime, holidays: Optional[list[datetime]] = None) -> boo
         return False
     return date.date() in [h.date() for h in holidays]
 
-def calculate_moving_average(values: list[float], window: int = 7) -> list[float]:
+def _rolling_mean_kernel(values: np.ndarray, window: int) -> np.ndarray:
 
-    import numpy as np
+    n = values.shape[0] - window + 1
+    out = np.empty(n)
+    acc = 0.0
+    for i in range(window):
+        acc += values[i]
+    out[0] = acc / window
+    for i in range(1, n):
+        acc += values[i + window - 1] - values[i - 1]
+        out[i] = acc / window
+    return out
+
+def _iqr_outlier_mask_kernel(values: np.ndarray) -> np.ndarray:
+
+    q1 = np.percentile(values, 25)
+    q3 = np.percentile(values, 75)
+    iqr = q3 - q1
+
+    lower_bound = q1 - 1.5 * iqr
+    upper_bound = q3 + 1.5 * iqr
+
+    mask = np.empty(values.shape[0], dtype=np.bool_)
+    for i in range(values.shape[0]):
+        mask[i] = values[i] < lower_bound or values[i] > upper_bound
+    return mask
+
+def _synthetic_demand_kernel(base: int, seed: int, days: int) -> np.ndarray:
+
+    out = np.empty((days, 2), dtype=np.int64)
+    for i in range(days):
+        actual = int(base * (0.9 + ((seed + i * 7) % 20) / 100))
+        out[i, 0] = actual
+        out[i, 1] = int(actual * 1.05)
+    return out
+
+if HAS_NUMBA:
+    _rolling_mean_kernel = njit(cache=True, nogil=True)(_rolling_mean_kernel)
+    _iqr_outlier_mask_kernel = njit(cache=True, nogil=True)(_iqr_outlier_mask_kernel)
+    _synthetic_demand_kernel = njit(cache=True, nogil=True)(_synthetic_demand_kernel)
+
+def calculate_moving_average(values: list[float], window: int = 7) -> list[float]:
 
     if len(values) < window:
         return values
 
-    return list(np.convolve(values, np.ones(window) / window, mode="valid"))
+    arr = np.asarray(values, dtype=np.float64)
+    if HAS_NUMBA:
+        return _rolling_mean_kernel(arr, window).tolist()
 
-def detect_outliers_iqr(values: list[float]) -> list[int]:
+    sums = np.cumsum(arr)
+    sums[window:] = sums[window:] - sums[:-window]
+    return (sums[window - 1:] / window).tolist()
 
-    import numpy as np
+def detect_outliers_iqr(values: list[float]) -> list[int]:
 
     if len(values) < 4:
         return []
 
-    q1 = np.percentile(values, 25)
-    q3 = np.percentile(values, 75)
-    iqr = q3 - q1
+    arr = np.asarray(values, dtype=np.float64)
+    if HAS_NUMBA:
+        mask = _iqr_outlier_mask_kernel(arr)
+    else:
+        q1, q3 = np.percentile(arr, [25, 75])
+        iqr = q3 - q1
+        mask = (arr < q1 - 1.5 * iqr) | (arr > q3 + 1.5 * iqr)
 
-    lower_bound = q1 - 1.5 * iqr
-    upper_bound = q3 + 1.5 * iqr
+    return np.flatnonzero(mask).tolist()
+
+def synthetic_demand(base: int, seed: int, days: int) -> np.ndarray:
+
+    # (days, 2) array of (actual, forecast) demand for the no-history fallback
+    if HAS_NUMBA:
+        return _synthetic_demand_kernel(base, seed, days)
 
-    return [i for i, v in enumerate(values) if v < lower_bound or v > upper_bound]
+    variation = 0.9 + ((seed + np.arange(days) * 7) % 20) / 100
+    actual = (base * variation).astype(np.int64)
+    return np.column_stack((actual, (actual * 1.05).astype(np.int64)))
 
 def normalize_text(text: str) -> str:
 
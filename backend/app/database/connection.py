@@ -1,5 +1,5 @@
 
-from typing import Generator, AsyncGenerator, Optional
+from typing import Awaitable, Callable, Generator, AsyncGenerator, Optional, TypeVar
 
 from loguru import logger
 from sqlalchemy import create_engine, event, text
@@ -9,6 +9,7 @@ from sqlalchemy.pool import NullPool, QueuePool
 
 from app.config import settings
 from app.database.models import Base
+from app.database import models_discussion_comments  # noqa: F401  (registers discussion_comments on Base)
 
 async_engine = None
 async_session_factory = None
@@ -16,6 +17,8 @@ async_session_factory = None
 sync_engine = None
 sync_session_factory = None
 
+T = TypeVar("T")
+
 def get_sync_db_url() -> str:
 
     url = settings.database_url
@@ -33,12 +36,31 @@ async def init_async_db() -> None:
     
     logger.info(f"Initializing async database: {settings.database_url}")
     
-    async_engine = create_async_engine(
-        settings.database_url,
-        echo=settings.db_echo,
-        pool_pre_ping=True,
-        connect_args={"timeout": 30},
-    )
+    engine_kwargs = {
+        "echo": settings.db_echo,
+        "pool_pre_ping": True,
+        "query_cache_size": settings.db_query_cache_size,
+        "insertmanyvalues_page_size": settings.db_insert_page_size,
+    }
+    
+    if "sqlite" in settings.database_url:
+        engine_kwargs["connect_args"] = {"timeout": 30}
+    else:
+        engine_kwargs.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+        if "asyncpg" in settings.database_url:
+            engine_kwargs["connect_args"] = {
+                "timeout": 30,
+                "statement_cache_size": 1024,
+                # now() defaults land in naive timestamp columns; keep them UTC
+                "server_settings": {"jit": "off", "timezone": "UTC"},
+            }
+    
+    async_engine = create_async_engine(settings.database_url, **engine_kwargs)
     
     async_session_factory = async_sessionmaker(
         async_engine,
@@ -70,12 +92,20 @@ def init_sync_db() -> None:
             poolclass=NullPool,
         )
     else:
+        sync_kwargs = {}
+        if db_url.startswith("postgresql://") or "psycopg2" in db_url:
+            sync_kwargs["executemany_mode"] = "values_plus_batch"
+            sync_kwargs["connect_args"] = {"options": "-c timezone=UTC"}
         sync_engine = create_engine(
             db_url,
             echo=settings.db_echo,
             pool_size=settings.db_pool_size,
             max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
             pool_pre_ping=True,
+            insertmanyvalues_page_size=settings.db_insert_page_size,
+            **sync_kwargs,
         )
     
     sync_session_factory = sessionmaker(
@@ -108,6 +138,16 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+# An AsyncSession does not allow concurrent operations, so reads that are
+# awaited alongside the request session's queries get a session of their own
+async def run_with_session(operation: Callable[[AsyncSession], Awaitable[T]]) -> T:
+
+    if async_session_factory is None:
+        await init_async_db()
+
+    async with async_session_factory() as session:
+        return await operation(session)
+
 def get_sync_session() -> Generator[Session, None, None]:
 
     if sync_session_factory is None:
@@ -140,8 +180,3 @@ def close_sync_db() -> None:
         logger.info("Closing sync database connections...")
         sync_engine.dispose()
         logger.info("Sync database connections closed")
-
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-
-    async for session in get_async_session():
-        yield session
@@ -11,6 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from app.config import settings
 from app.database.models import Base
+from app.database import models_discussion_comments  # noqa: F401
 
 config = context.config
 
@@ -0,0 +1,45 @@
+"""market price covering index
+
+Revision ID: 008_mp_covering_index
+Revises: 007_add_farmer_profit
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_mp_covering_index'
+down_revision = '007_add_farmer_profit'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Replace the plain composite with a covering index so chart queries can
+    # be answered from the index alone (INCLUDE is ignored outside PostgreSQL)
+    op.drop_index('ix_market_price_commodity_market_date', table_name='market_prices')
+    op.create_index(
+        'ix_mp_cmd', 'market_prices', ['commodity_id', 'market_id', 'date'],
+        postgresql_include=['price', 'modal_price', 'min_price', 'max_price', 'arrival'],
+    )
+
+    # Cross-market scans filter on date first; the two single-column date
+    # indexes are subsumed by this one
+    op.create_index('ix_mp_date_commodity', 'market_prices', ['date', 'commodity_id'])
+    op.drop_index('ix_market_price_date', table_name='market_prices')
+    op.drop_index('ix_market_prices_date', table_name='market_prices')
+
+    op.execute(sa.text('ANALYZE market_prices'))
+
+
+def downgrade():
+    op.create_index('ix_market_prices_date', 'market_prices', ['date'])
+    op.create_index('ix_market_price_date', 'market_prices', ['date'])
+    op.drop_index('ix_mp_date_commodity', table_name='market_prices')
+
+    op.drop_index('ix_mp_cmd', table_name='market_prices')
+    op.create_index(
+        'ix_market_price_commodity_market_date', 'market_prices',
+        ['commodity_id', 'market_id', 'date'],
+    )
@@ -0,0 +1,54 @@
+"""discussion sortable datetime
+
+Revision ID: 010_sortable_datetime
+Revises: 008_mp_covering_index
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_sortable_datetime'
+down_revision = '008_mp_covering_index'
+branch_labels = None
+depends_on = None
+
+TABLES = {
+    'discussions': 'ix_disc_sortable_brin',
+    'comments': 'ix_comment_sortable_brin',
+}
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    # SQLite can only add VIRTUAL generated columns to an existing table
+    persisted = bind.dialect.name != 'sqlite'
+
+    for table, index_name in TABLES.items():
+        # Discussion tables are created by create_all on older deployments
+        if not inspector.has_table(table):
+            continue
+
+        op.add_column(table, sa.Column(
+            'sortable_datetime', sa.DateTime(),
+            sa.Computed('COALESCE(updated_at, created_at)', persisted=persisted),
+        ))
+        op.create_index(
+            index_name, table, ['sortable_datetime'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    for table, index_name in TABLES.items():
+        if not inspector.has_table(table):
+            continue
+
+        op.drop_index(index_name, table_name=table)
+        op.drop_column(table, 'sortable_datetime')
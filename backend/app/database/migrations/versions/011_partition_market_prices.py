@@ -0,0 +1,135 @@
+"""partition market prices by month
+
+Revision ID: 011_partition_market_prices
+Revises: 010_sortable_datetime
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from datetime import date
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011_partition_market_prices'
+down_revision = '010_sortable_datetime'
+branch_labels = None
+depends_on = None
+
+# Monthly partitions are pre-created this far past the current month; rows
+# beyond that land in market_prices_default until new partitions are added
+MONTHS_AHEAD = 24
+
+COLUMNS = (
+    'id, commodity_id, market_id, date, min_price, max_price, modal_price, '
+    'price, arrival, created_at, updated_at'
+)
+
+
+def _add_months(value, months):
+    month = value.month - 1 + months
+    return date(value.year + month // 12, month % 12 + 1, 1)
+
+
+def _columns(id_default):
+    return [
+        sa.Column('id', sa.Integer(), server_default=id_default, nullable=False),
+        sa.Column('commodity_id', sa.Integer(), nullable=False),
+        sa.Column('market_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('min_price', sa.Float(), nullable=True),
+        sa.Column('max_price', sa.Float(), nullable=True),
+        sa.Column('modal_price', sa.Float(), nullable=True),
+        sa.Column('price', sa.Float(), nullable=False),
+        sa.Column('arrival', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['commodity_id'], ['commodities.id'], ),
+        sa.ForeignKeyConstraint(['market_id'], ['markets.id'], ),
+    ]
+
+
+def _create_indexes():
+    op.create_index(
+        'ix_mp_cmd', 'market_prices', ['commodity_id', 'market_id', 'date'],
+        postgresql_include=['price', 'modal_price', 'min_price', 'max_price', 'arrival'],
+    )
+    op.create_index('ix_mp_date_commodity', 'market_prices', ['date', 'commodity_id'])
+    op.create_index('ix_market_prices_created_at', 'market_prices', ['created_at'])
+    op.create_index('ix_market_prices_id', 'market_prices', ['id'])
+
+
+def _detach_legacy_table():
+    # Free the constraint and index names (they are schema-wide in PostgreSQL)
+    # and keep the id sequence alive once the old table is dropped
+    op.execute('ALTER SEQUENCE market_prices_id_seq OWNED BY NONE')
+    op.rename_table('market_prices', 'market_prices_legacy')
+    op.drop_constraint('uq_market_price', 'market_prices_legacy', type_='unique')
+    op.execute('ALTER TABLE market_prices_legacy DROP CONSTRAINT market_prices_pkey')
+    for index_name in ('ix_mp_cmd', 'ix_mp_date_commodity', 'ix_market_prices_created_at', 'ix_market_prices_id'):
+        op.drop_index(index_name, table_name='market_prices_legacy')
+
+
+def _move_legacy_rows():
+    op.execute(f'INSERT INTO market_prices ({COLUMNS}) SELECT {COLUMNS} FROM market_prices_legacy')
+    op.drop_table('market_prices_legacy')
+    op.execute('ALTER SEQUENCE market_prices_id_seq OWNED BY market_prices.id')
+    op.execute(
+        "SELECT setval('market_prices_id_seq', COALESCE((SELECT MAX(id) FROM market_prices), 0) + 1, false)"
+    )
+
+
+def upgrade():
+    bind = op.get_bind()
+    # Declarative partitioning is PostgreSQL-only; SQLite keeps the plain table
+    if bind.dialect.name != 'postgresql':
+        return
+
+    first = None
+    if not context.is_offline_mode():
+        first = bind.execute(sa.text('SELECT MIN(date) FROM market_prices')).scalar()
+
+    _detach_legacy_table()
+
+    # The partition key must be part of every unique constraint, so the
+    # primary key becomes (id, date); ids still come from the same sequence
+    op.create_table('market_prices',
+        *_columns(sa.text("nextval('market_prices_id_seq'::regclass)")),
+        sa.PrimaryKeyConstraint('id', 'date'),
+        sa.UniqueConstraint('commodity_id', 'market_id', 'date', name='uq_market_price'),
+        postgresql_partition_by='RANGE (date)',
+    )
+
+    start = (first or date.today()).replace(day=1)
+    end = _add_months(date.today(), MONTHS_AHEAD + 1)
+    while start < end:
+        upper = _add_months(start, 1)
+        op.execute(
+            f"CREATE TABLE market_prices_{start:%Y_%m} PARTITION OF market_prices "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        start = upper
+    op.execute('CREATE TABLE market_prices_default PARTITION OF market_prices DEFAULT')
+
+    _create_indexes()
+    _move_legacy_rows()
+
+    op.execute(sa.text('ANALYZE market_prices'))
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    _detach_legacy_table()
+
+    op.create_table('market_prices',
+        *_columns(sa.text("nextval('market_prices_id_seq'::regclass)")),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('commodity_id', 'market_id', 'date', name='uq_market_price'),
+    )
+
+    _create_indexes()
+    # Dropping the partitioned parent drops its partitions with it
+    _move_legacy_rows()
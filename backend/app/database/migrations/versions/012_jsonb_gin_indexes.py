@@ -0,0 +1,64 @@
+"""jsonb documents with gin indexes
+
+Revision ID: 012_jsonb_gin_indexes
+Revises: 011_partition_market_prices
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision = '012_jsonb_gin_indexes'
+down_revision = '011_partition_market_prices'
+branch_labels = None
+depends_on = None
+
+DOCUMENTS = (
+    ('alerts', 'conditions', 'ix_alert_conditions_gin'),
+    ('recommendations', 'factors', 'ix_recommendation_factors_gin'),
+    ('discussions', 'tags', 'ix_discussion_tags_gin'),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    # SQLite keeps storing these as JSON text
+    if bind.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(bind)
+    for table, column, index_name in DOCUMENTS:
+        if not inspector.has_table(table):
+            continue
+
+        op.alter_column(
+            table, column,
+            type_=JSONB(),
+            postgresql_using=f'{column}::jsonb',
+        )
+        op.create_index(
+            index_name, table, [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(bind)
+    for table, column, index_name in DOCUMENTS:
+        if not inspector.has_table(table):
+            continue
+
+        op.drop_index(index_name, table_name=table)
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            postgresql_using=f'{column}::json',
+        )
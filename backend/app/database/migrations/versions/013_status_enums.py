@@ -0,0 +1,80 @@
+"""native enums for status columns
+
+Revision ID: 013_status_enums
+Revises: 012_jsonb_gin_indexes
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '013_status_enums'
+down_revision = '012_jsonb_gin_indexes'
+branch_labels = None
+depends_on = None
+
+ENUMS = {
+    'alert_type': (
+        'PRICE_THRESHOLD', 'INVENTORY_LOW', 'INVENTORY_OVERSTOCK', 'PRICE_VOLATILITY',
+        'TREND_CHANGE', 'EXPIRY_WARNING', 'BUY_SELL',
+    ),
+    'alert_priority': ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL'),
+    'alert_status': ('ACTIVE', 'INACTIVE', 'RESOLVED', 'DISMISSED'),
+    'recommendation_type': ('BUY', 'SELL', 'HOLD', 'STOCK_UP', 'STOCK_DOWN'),
+    'discussion_status': ('PUBLISHED', 'ARCHIVED'),
+    'trend_direction': ('INCREASING', 'DECREASING', 'STABLE'),
+}
+
+# (table, column, enum name, original VARCHAR length)
+COLUMNS = (
+    ('alerts', 'alert_type', 'alert_type', 50),
+    ('alerts', 'priority', 'alert_priority', 20),
+    ('alerts', 'status', 'alert_status', 20),
+    ('recommendations', 'recommendation_type', 'recommendation_type', 20),
+    ('discussions', 'status', 'discussion_status', 20),
+    ('market_trend_analysis', 'trend_direction', 'trend_direction', 20),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    # Other dialects keep VARCHAR; the ORM Enum type maps to it transparently
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for name, values in ENUMS.items():
+        postgresql.ENUM(*values, name=name).create(bind, checkfirst=True)
+
+    inspector = sa.inspect(bind)
+    for table, column, enum_name, _ in COLUMNS:
+        if not inspector.has_table(table):
+            continue
+
+        op.alter_column(
+            table, column,
+            type_=postgresql.ENUM(name=enum_name, create_type=False),
+            postgresql_using=f'{column}::{enum_name}',
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(bind)
+    for table, column, enum_name, length in COLUMNS:
+        if not inspector.has_table(table):
+            continue
+
+        op.alter_column(
+            table, column,
+            type_=sa.String(length=length),
+            postgresql_using=f'{column}::text',
+        )
+
+    for name in ENUMS:
+        postgresql.ENUM(name=name).drop(bind, checkfirst=True)
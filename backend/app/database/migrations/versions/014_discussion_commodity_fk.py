@@ -0,0 +1,58 @@
+"""discussion commodity and market foreign keys
+
+Revision ID: 014_discussion_commodity_fk
+Revises: 013_status_enums
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014_discussion_commodity_fk'
+down_revision = '013_status_enums'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not sa.inspect(op.get_bind()).has_table('discussions'):
+        return
+
+    op.add_column('discussions', sa.Column('commodity_id', sa.Integer(), nullable=True))
+    op.add_column('discussions', sa.Column('market_id', sa.Integer(), nullable=True))
+    # SQLite cannot ALTER in constraints (and does not enforce them by default)
+    if op.get_bind().dialect.name != 'sqlite':
+        op.create_foreign_key('fk_discussions_commodity_id', 'discussions', 'commodities', ['commodity_id'], ['id'])
+        op.create_foreign_key('fk_discussions_market_id', 'discussions', 'markets', ['market_id'], ['id'])
+
+    # Backfill from the display names; unmatched free-text names stay NULL
+    op.execute(
+        "UPDATE discussions SET commodity_id = "
+        "(SELECT c.id FROM commodities c WHERE lower(c.name) = lower(discussions.commodity) LIMIT 1)"
+    )
+    op.execute(
+        "UPDATE discussions SET market_id = "
+        "(SELECT m.id FROM markets m WHERE lower(m.name) = lower(discussions.market) LIMIT 1) "
+        "WHERE market IS NOT NULL"
+    )
+
+    op.create_index('ix_discussions_commodity_id', 'discussions', ['commodity_id'])
+    op.drop_index('ix_discussion_commodity_created', table_name='discussions')
+    op.create_index('ix_discussion_commodity_created', 'discussions', ['commodity_id', 'created_at'])
+
+
+def downgrade():
+    if not sa.inspect(op.get_bind()).has_table('discussions'):
+        return
+
+    op.drop_index('ix_discussion_commodity_created', table_name='discussions')
+    op.create_index('ix_discussion_commodity_created', 'discussions', ['commodity', 'created_at'])
+    op.drop_index('ix_discussions_commodity_id', table_name='discussions')
+
+    if op.get_bind().dialect.name != 'sqlite':
+        op.drop_constraint('fk_discussions_market_id', 'discussions', type_='foreignkey')
+        op.drop_constraint('fk_discussions_commodity_id', 'discussions', type_='foreignkey')
+    op.drop_column('discussions', 'market_id')
+    op.drop_column('discussions', 'commodity_id')
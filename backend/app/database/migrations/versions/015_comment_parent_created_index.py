@@ -0,0 +1,33 @@
+"""comment parent created index
+
+Revision ID: 015_comment_parent_created
+Revises: 014_discussion_commodity_fk
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015_comment_parent_created'
+down_revision = '014_discussion_commodity_fk'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not sa.inspect(op.get_bind()).has_table('discussion_comments'):
+        return
+
+    # Serves the selectin load of replies: WHERE parent_comment_id IN (...) ORDER BY created_at
+    op.drop_index('ix_comment_parent', table_name='discussion_comments')
+    op.create_index('ix_comment_parent_created', 'discussion_comments', ['parent_comment_id', 'created_at'])
+
+
+def downgrade():
+    if not sa.inspect(op.get_bind()).has_table('discussion_comments'):
+        return
+
+    op.drop_index('ix_comment_parent_created', table_name='discussion_comments')
+    op.create_index('ix_comment_parent', 'discussion_comments', ['parent_comment_id'])
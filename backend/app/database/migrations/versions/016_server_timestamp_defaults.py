@@ -0,0 +1,90 @@
+"""server side timestamp defaults
+
+Revision ID: 016_server_timestamp_defaults
+Revises: 015_comment_parent_created
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016_server_timestamp_defaults'
+down_revision = '015_comment_parent_created'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = {
+    'commodities': ('created_at', 'updated_at'),
+    'markets': ('created_at', 'updated_at'),
+    'prediction_metrics': ('created_at', 'updated_at'),
+    'alerts': ('created_at', 'updated_at'),
+    'discussions': ('created_at', 'updated_at'),
+    'inventory': ('created_at', 'updated_at'),
+    'market_prices': ('created_at', 'updated_at'),
+    'market_trend_analysis': ('created_at',),
+    'predictions': ('created_at',),
+    'price_volatility': ('calculated_at',),
+    'recommendations': ('created_at', 'updated_at'),
+    'seasonal_price_patterns': ('created_at', 'updated_at'),
+    'storage_costs': ('created_at', 'updated_at'),
+    'watchlists': ('created_at', 'updated_at'),
+    'comments': ('created_at', 'updated_at'),
+    'discussion_comments': ('created_at', 'updated_at'),
+    'discussion_likes': ('created_at',),
+}
+
+# Generated columns from 010; SQLite batch copies cannot insert into them, so
+# they are dropped around the table rebuild and added back afterwards
+SORTABLE_INDEXES = {
+    'discussions': 'ix_disc_sortable_brin',
+    'comments': 'ix_comment_sortable_brin',
+}
+
+
+def _set_defaults(default):
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if not inspector.has_table(table):
+            continue
+
+        if bind.dialect.name != 'sqlite':
+            for column in columns:
+                op.alter_column(table, column, server_default=default)
+            continue
+
+        # SQLite cannot ALTER a column default; rebuild the table instead
+        sortable = table in SORTABLE_INDEXES and any(
+            c['name'] == 'sortable_datetime' for c in inspector.get_columns(table)
+        )
+        if sortable:
+            op.drop_index(SORTABLE_INDEXES[table], table_name=table)
+            op.drop_column(table, 'sortable_datetime')
+
+        with op.batch_alter_table(table, recreate='always') as batch_op:
+            for column in columns:
+                batch_op.alter_column(column, existing_type=sa.DateTime(), server_default=default)
+            # Added while the table is rebuilt, the only time SQLite accepts a
+            # STORED generated column, so the schema matches the models
+            if sortable:
+                batch_op.add_column(sa.Column(
+                    'sortable_datetime', sa.DateTime(),
+                    sa.Computed('COALESCE(updated_at, created_at)', persisted=True),
+                ))
+
+        if sortable:
+            op.create_index(SORTABLE_INDEXES[table], table, ['sortable_datetime'])
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        _set_defaults(sa.text('(CURRENT_TIMESTAMP)'))
+    else:
+        _set_defaults(sa.text('now()'))
+
+
+def downgrade():
+    _set_defaults(None)
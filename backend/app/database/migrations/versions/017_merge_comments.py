@@ -0,0 +1,123 @@
+"""merge comments into discussion_comments
+
+Revision ID: 017_merge_comments
+Revises: 016_server_timestamp_defaults
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '017_merge_comments'
+down_revision = '016_server_timestamp_defaults'
+branch_labels = None
+depends_on = None
+
+COPY_COLUMNS = 'id, discussion_id, author, author_id, avatar_url, content, likes_count, created_at, updated_at'
+
+
+def _sortable_column():
+    # SQLite can only add VIRTUAL generated columns after the fact
+    persisted = op.get_bind().dialect.name != 'sqlite'
+    return sa.Column(
+        'sortable_datetime', sa.DateTime(),
+        sa.Computed('COALESCE(updated_at, created_at)', persisted=persisted),
+    )
+
+
+def _create_sortable_index(table, index_name):
+    op.create_index(
+        index_name, table, ['sortable_datetime'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    # Discussion tables are created by create_all on older deployments
+    if not inspector.has_table('discussions'):
+        return
+
+    existed = inspector.has_table('discussion_comments')
+
+    if existed:
+        op.add_column('discussion_comments', sa.Column('author_id', sa.String(length=255), nullable=True))
+        op.add_column('discussion_comments', _sortable_column())
+    else:
+        op.create_table('discussion_comments',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('discussion_id', sa.Integer(), nullable=False),
+            sa.Column('parent_comment_id', sa.Integer(), nullable=True),
+            sa.Column('author', sa.String(length=255), nullable=False),
+            sa.Column('author_id', sa.String(length=255), nullable=True),
+            sa.Column('avatar_url', sa.String(length=500), nullable=True),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('likes_count', sa.Integer(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.Column(
+                'sortable_datetime', sa.DateTime(),
+                sa.Computed('COALESCE(updated_at, created_at)', persisted=True),
+            ),
+            sa.ForeignKeyConstraint(['discussion_id'], ['discussions.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['parent_comment_id'], ['discussion_comments.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_discussion_comments_id', 'discussion_comments', ['id'])
+        op.create_index('ix_discussion_comments_created_at', 'discussion_comments', ['created_at'])
+        op.create_index('ix_comment_discussion_created', 'discussion_comments', ['discussion_id', 'created_at'])
+        op.create_index('ix_comment_parent_created', 'discussion_comments', ['parent_comment_id', 'created_at'])
+
+    if inspector.has_table('comments'):
+        # Flat comments become top-level entries; ids are kept when the target
+        # table is fresh so existing links to a comment id stay valid
+        columns = COPY_COLUMNS.replace('id, ', '', 1) if existed else COPY_COLUMNS
+        select_columns = columns.replace('author,', "COALESCE(author, 'Anonymous'),").replace(
+            'likes_count', 'COALESCE(likes_count, 0)'
+        )
+        op.execute(f'INSERT INTO discussion_comments ({columns}) SELECT {select_columns} FROM comments')
+
+        op.drop_table('comments')
+
+        if op.get_bind().dialect.name == 'postgresql' and not existed:
+            op.execute(
+                "SELECT setval(pg_get_serial_sequence('discussion_comments', 'id'), "
+                "COALESCE((SELECT MAX(id) FROM discussion_comments), 0) + 1, false)"
+            )
+
+    _create_sortable_index('discussion_comments', 'ix_comment_sortable_brin')
+
+
+def downgrade():
+    if not sa.inspect(op.get_bind()).has_table('discussion_comments'):
+        return
+
+    op.create_table('comments',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('discussion_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('author', sa.String(length=255), nullable=True),
+        sa.Column('author_id', sa.String(length=255), nullable=True),
+        sa.Column('avatar_url', sa.String(length=512), nullable=True),
+        sa.Column('likes_count', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column(
+            'sortable_datetime', sa.DateTime(),
+            sa.Computed('COALESCE(updated_at, created_at)', persisted=True),
+        ),
+        sa.ForeignKeyConstraint(['discussion_id'], ['discussions.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_comments_id', 'comments', ['id'])
+    op.create_index('ix_comments_created_at', 'comments', ['created_at'])
+
+    # Threading cannot be represented in the flat table; replies come back as
+    # plain comments on their discussion
+    op.execute(f'INSERT INTO comments ({COPY_COLUMNS}) SELECT {COPY_COLUMNS} FROM discussion_comments')
+    op.drop_table('discussion_comments')
+
+    _create_sortable_index('comments', 'ix_comment_sortable_brin')
@@ -0,0 +1,69 @@
+"""narrow user ids
+
+Revision ID: 018_narrow_user_ids
+Revises: 017_merge_comments
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '018_narrow_user_ids'
+down_revision = '017_merge_comments'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, nullable)
+USER_ID_COLUMNS = [
+    ('watchlists', 'user_id', False),
+    ('discussion_likes', 'user_id', False),
+    ('discussion_comments', 'author_id', True),
+]
+
+# Both are prefixes of uq_watchlist (user_id, commodity_id, market_id)
+REDUNDANT_WATCHLIST_INDEXES = ['ix_watchlists_user_id', 'ix_watchlist_user']
+
+
+def _alter_user_ids(bind, from_type, to_type):
+    # SQLite does not enforce VARCHAR lengths, so only PostgreSQL needs the rewrite
+    if bind.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(bind)
+    for table, column, nullable in USER_ID_COLUMNS:
+        if not inspector.has_table(table):
+            continue
+        op.alter_column(
+            table,
+            column,
+            type_=to_type,
+            existing_type=from_type,
+            existing_nullable=nullable,
+        )
+
+
+def upgrade():
+    bind = op.get_bind()
+
+    inspector = sa.inspect(bind)
+    if inspector.has_table('watchlists'):
+        existing = {ix['name'] for ix in inspector.get_indexes('watchlists')}
+        for name in REDUNDANT_WATCHLIST_INDEXES:
+            if name in existing:
+                op.drop_index(name, table_name='watchlists')
+
+    # Fails loudly if an existing id is longer than 64 characters
+    _alter_user_ids(bind, sa.String(255), sa.String(64))
+
+
+def downgrade():
+    bind = op.get_bind()
+
+    _alter_user_ids(bind, sa.String(64), sa.String(255))
+
+    if sa.inspect(bind).has_table('watchlists'):
+        op.create_index('ix_watchlists_user_id', 'watchlists', ['user_id'])
+        op.create_index('ix_watchlist_user', 'watchlists', ['user_id'])
@@ -0,0 +1,100 @@
+"""model dimension table
+
+Revision ID: 019_model_dimension
+Revises: 018_narrow_user_ids
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '019_model_dimension'
+down_revision = '018_narrow_user_ids'
+branch_labels = None
+depends_on = None
+
+
+# Predictions never recorded a version alongside model_used
+LEGACY_PREDICTION_VERSION = 'unknown'
+
+
+def upgrade():
+    op.create_table(
+        'models',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('version', sa.String(length=50), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name', 'version', name='uq_model_name_version'),
+    )
+    op.create_index('ix_models_id', 'models', ['id'])
+
+    op.execute(
+        "INSERT INTO models (name, version) "
+        "SELECT DISTINCT model_name, model_version FROM prediction_metrics"
+    )
+    op.execute(
+        "INSERT INTO models (name, version) "
+        f"SELECT DISTINCT p.model_used, '{LEGACY_PREDICTION_VERSION}' FROM predictions p "
+        "WHERE p.model_used IS NOT NULL AND NOT EXISTS ("
+        f"SELECT 1 FROM models m WHERE m.name = p.model_used AND m.version = '{LEGACY_PREDICTION_VERSION}')"
+    )
+
+    op.add_column('prediction_metrics', sa.Column('model_id', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE prediction_metrics SET model_id = ("
+        "SELECT m.id FROM models m "
+        "WHERE m.name = prediction_metrics.model_name AND m.version = prediction_metrics.model_version)"
+    )
+    op.drop_index('ix_prediction_metrics_model', table_name='prediction_metrics')
+    op.drop_index('ix_prediction_metrics_model_name', table_name='prediction_metrics')
+    with op.batch_alter_table('prediction_metrics') as batch_op:
+        batch_op.alter_column('model_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_prediction_metrics_model_id', 'models', ['model_id'], ['id'])
+        batch_op.drop_column('model_name')
+        batch_op.drop_column('model_version')
+    op.create_index('ix_prediction_metrics_model', 'prediction_metrics', ['model_id', 'updated_at'])
+
+    op.add_column('predictions', sa.Column('model_id', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE predictions SET model_id = ("
+        "SELECT m.id FROM models m "
+        f"WHERE m.name = predictions.model_used AND m.version = '{LEGACY_PREDICTION_VERSION}') "
+        "WHERE model_used IS NOT NULL"
+    )
+    with op.batch_alter_table('predictions') as batch_op:
+        batch_op.create_foreign_key('fk_predictions_model_id', 'models', ['model_id'], ['id'])
+        batch_op.drop_column('model_used')
+
+
+def downgrade():
+    op.add_column('predictions', sa.Column('model_used', sa.String(length=100), nullable=True))
+    op.execute(
+        "UPDATE predictions SET model_used = ("
+        "SELECT m.name FROM models m WHERE m.id = predictions.model_id)"
+    )
+    with op.batch_alter_table('predictions') as batch_op:
+        batch_op.drop_constraint('fk_predictions_model_id', type_='foreignkey')
+        batch_op.drop_column('model_id')
+
+    op.add_column('prediction_metrics', sa.Column('model_name', sa.String(length=100), nullable=True))
+    op.add_column('prediction_metrics', sa.Column('model_version', sa.String(length=50), nullable=True))
+    op.execute(
+        "UPDATE prediction_metrics SET "
+        "model_name = (SELECT m.name FROM models m WHERE m.id = prediction_metrics.model_id), "
+        "model_version = (SELECT m.version FROM models m WHERE m.id = prediction_metrics.model_id)"
+    )
+    op.drop_index('ix_prediction_metrics_model', table_name='prediction_metrics')
+    with op.batch_alter_table('prediction_metrics') as batch_op:
+        batch_op.alter_column('model_name', existing_type=sa.String(length=100), nullable=False)
+        batch_op.alter_column('model_version', existing_type=sa.String(length=50), nullable=False)
+        batch_op.drop_constraint('fk_prediction_metrics_model_id', type_='foreignkey')
+        batch_op.drop_column('model_id')
+    op.create_index('ix_prediction_metrics_model_name', 'prediction_metrics', ['model_name'])
+    op.create_index('ix_prediction_metrics_model', 'prediction_metrics', ['model_name', 'model_version'])
+
+    op.drop_index('ix_models_id', table_name='models')
+    op.drop_table('models')
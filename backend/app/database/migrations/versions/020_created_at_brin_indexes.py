@@ -0,0 +1,67 @@
+"""created_at brin indexes
+
+Revision ID: 020_created_at_brin
+Revises: 019_model_dimension
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '020_created_at_brin'
+down_revision = '019_model_dimension'
+branch_labels = None
+depends_on = None
+
+
+# table: (column, btree indexes being replaced, brin index)
+BRIN_INDEXES = {
+    'market_prices': ('created_at', ['ix_market_prices_created_at'], 'ix_mp_created_brin'),
+    'alerts': ('triggered_at', ['ix_alerts_triggered_at'], 'ix_alert_triggered_brin'),
+    'predictions': ('created_at', ['ix_predictions_created_at'], 'ix_predictions_created_brin'),
+    'market_trend_analysis': (
+        'created_at', ['ix_market_trend_analysis_created_at'], 'ix_trend_analysis_created_brin',
+    ),
+    'recommendations': (
+        'created_at',
+        ['ix_recommendations_created_at', 'ix_recommendation_created'],
+        'ix_recommendation_created_brin',
+    ),
+    'discussions': ('created_at', ['ix_discussions_created_at'], 'ix_disc_created_brin'),
+    'discussion_comments': ('created_at', ['ix_discussion_comments_created_at'], 'ix_comment_created_brin'),
+}
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    for table, (column, btree_indexes, brin_index) in BRIN_INDEXES.items():
+        # Several of these tables are created by create_all on older deployments
+        if not inspector.has_table(table):
+            continue
+
+        existing = {ix['name'] for ix in inspector.get_indexes(table)}
+        for index_name in btree_indexes:
+            if index_name in existing:
+                op.drop_index(index_name, table_name=table)
+
+        # Plain index on SQLite, which has no BRIN
+        op.create_index(
+            brin_index, table, [column],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    for table, (column, btree_indexes, brin_index) in BRIN_INDEXES.items():
+        if not inspector.has_table(table):
+            continue
+
+        op.drop_index(brin_index, table_name=table)
+        for index_name in btree_indexes:
+            op.create_index(index_name, table, [column])
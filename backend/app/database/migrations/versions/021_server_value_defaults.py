@@ -0,0 +1,101 @@
+"""server side value defaults
+
+Revision ID: 021_server_value_defaults
+Revises: 020_created_at_brin
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '021_server_value_defaults'
+down_revision = '020_created_at_brin'
+branch_labels = None
+depends_on = None
+
+# table: {column: (type, default, nullable before this revision)}
+VALUE_DEFAULTS = {
+    'alerts': {
+        'notification_channels': (sa.JSON(), '\'["in_app"]\'', False),
+    },
+    'discussions': {
+        'tags': (sa.JSON(), "'[]'", False),
+        'likes_count': (sa.Integer(), '0', True),
+        'replies_count': (sa.Integer(), '0', True),
+        'views_count': (sa.Integer(), '0', True),
+    },
+    'discussion_comments': {
+        'likes_count': (sa.Integer(), '0', True),
+    },
+}
+
+# Generated columns; SQLite batch copies cannot insert into them (see 016)
+SORTABLE_INDEXES = {
+    'discussions': 'ix_disc_sortable_brin',
+    'discussion_comments': 'ix_comment_sortable_brin',
+}
+
+
+def _alter_columns(bind, table, columns, upgrade, add_sortable=False):
+    kwargs = {}
+    if bind.dialect.name == 'sqlite':
+        kwargs['recreate'] = 'always'
+
+    with op.batch_alter_table(table, **kwargs) as batch_op:
+        for column, (type_, default, was_nullable) in columns.items():
+            batch_op.alter_column(
+                column,
+                existing_type=type_,
+                server_default=sa.text(default) if upgrade else None,
+                nullable=False if upgrade else was_nullable,
+            )
+        # Added while the table is rebuilt, the only time SQLite accepts a
+        # STORED generated column, so the schema matches the models
+        if add_sortable:
+            batch_op.add_column(sa.Column(
+                'sortable_datetime', sa.DateTime(),
+                sa.Computed('COALESCE(updated_at, created_at)', persisted=True),
+            ))
+
+
+def _set_defaults(upgrade):
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for table, columns in VALUE_DEFAULTS.items():
+        # Discussion tables are created by create_all on older deployments
+        if not inspector.has_table(table):
+            continue
+
+        # Columns added by create_all only may be missing from migrated schemas
+        present = {c['name'] for c in inspector.get_columns(table)}
+        columns = {name: spec for name, spec in columns.items() if name in present}
+        if not columns:
+            continue
+
+        if upgrade:
+            for column, (_, default, was_nullable) in columns.items():
+                if was_nullable:
+                    op.execute(f"UPDATE {table} SET {column} = {default} WHERE {column} IS NULL")
+
+        sortable = (
+            bind.dialect.name == 'sqlite' and table in SORTABLE_INDEXES and 'sortable_datetime' in present
+        )
+        if sortable:
+            op.drop_index(SORTABLE_INDEXES[table], table_name=table)
+            op.drop_column(table, 'sortable_datetime')
+
+        _alter_columns(bind, table, columns, upgrade, add_sortable=sortable)
+
+        if sortable:
+            op.create_index(SORTABLE_INDEXES[table], table, ['sortable_datetime'])
+
+
+def upgrade():
+    _set_defaults(upgrade=True)
+
+
+def downgrade():
+    _set_defaults(upgrade=False)
@@ -0,0 +1,85 @@
+"""discussion counter triggers
+
+Revision ID: 022_discussion_counter_triggers
+Revises: 021_server_value_defaults
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '022_discussion_counter_triggers'
+down_revision = '021_server_value_defaults'
+branch_labels = None
+depends_on = None
+
+# counted table: discussions counter it maintains
+COUNTERS = {
+    'discussion_likes': 'likes_count',
+    'discussion_comments': 'replies_count',
+}
+
+
+def _create_postgresql(table, counter):
+    name = f'{table}_{counter}'
+    op.execute(f"""
+        CREATE FUNCTION {name}() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE discussions SET {counter} = {counter} + 1 WHERE id = NEW.discussion_id;
+            ELSE
+                UPDATE discussions SET {counter} = GREATEST({counter} - 1, 0) WHERE id = OLD.discussion_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        f'CREATE TRIGGER trg_{name} AFTER INSERT OR DELETE ON {table} '
+        f'FOR EACH ROW EXECUTE FUNCTION {name}()'
+    )
+
+
+def _create_sqlite(table, counter):
+    name = f'{table}_{counter}'
+    op.execute(
+        f'CREATE TRIGGER trg_{name}_inc AFTER INSERT ON {table} BEGIN '
+        f'UPDATE discussions SET {counter} = {counter} + 1 WHERE id = NEW.discussion_id; END'
+    )
+    op.execute(
+        f'CREATE TRIGGER trg_{name}_dec AFTER DELETE ON {table} BEGIN '
+        f'UPDATE discussions SET {counter} = MAX({counter} - 1, 0) WHERE id = OLD.discussion_id; END'
+    )
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table('discussions'):
+        return
+
+    for table, counter in COUNTERS.items():
+        if not inspector.has_table(table):
+            continue
+
+        # Existing counts are kept as-is: likes_count also includes anonymous
+        # likes from POST /{id}/like, which have no discussion_likes row
+        if bind.dialect.name == 'postgresql':
+            _create_postgresql(table, counter)
+        elif bind.dialect.name == 'sqlite':
+            _create_sqlite(table, counter)
+
+
+def downgrade():
+    bind = op.get_bind()
+
+    for table, counter in COUNTERS.items():
+        name = f'{table}_{counter}'
+        if bind.dialect.name == 'postgresql':
+            op.execute(f'DROP TRIGGER IF EXISTS trg_{name} ON {table}')
+            op.execute(f'DROP FUNCTION IF EXISTS {name}()')
+        elif bind.dialect.name == 'sqlite':
+            op.execute(f'DROP TRIGGER IF EXISTS trg_{name}_inc')
+            op.execute(f'DROP TRIGGER IF EXISTS trg_{name}_dec')
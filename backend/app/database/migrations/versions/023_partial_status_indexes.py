@@ -0,0 +1,64 @@
+"""partial status indexes
+
+Revision ID: 023_partial_status_indexes
+Revises: 022_discussion_counter_triggers
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '023_partial_status_indexes'
+down_revision = '022_discussion_counter_triggers'
+branch_labels = None
+depends_on = None
+
+# table: (full indexes replaced as (name, columns), partial index, columns, predicate)
+PARTIAL_INDEXES = {
+    'alerts': (
+        [('ix_alerts_status', ['status'])],
+        'ix_alert_active_priority', ['priority'], "status = 'ACTIVE'",
+    ),
+    'discussions': (
+        [('ix_discussions_is_pinned', ['is_pinned'])],
+        'ix_disc_pinned', ['updated_at'], 'is_pinned',
+    ),
+    'recommendations': (
+        [('ix_recommendation_active', ['is_active'])],
+        'ix_rec_active_commodity', ['commodity_id', 'created_at'], 'is_active IS TRUE',
+    ),
+}
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    for table, (full_indexes, partial_index, columns, predicate) in PARTIAL_INDEXES.items():
+        # Discussion and recommendation tables are created by create_all on older deployments
+        if not inspector.has_table(table):
+            continue
+
+        existing = {ix['name'] for ix in inspector.get_indexes(table)}
+        for index_name, _ in full_indexes:
+            if index_name in existing:
+                op.drop_index(index_name, table_name=table)
+
+        op.create_index(
+            partial_index, table, columns,
+            postgresql_where=sa.text(predicate),
+            sqlite_where=sa.text(predicate),
+        )
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    for table, (full_indexes, partial_index, _, _) in PARTIAL_INDEXES.items():
+        if not inspector.has_table(table):
+            continue
+
+        op.drop_index(partial_index, table_name=table)
+        for index_name, columns in full_indexes:
+            op.create_index(index_name, table, columns)
@@ -0,0 +1,49 @@
+"""real amount columns
+
+Revision ID: 024_real_amount_columns
+Revises: 023_partial_status_indexes
+Create Date: 2026-10-18 01:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '024_real_amount_columns'
+down_revision = '023_partial_status_indexes'
+branch_labels = None
+depends_on = None
+
+AMOUNT_COLUMNS = {
+    'market_prices': ['min_price', 'max_price', 'modal_price', 'price', 'arrival'],
+    'inventory': ['current_stock', 'optimal_stock', 'min_stock', 'max_stock', 'reorder_point'],
+    'market_trend_analysis': [
+        'avg_price', 'min_price', 'max_price', 'price_volatility',
+        'trend_strength', 'momentum', 'total_volume', 'avg_daily_volume',
+    ],
+}
+
+
+def _alter_amounts(type_name):
+    bind = op.get_bind()
+    # SQLite stores every REAL/FLOAT as an 8-byte double, so there is nothing to rewrite
+    if bind.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(bind)
+    for table, columns in AMOUNT_COLUMNS.items():
+        if not inspector.has_table(table):
+            continue
+
+        # A single ALTER TABLE so each table is rewritten once, not once per column
+        clauses = ', '.join(f'ALTER COLUMN {column} TYPE {type_name}' for column in columns)
+        op.execute(f'ALTER TABLE {table} {clauses}')
+
+
+def upgrade():
+    _alter_amounts('REAL')
+
+
+def downgrade():
+    _alter_amounts('DOUBLE PRECISION')
@@ -0,0 +1,43 @@
+"""discussion full-text search index
+
+Revision ID: 025_discussion_search_gin
+Revises: 024_real_amount_columns
+Create Date: 2026-10-18 02:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '025_discussion_search_gin'
+down_revision = '024_real_amount_columns'
+branch_labels = None
+depends_on = None
+
+# Must match discussion_search_document() in models.py for the planner to use it
+SEARCH_DOCUMENT = "to_tsvector('english', (coalesce(title, '') || ' ') || coalesce(content, ''))"
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    # Discussion tables are created by create_all on older deployments
+    if not inspector.has_table('discussions'):
+        return
+
+    if 'ix_discussions_title' in {ix['name'] for ix in inspector.get_indexes('discussions')}:
+        op.drop_index('ix_discussions_title', table_name='discussions')
+
+    if bind.dialect.name == 'postgresql':
+        op.execute(f'CREATE INDEX ix_discussion_search_gin ON discussions USING gin ({SEARCH_DOCUMENT})')
+
+
+def downgrade():
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('discussions'):
+        return
+
+    if bind.dialect.name == 'postgresql':
+        op.drop_index('ix_discussion_search_gin', table_name='discussions')
+    op.create_index('ix_discussions_title', 'discussions', ['title'])
@@ -0,0 +1,76 @@
+"""bigint identity keys on append-only tables
+
+Revision ID: 026_bigint_identity_keys
+Revises: 025_discussion_search_gin
+Create Date: 2026-10-18 03:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '026_bigint_identity_keys'
+down_revision = '025_discussion_search_gin'
+branch_labels = None
+depends_on = None
+
+IDENTITY_TABLES = ['predictions', 'market_trend_analysis']
+
+ID_CACHE = 1000
+
+
+def _restart_sequence(table):
+    op.execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+    )
+
+
+def upgrade():
+    bind = op.get_bind()
+    # SQLite keys are already 64-bit rowids
+    if bind.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(bind)
+
+    # Partitioned since 011, and partitioned tables only accept identity columns
+    # from PostgreSQL 17 on; widen the column and keep its sequence instead
+    if inspector.has_table('market_prices'):
+        op.execute('ALTER TABLE market_prices ALTER COLUMN id TYPE bigint')
+        op.execute(f'ALTER SEQUENCE market_prices_id_seq AS bigint CACHE {ID_CACHE}')
+
+    for table in IDENTITY_TABLES:
+        if not inspector.has_table(table):
+            continue
+
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT')
+        op.execute(f'DROP SEQUENCE IF EXISTS {table}_id_seq')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN id TYPE bigint, '
+            f'ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (CACHE {ID_CACHE})'
+        )
+        _restart_sequence(table)
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    inspector = sa.inspect(bind)
+
+    for table in IDENTITY_TABLES:
+        if not inspector.has_table(table):
+            continue
+
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN id TYPE integer')
+        op.execute(f'CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id')
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq'::regclass)")
+        _restart_sequence(table)
+
+    if inspector.has_table('market_prices'):
+        op.execute('ALTER SEQUENCE market_prices_id_seq AS integer CACHE 1')
+        op.execute('ALTER TABLE market_prices ALTER COLUMN id TYPE integer')
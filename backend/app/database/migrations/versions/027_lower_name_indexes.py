@@ -0,0 +1,70 @@
+"""case-insensitive name indexes
+
+Revision ID: 027_lower_name_indexes
+Revises: 026_bigint_identity_keys
+Create Date: 2026-10-18 04:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '027_lower_name_indexes'
+down_revision = '026_bigint_identity_keys'
+branch_labels = None
+depends_on = None
+
+# Plain btrees that case-insensitive lookups could never use; exact name
+# matches are still served by the uq_market_state (name, state) prefix
+MARKET_INDEXES = {
+    'ix_markets_name': ['name'],
+    'ix_markets_state': ['state'],
+    'ix_markets_district': ['district'],
+}
+
+
+def _check_commodity_case_duplicates(bind):
+
+    # The unique index below cannot be built while names differ only by case;
+    # fail before touching any index and list the rows to merge by hand
+    duplicates = bind.execute(sa.text(
+        'SELECT lower(name) AS folded, COUNT(*) AS n FROM commodities '
+        'GROUP BY lower(name) HAVING COUNT(*) > 1'
+    )).fetchall()
+    if not duplicates:
+        return
+
+    rows = bind.execute(
+        sa.text('SELECT id, name FROM commodities WHERE lower(name) IN :folded ORDER BY lower(name), id')
+        .bindparams(sa.bindparam('folded', expanding=True)),
+        {'folded': [row.folded for row in duplicates]},
+    ).fetchall()
+    listing = ', '.join(f'{row.id}: {row.name!r}' for row in rows)
+    raise RuntimeError(
+        'Cannot create ix_commodity_lower_name: commodities differ only by case '
+        f'({listing}). Merge them and repoint their references, then rerun the upgrade.'
+    )
+
+
+def upgrade():
+    bind = op.get_bind()
+    _check_commodity_case_duplicates(bind)
+
+    existing = {ix['name'] for ix in sa.inspect(bind).get_indexes('markets')}
+    for index_name in MARKET_INDEXES:
+        if index_name in existing:
+            op.drop_index(index_name, table_name='markets')
+
+    op.create_index('ix_commodity_lower_name', 'commodities', [sa.text('lower(name)')], unique=True)
+    op.create_index('ix_market_lower_name', 'markets', [sa.text('lower(name)')])
+    op.create_index('ix_market_lower_state_district', 'markets', [sa.text('lower(state)'), sa.text('lower(district)')])
+
+
+def downgrade():
+    op.drop_index('ix_market_lower_state_district', table_name='markets')
+    op.drop_index('ix_market_lower_name', table_name='markets')
+    op.drop_index('ix_commodity_lower_name', table_name='commodities')
+
+    for index_name, columns in MARKET_INDEXES.items():
+        op.create_index(index_name, 'markets', columns)
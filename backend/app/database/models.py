@@ -1,25 +1,84 @@
 
-from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     Integer,
     String,
     Float,
+    REAL,
     Date,
     DateTime,
+    Enum,
     Text,
     Boolean,
+    Computed,
     ForeignKey,
+    Identity,
     Index,
     UniqueConstraint,
+    DDL,
     JSON,
+    event,
+    func,
+    literal_column,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+class _ModelBase:
+
+    # Timestamps are filled in by the database (server_default/onupdate now());
+    # fetch them back with RETURNING on INSERT and UPDATE so reading them after a
+    # flush never triggers a lazy refresh, which AsyncSession cannot do implicitly
+    __mapper_args__ = {"eager_defaults": True}
+
+Base = declarative_base(cls=_ModelBase)
+
+# Binary JSONB on PostgreSQL so documents can be GIN-indexed; plain JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+# External user ids (Clerk "user_..." ids, bearer tokens) are opaque strings, not
+# UUIDs, so they can't be cast to a 16-byte uuid; bound them tightly instead so the
+# (user_id, ...) unique btrees stay narrow
+UserId = String(64)
+
+# Prices, stock levels and trend metrics are single-precision REAL (4 bytes, ~7
+# significant digits, i.e. paisa-level for prices under 1 lakh); they do not need
+# double precision, and narrower rows mean less IO on the analytics scans
+Amount = REAL
+
+# Append-only fact tables (prices, predictions, trend snapshots) get 64-bit
+# identity keys with a cached block of values per session, so batch inserts do
+# not hit the sequence once per row. SQLite only autoincrements INTEGER keys.
+BigIntegerId = BigInteger().with_variant(Integer, "sqlite")
+
+# Low-cardinality status columns are native ENUMs on PostgreSQL (VARCHAR elsewhere);
+# priority is declared in ascending severity so ORDER BY priority sorts by urgency
+AlertTypeEnum = Enum(
+    "PRICE_THRESHOLD",
+    "INVENTORY_LOW",
+    "INVENTORY_OVERSTOCK",
+    "PRICE_VOLATILITY",
+    "TREND_CHANGE",
+    "EXPIRY_WARNING",
+    "BUY_SELL",
+    name="alert_type",
+)
+AlertPriorityEnum = Enum("LOW", "MEDIUM", "HIGH", "CRITICAL", name="alert_priority")
+AlertStatusEnum = Enum("ACTIVE", "INACTIVE", "RESOLVED", "DISMISSED", name="alert_status")
+RecommendationTypeEnum = Enum("BUY", "SELL", "HOLD", "STOCK_UP", "STOCK_DOWN", name="recommendation_type")
+DiscussionStatusEnum = Enum("PUBLISHED", "ARCHIVED", name="discussion_status")
+TrendDirectionEnum = Enum("INCREASING", "DECREASING", "STABLE", name="trend_direction")
+
+# Many-to-one links that list endpoints always render (commodity, market) load
+# with selectin; the reverse collections on Commodity/Market are lazy="raise" so
+# an accidental traversal fails loudly instead of issuing N queries. Queries that
+# need a different shape should say so explicitly, e.g.
+# select(MarketPrice).options(selectinload(MarketPrice.commodity), raiseload("*")).
 
 class Commodity(Base):
 
@@ -30,12 +89,17 @@ class Commodity(Base):
     category = Column(String(100), index=True)
     unit = Column(String(50), default="Quintal")
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
-    market_prices = relationship("MarketPrice", back_populates="commodity", cascade="all, delete-orphan")
-    alerts = relationship("Alert", back_populates="commodity", cascade="all, delete-orphan")
-    inventory = relationship("Inventory", back_populates="commodity", cascade="all, delete-orphan")
+    market_prices = relationship("MarketPrice", back_populates="commodity", cascade="all, delete-orphan", lazy="raise")
+    alerts = relationship("Alert", back_populates="commodity", cascade="all, delete-orphan", lazy="raise")
+    inventory = relationship("Inventory", back_populates="commodity", cascade="all, delete-orphan", lazy="raise")
+
+    # Name lookups are case-insensitive; query with func.lower(name) == value.lower()
+    __table_args__ = (
+        Index("ix_commodity_lower_name", func.lower(name), unique=True),
+    )
 
     def __repr__(self):
         return f"<Commodity(id={self.id}, name={self.name})>"
@@ -45,21 +109,25 @@ class Market(Base):
     __tablename__ = "markets"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), nullable=False, index=True)
-    state = Column(String(100), index=True)
-    district = Column(String(100), index=True)
+    name = Column(String(255), nullable=False)
+    state = Column(String(100))
+    district = Column(String(100))
     latitude = Column(Float, nullable=True)
     longitude = Column(Float, nullable=True)
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
-    market_prices = relationship("MarketPrice", back_populates="market", cascade="all, delete-orphan")
-    alerts = relationship("Alert", back_populates="market", cascade="all, delete-orphan")
-    inventory = relationship("Inventory", back_populates="market", cascade="all, delete-orphan")
+    market_prices = relationship("MarketPrice", back_populates="market", cascade="all, delete-orphan", lazy="raise")
+    alerts = relationship("Alert", back_populates="market", cascade="all, delete-orphan", lazy="raise")
+    inventory = relationship("Inventory", back_populates="market", cascade="all, delete-orphan", lazy="raise")
 
+    # Exact name lookups use the uq_market_state prefix; case-insensitive ones
+    # compare lower() and hit the functional indexes
     __table_args__ = (
         UniqueConstraint("name", "state", name="uq_market_state"),
+        Index("ix_market_lower_name", func.lower(name)),
+        Index("ix_market_lower_state_district", func.lower(state), func.lower(district)),
     )
 
     def __repr__(self):
@@ -69,25 +137,42 @@ class MarketPrice(Base):
 
     __tablename__ = "market_prices"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerId, Identity(always=True, cache=1000), primary_key=True, index=True)
     commodity_id = Column(Integer, ForeignKey("commodities.id"), nullable=False)
     market_id = Column(Integer, ForeignKey("markets.id"), nullable=False)
-    date = Column(Date, nullable=False, index=True)
-    min_price = Column(Float, nullable=True)
-    max_price = Column(Float, nullable=True)
-    modal_price = Column(Float, nullable=True)
-    price = Column(Float, nullable=False)
-    arrival = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-    commodity = relationship("Commodity", back_populates="market_prices")
-    market = relationship("Market", back_populates="market_prices")
-
+    date = Column(Date, nullable=False)
+    min_price = Column(Amount, nullable=True)
+    max_price = Column(Amount, nullable=True)
+    modal_price = Column(Amount, nullable=True)
+    price = Column(Amount, nullable=False)
+    arrival = Column(Amount, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    commodity = relationship("Commodity", back_populates="market_prices", lazy="selectin")
+    market = relationship("Market", back_populates="market_prices", lazy="selectin")
+
+    # On PostgreSQL the table is range-partitioned by month on date (see
+    # migration 011) with a primary key of (id, date); filter on date so
+    # partitions get pruned. Partitioned tables cannot carry identity columns
+    # before PostgreSQL 17, so there id stays on a bigint sequence with the
+    # same CACHE 1000 (migration 026)
     __table_args__ = (
-        Index("ix_market_price_date", "date"),
-        Index("ix_market_price_commodity_market_date", "commodity_id", "market_id", "date"),
+        Index(
+            "ix_mp_cmd",
+            "commodity_id",
+            "market_id",
+            "date",
+            postgresql_include=["price", "modal_price", "min_price", "max_price", "arrival"],
+        ),
+        Index("ix_mp_date_commodity", "date", "commodity_id"),
         UniqueConstraint("commodity_id", "market_id", "date", name="uq_market_price"),
+        Index(
+            "ix_mp_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
@@ -100,22 +185,40 @@ class Alert(Base):
     id = Column(Integer, primary_key=True, index=True)
     commodity_id = Column(Integer, ForeignKey("commodities.id"), nullable=True)
     market_id = Column(Integer, ForeignKey("markets.id"), nullable=True)
-    alert_type = Column(String(50), nullable=False, index=True)
-    priority = Column(String(20), default="MEDIUM", index=True)
-    status = Column(String(20), default="ACTIVE", index=True)
-    conditions = Column(JSON, nullable=True)
-    notification_channels = Column(JSON, default=lambda: ["in_app"], nullable=False)
+    alert_type = Column(AlertTypeEnum, nullable=False, index=True)
+    priority = Column(AlertPriorityEnum, default="MEDIUM", index=True)
+    status = Column(AlertStatusEnum, default="ACTIVE")
+    conditions = Column(JSONDocument, nullable=True)
+    notification_channels = Column(JSON, server_default=text("'[\"in_app\"]'"), nullable=False)
     message = Column(Text, nullable=True)
-    triggered_at = Column(DateTime, nullable=True, index=True)
+    triggered_at = Column(DateTime, nullable=True)
     resolved_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
-    commodity = relationship("Commodity", back_populates="alerts")
-    market = relationship("Market", back_populates="alerts")
+    commodity = relationship("Commodity", back_populates="alerts", lazy="selectin")
+    market = relationship("Market", back_populates="alerts", lazy="selectin")
 
     __table_args__ = (
         Index("ix_alert_status_priority", "status", "priority"),
+        Index(
+            "ix_alert_active_priority",
+            "priority",
+            postgresql_where=text("status = 'ACTIVE'"),
+            sqlite_where=text("status = 'ACTIVE'"),
+        ),
+        Index(
+            "ix_alert_triggered_brin",
+            "triggered_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_alert_conditions_gin",
+            "conditions",
+            postgresql_using="gin",
+            postgresql_ops={"conditions": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     def __repr__(self):
@@ -128,18 +231,18 @@ class Inventory(Base):
     id = Column(Integer, primary_key=True, index=True)
     commodity_id = Column(Integer, ForeignKey("commodities.id"), nullable=False)
     market_id = Column(Integer, ForeignKey("markets.id"), nullable=False)
-    current_stock = Column(Float, default=0.0, nullable=False)
-    optimal_stock = Column(Float, nullable=True)
-    min_stock = Column(Float, nullable=True)
-    max_stock = Column(Float, nullable=True)
-    reorder_point = Column(Float, nullable=True)
+    current_stock = Column(Amount, default=0.0, nullable=False)
+    optimal_stock = Column(Amount, nullable=True)
+    min_stock = Column(Amount, nullable=True)
+    max_stock = Column(Amount, nullable=True)
+    reorder_point = Column(Amount, nullable=True)
     last_restocked_at = Column(DateTime, nullable=True)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
-    commodity = relationship("Commodity", back_populates="inventory")
-    market = relationship("Market", back_populates="inventory")
+    commodity = relationship("Commodity", back_populates="inventory", lazy="selectin")
+    market = relationship("Market", back_populates="inventory", lazy="selectin")
 
     __table_args__ = (
         UniqueConstraint("commodity_id", "market_id", name="uq_inventory"),
@@ -148,13 +251,28 @@ class Inventory(Base):
     def __repr__(self):
         return f"<Inventory(id={self.id}, commodity_id={self.commodity_id}, market_id={self.market_id})>"
 
+class Model(Base):
+
+    __tablename__ = "models"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    version = Column(String(50), nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("name", "version", name="uq_model_name_version"),
+    )
+
+    def __repr__(self):
+        return f"<Model(id={self.id}, name={self.name}, version={self.version})>"
+
 class PredictionMetrics(Base):
 
     __tablename__ = "prediction_metrics"
 
     id = Column(Integer, primary_key=True, index=True)
-    model_name = Column(String(100), nullable=False, index=True)
-    model_version = Column(String(50), nullable=False)
+    model_id = Column(Integer, ForeignKey("models.id"), nullable=False)
     accuracy = Column(Float, nullable=True)
     rmse = Column(Float, nullable=True)
     mae = Column(Float, nullable=True)
@@ -169,83 +287,159 @@ class PredictionMetrics(Base):
     training_duration_minutes = Column(Float, nullable=True)
     last_trained_at = Column(DateTime, nullable=True)
     feature_importance = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    model = relationship("Model", lazy="selectin")
 
     __table_args__ = (
-        Index("ix_prediction_metrics_model", "model_name", "model_version"),
+        # Serves "latest metrics for a model": WHERE model_id = ? ORDER BY updated_at DESC
+        Index("ix_prediction_metrics_model", "model_id", "updated_at"),
     )
 
+    @property
+    def model_name(self) -> str:
+        return self.model.name
+
+    @property
+    def model_version(self) -> str:
+        return self.model.version
+
     def __repr__(self):
-        return f"<PredictionMetrics(id={self.id}, model_name={self.model_name}, version={self.model_version})>"
+        return f"<PredictionMetrics(id={self.id}, model_id={self.model_id})>"
 
 class Prediction(Base):
 
     __tablename__ = "predictions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerId, Identity(always=True, cache=1000), primary_key=True, index=True)
     commodity_id = Column(Integer, ForeignKey("commodities.id"), nullable=False)
     market_id = Column(Integer, ForeignKey("markets.id"), nullable=False)
     prediction_date = Column(Date, nullable=False, index=True)
     predicted_price = Column(Float, nullable=False)
     actual_price = Column(Float, nullable=True)
     confidence = Column(Float, nullable=True)
-    model_used = Column(String(100), nullable=True)
+    model_id = Column(Integer, ForeignKey("models.id"), nullable=True)
     error = Column(Float, nullable=True)
     accuracy = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, server_default=func.now())
 
     __table_args__ = (
         Index("ix_prediction_date_commodity_market", "prediction_date", "commodity_id", "market_id"),
+        Index(
+            "ix_predictions_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
         return f"<Prediction(id={self.id}, commodity_id={self.commodity_id}, market_id={self.market_id})>"
 
+# Full-text document for discussion search. Built from literals only (no bind
+# parameters) so queries match the GIN expression index exactly
+def discussion_search_document(title, content):
+
+    return func.to_tsvector(
+        literal_column("'english'"),
+        func.coalesce(title, literal_column("''"))
+        .op("||")(literal_column("' '"))
+        .op("||")(func.coalesce(content, literal_column("''"))),
+    )
+
 class Discussion(Base):
 
     __tablename__ = "discussions"
 
     id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(255), nullable=False, index=True)
+    title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
     commodity = Column(String(255), nullable=False, index=True)
     market = Column(String(255), nullable=True)
+    commodity_id = Column(Integer, ForeignKey("commodities.id"), nullable=True, index=True)
+    market_id = Column(Integer, ForeignKey("markets.id"), nullable=True)
     author = Column(String(255), nullable=False)
     avatar_url = Column(String(500), nullable=True)
-    likes_count = Column(Integer, default=0)
-    replies_count = Column(Integer, default=0)
-    views_count = Column(Integer, default=0)
-    is_pinned = Column(Boolean, default=False, index=True)
-    tags = Column(JSON, default=list, nullable=False)
-    status = Column(String(20), default="PUBLISHED", index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    likes_count = Column(Integer, server_default="0", nullable=False)
+    replies_count = Column(Integer, server_default="0", nullable=False)
+    views_count = Column(Integer, server_default="0", nullable=False)
+    is_pinned = Column(Boolean, default=False)
+    tags = Column(JSONDocument, server_default=text("'[]'"), nullable=False)
+    status = Column(DiscussionStatusEnum, default="PUBLISHED", index=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    sortable_datetime = Column(DateTime, Computed("COALESCE(updated_at, created_at)", persisted=True))
 
     __table_args__ = (
-        Index("ix_discussion_commodity_created", "commodity", "created_at"),
+        Index("ix_discussion_commodity_created", "commodity_id", "created_at"),
         Index("ix_discussion_status", "status"),
+        Index(
+            "ix_disc_pinned",
+            "updated_at",
+            postgresql_where=text("is_pinned"),
+            sqlite_where=text("is_pinned"),
+        ),
+        Index(
+            "ix_discussion_search_gin",
+            discussion_search_document(title, content),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_discussion_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_disc_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_disc_sortable_brin",
+            "sortable_datetime",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
         return f"<Discussion(id={self.id}, title={self.title}, author={self.author})>"
 
-class Comment(Base):
-
-    __tablename__ = "comments"
-
-    id = Column(Integer, primary_key=True, index=True)
-    discussion_id = Column(Integer, ForeignKey("discussions.id"), nullable=False)
-    content = Column(Text, nullable=False)
-    author = Column(String(255), nullable=True)
-    author_id = Column(String(255), nullable=True)
-    avatar_url = Column(String(512), nullable=True)
-    likes_count = Column(Integer, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-    def __repr__(self):
-        return f"<Comment(id={self.id}, discussion_id={self.discussion_id})>"
+DISCUSSION_SEARCH_DOCUMENT = discussion_search_document(Discussion.title, Discussion.content)
+
+# Discussion counters are kept by the database: AFTER INSERT/DELETE triggers on
+# the counted rows update discussions in the same statement, so endpoints never
+# read-modify-write them. Trigger names match migration 022.
+def add_counter_trigger(table, counter: str) -> None:
+
+    name = f"{table.name}_{counter}"
+    event.listen(table, "after_create", DDL(f"""
+        CREATE FUNCTION {name}() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE discussions SET {counter} = {counter} + 1 WHERE id = NEW.discussion_id;
+            ELSE
+                UPDATE discussions SET {counter} = GREATEST({counter} - 1, 0) WHERE id = OLD.discussion_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """).execute_if(dialect="postgresql"))
+    event.listen(table, "after_create", DDL(
+        f"CREATE TRIGGER trg_{name} AFTER INSERT OR DELETE ON {table.name} "
+        f"FOR EACH ROW EXECUTE FUNCTION {name}()"
+    ).execute_if(dialect="postgresql"))
+    event.listen(table, "after_create", DDL(
+        f"CREATE TRIGGER trg_{name}_inc AFTER INSERT ON {table.name} BEGIN "
+        f"UPDATE discussions SET {counter} = {counter} + 1 WHERE id = NEW.discussion_id; END"
+    ).execute_if(dialect="sqlite"))
+    event.listen(table, "after_create", DDL(
+        f"CREATE TRIGGER trg_{name}_dec AFTER DELETE ON {table.name} BEGIN "
+        f"UPDATE discussions SET {counter} = MAX({counter} - 1, 0) WHERE id = OLD.discussion_id; END"
+    ).execute_if(dialect="sqlite"))
 
 class DiscussionLike(Base):
 
@@ -253,33 +447,35 @@ class DiscussionLike(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     discussion_id = Column(Integer, ForeignKey("discussions.id"), nullable=False)
-    user_id = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    user_id = Column(UserId, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint("discussion_id", "user_id", name="uq_discussion_like"),
     )
 
+add_counter_trigger(DiscussionLike.__table__, "likes_count")
+
 class Watchlist(Base):
 
     __tablename__ = "watchlists"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String(255), nullable=False, index=True)
+    user_id = Column(UserId, nullable=False)
     commodity_id = Column(Integer, ForeignKey("commodities.id"), nullable=False)
     market_id = Column(Integer, ForeignKey("markets.id"), nullable=True)
     notes = Column(Text, nullable=True)
     alert_on_price_change = Column(Boolean, default=False)
     price_change_threshold = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
-    commodity = relationship("Commodity")
-    market = relationship("Market")
+    commodity = relationship("Commodity", lazy="selectin")
+    market = relationship("Market", lazy="selectin")
 
     __table_args__ = (
+        # Leads with user_id, so it also serves the per-user watchlist lookups
         UniqueConstraint("user_id", "commodity_id", "market_id", name="uq_watchlist"),
-        Index("ix_watchlist_user", "user_id"),
     )
 
     def __repr__(self):
@@ -289,26 +485,32 @@ class MarketTrendAnalysis(Base):
 
     __tablename__ = "market_trend_analysis"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerId, Identity(always=True, cache=1000), primary_key=True, index=True)
     commodity_id = Column(Integer, ForeignKey("commodities.id"), nullable=False)
     market_id = Column(Integer, ForeignKey("markets.id"), nullable=False)
     analysis_date = Column(Date, nullable=False, index=True)
     period_days = Column(Integer, nullable=False)
-    avg_price = Column(Float, nullable=False)
-    min_price = Column(Float, nullable=False)
-    max_price = Column(Float, nullable=False)
-    price_volatility = Column(Float, nullable=False)
-    trend_direction = Column(String(20), nullable=False)
-    trend_strength = Column(Float, nullable=False)
-    momentum = Column(Float, nullable=False)
-    total_volume = Column(Float, nullable=True)
-    avg_daily_volume = Column(Float, nullable=True)
+    avg_price = Column(Amount, nullable=False)
+    min_price = Column(Amount, nullable=False)
+    max_price = Column(Amount, nullable=False)
+    price_volatility = Column(Amount, nullable=False)
+    trend_direction = Column(TrendDirectionEnum, nullable=False)
+    trend_strength = Column(Amount, nullable=False)
+    momentum = Column(Amount, nullable=False)
+    total_volume = Column(Amount, nullable=True)
+    avg_daily_volume = Column(Amount, nullable=True)
     analysis_data = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, server_default=func.now())
 
     __table_args__ = (
         UniqueConstraint("commodity_id", "market_id", "analysis_date", "period_days", name="uq_trend_analysis"),
         Index("ix_trend_analysis_date_period", "analysis_date", "period_days"),
+        Index(
+            "ix_trend_analysis_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
@@ -323,26 +525,44 @@ class Recommendation(Base):
     id = Column(Integer, primary_key=True, index=True)
     commodity_id = Column(Integer, ForeignKey("commodities.id"), nullable=False)
     market_id = Column(Integer, ForeignKey("markets.id"), nullable=True)
-    recommendation_type = Column(String(20), nullable=False)  # BUY, SELL, HOLD
+    recommendation_type = Column(RecommendationTypeEnum, nullable=False)
     confidence_score = Column(Float, nullable=False)  # 0-1
     predicted_price = Column(Float, nullable=True)
     current_price = Column(Float, nullable=True)
     price_change_percent = Column(Float, nullable=True)
     reasoning = Column(Text, nullable=True)
-    factors = Column(JSON, nullable=True)  # List of factors influencing recommendation
+    factors = Column(JSONDocument, nullable=True)  # List of factors influencing recommendation
     valid_until = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
-    commodity = relationship("Commodity")
-    market = relationship("Market")
+    commodity = relationship("Commodity", lazy="selectin")
+    market = relationship("Market", lazy="selectin")
 
     __table_args__ = (
         Index("ix_recommendation_commodity", "commodity_id"),
-        Index("ix_recommendation_active", "is_active"),
-        Index("ix_recommendation_created", "created_at"),
+        # Partial: only the small active slice is ever looked up by commodity
+        Index(
+            "ix_rec_active_commodity",
+            "commodity_id",
+            "created_at",
+            postgresql_where=text("is_active IS TRUE"),
+            sqlite_where=text("is_active IS TRUE"),
+        ),
+        Index(
+            "ix_recommendation_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_recommendation_factors_gin",
+            "factors",
+            postgresql_using="gin",
+            postgresql_ops={"factors": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     def __repr__(self):
@@ -362,8 +582,8 @@ class SeasonalPricePattern(Base):
     min_price = Column(Float, nullable=True)
     max_price = Column(Float, nullable=True)
     peak_month = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     commodity = relationship("Commodity")
@@ -389,8 +609,8 @@ class StorageCost(Base):
     max_storage_days = Column(Integer, nullable=False)
     perishable = Column(Boolean, default=False)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     commodity = relationship("Commodity")
@@ -413,7 +633,7 @@ class PriceVolatility(Base):
     commodity_id = Column(Integer, ForeignKey("commodities.id"), nullable=False)
     period = Column(String(20), nullable=False)  # '30_day', '90_day', '180_day'
     volatility_score = Column(Float, nullable=False)  # 0-1
-    calculated_at = Column(DateTime, default=datetime.utcnow)
+    calculated_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     commodity = relationship("Commodity")
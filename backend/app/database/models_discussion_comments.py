@@ -1,9 +1,8 @@
 """Discussion comments/replies model."""
 
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Computed, Integer, String, Text, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
-from app.database.models import Base
+from app.database.models import Base, UserId, add_counter_trigger
 
 
 class DiscussionComment(Base):
@@ -15,24 +14,43 @@ class DiscussionComment(Base):
     discussion_id = Column(Integer, ForeignKey("discussions.id", ondelete="CASCADE"), nullable=False)
     parent_comment_id = Column(Integer, ForeignKey("discussion_comments.id"), nullable=True)
     author = Column(String(255), nullable=False)
+    author_id = Column(UserId, nullable=True)
     avatar_url = Column(String(500), nullable=True)
     content = Column(Text, nullable=False)
-    likes_count = Column(Integer, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    likes_count = Column(Integer, server_default="0", nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    sortable_datetime = Column(DateTime, Computed("COALESCE(updated_at, created_at)", persisted=True))
 
     # Relationships
     replies = relationship(
         "DiscussionComment",
         back_populates="parent",
         cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="DiscussionComment.created_at",
     )
     parent = relationship("DiscussionComment", back_populates="replies", remote_side=[id])
 
     __table_args__ = (
         Index("ix_comment_discussion_created", "discussion_id", "created_at"),
-        Index("ix_comment_parent", "parent_comment_id"),
+        Index("ix_comment_parent_created", "parent_comment_id", "created_at"),
+        Index(
+            "ix_comment_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_comment_sortable_brin",
+            "sortable_datetime",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self):
         return f"<DiscussionComment(id={self.id}, discussion_id={self.discussion_id}, author={self.author})>"
+
+
+add_counter_trigger(DiscussionComment.__table__, "replies_count")
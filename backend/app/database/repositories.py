@@ -1,25 +1,38 @@
 
-from datetime import datetime, timedelta
-from typing import Any, List, Optional
+from datetime import date as date_type, timedelta
+from typing import Any, List, Optional, Sequence
 
 from loguru import logger
-from sqlalchemy import select, and_, or_, desc
+from sqlalchemy import select, insert, and_, or_, desc, func, literal_column
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.utils import get_current_timestamp
+from app.config import settings
+from app.core.cache import COMMODITIES_CACHE_KEY, MARKETS_CACHE_KEY, invalidate_after_commit
+from app.core.utils import get_current_timestamp, parse_date
 from app.database.models import (
     Commodity,
     Market,
     MarketPrice,
     Alert,
     Inventory,
+    Model,
     PredictionMetrics,
     Prediction,
     Discussion,
+    DISCUSSION_SEARCH_DOCUMENT,
     Watchlist,
     MarketTrendAnalysis,
 )
 
+PRICE_FIELDS = ("price", "min_price", "max_price", "modal_price", "arrival")
+
+UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
 class BaseRepository:
 
     def __init__(self, db: AsyncSession, model):
@@ -79,9 +92,33 @@ class CommodityRepository(BaseRepository):
     def __init__(self, db: AsyncSession):
         super().__init__(db, Commodity)
 
+    async def create(self, instance_or_kwargs=None, **kwargs) -> Commodity:
+
+        commodity = await super().create(instance_or_kwargs, **kwargs)
+        invalidate_after_commit(self.db, COMMODITIES_CACHE_KEY)
+        return commodity
+
+    async def get_or_create(self, name: str, **values) -> Commodity:
+
+        dialect_insert = UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if dialect_insert is None:
+            return await self.get_by_name(name) or await self.create(name=name, **values)
+
+        # The no-op update lets RETURNING hand back the row that already exists,
+        # so a concurrent insert of the same name is not an IntegrityError
+        stmt = (
+            dialect_insert(Commodity)
+            .values(name=name, **values)
+            .on_conflict_do_update(index_elements=[func.lower(Commodity.name)], set_={"name": Commodity.name})
+            .returning(Commodity)
+        )
+        result = await self.db.scalars(stmt, execution_options={"populate_existing": True})
+        invalidate_after_commit(self.db, COMMODITIES_CACHE_KEY)
+        return result.one()
+
     async def get_by_name(self, name: str) -> Optional[Commodity]:
 
-        query = select(Commodity).where(Commodity.name.ilike(name))
+        query = select(Commodity).where(func.lower(Commodity.name) == name.lower())
         result = await self.db.execute(query)
         commodity = result.scalars().first()
         
@@ -93,6 +130,15 @@ class CommodityRepository(BaseRepository):
         
         return commodity
 
+    async def get_by_ids(self, ids: List[int]) -> dict[int, Commodity]:
+
+        if not ids:
+            return {}
+
+        query = select(Commodity).where(Commodity.id.in_(set(ids)))
+        result = await self.db.execute(query)
+        return {commodity.id: commodity for commodity in result.scalars().all()}
+
     async def get_by_category(self, category: str) -> List[Commodity]:
 
         query = select(Commodity).where(Commodity.category.ilike(category))
@@ -115,9 +161,31 @@ class MarketRepository(BaseRepository):
     def __init__(self, db: AsyncSession):
         super().__init__(db, Market)
 
+    async def create(self, instance_or_kwargs=None, **kwargs) -> Market:
+
+        market = await super().create(instance_or_kwargs, **kwargs)
+        invalidate_after_commit(self.db, MARKETS_CACHE_KEY)
+        return market
+
+    async def get_or_create(self, name: str, state: str, **values) -> Market:
+
+        dialect_insert = UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if dialect_insert is None:
+            return await self.get_by_name(name) or await self.create(name=name, state=state, **values)
+
+        stmt = (
+            dialect_insert(Market)
+            .values(name=name, state=state, **values)
+            .on_conflict_do_update(index_elements=["name", "state"], set_={"name": Market.name})
+            .returning(Market)
+        )
+        result = await self.db.scalars(stmt, execution_options={"populate_existing": True})
+        invalidate_after_commit(self.db, MARKETS_CACHE_KEY)
+        return result.one()
+
     async def get_by_name(self, name: str) -> Optional[Market]:
 
-        query = select(Market).where(Market.name.ilike(name))
+        query = select(Market).where(func.lower(Market.name) == name.lower())
         result = await self.db.execute(query)
         market = result.scalars().first()
         
@@ -131,15 +199,15 @@ class MarketRepository(BaseRepository):
 
     async def get_by_state(self, state: str) -> List[Market]:
 
-        query = select(Market).where(Market.state.ilike(state))
+        query = select(Market).where(func.lower(Market.state) == state.lower())
         result = await self.db.execute(query)
         return result.scalars().all()
 
     async def get_by_location(self, state: str, district: Optional[str] = None) -> List[Market]:
 
-        conditions = [Market.state.ilike(state)]
+        conditions = [func.lower(Market.state) == state.lower()]
         if district:
-            conditions.append(Market.district.ilike(district))
+            conditions.append(func.lower(Market.district) == district.lower())
         
         query = select(Market).where(and_(*conditions))
         result = await self.db.execute(query)
@@ -172,7 +240,7 @@ class MarketPriceRepository(BaseRepository):
             and_(
                 MarketPrice.commodity_id == commodity_id,
                 MarketPrice.market_id == market_id,
-                MarketPrice.date == datetime.strptime(date, "%Y-%m-%d").date(),
+                MarketPrice.date == parse_date(date),
             )
         )
         result = await self.db.execute(query)
@@ -217,23 +285,126 @@ class MarketPriceRepository(BaseRepository):
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def get_export_rows(
+        self,
+        commodity_ids: List[int],
+        market_ids: List[int],
+        days: int = 30,
+    ) -> List[Any]:
+
+        start_date = (get_current_timestamp() - timedelta(days=days)).date()
+        
+        query = (
+            select(
+                MarketPrice.date,
+                MarketPrice.commodity_id,
+                MarketPrice.market_id,
+                MarketPrice.min_price,
+                MarketPrice.max_price,
+                MarketPrice.modal_price,
+            )
+            .where(
+                and_(
+                    MarketPrice.commodity_id.in_(commodity_ids),
+                    MarketPrice.market_id.in_(market_ids),
+                    MarketPrice.date >= start_date,
+                )
+            )
+            .order_by(desc(MarketPrice.date), MarketPrice.commodity_id, MarketPrice.market_id)
+        )
+        result = await self.db.execute(query)
+        return result.all()
+
     async def get_market_prices(self, market_id: int, date: Optional[str] = None) -> List[MarketPrice]:
 
         query = select(MarketPrice).where(MarketPrice.market_id == market_id)
         
         if date:
-            target_date = datetime.strptime(date, "%Y-%m-%d").date()
+            target_date = parse_date(date)
             query = query.where(MarketPrice.date == target_date)
         
         result = await self.db.execute(query)
         return result.scalars().all()
 
-    async def bulk_create(self, prices: List[dict]) -> List[MarketPrice]:
+    async def bulk_create(self, prices: List[dict]) -> int:
+
+        page_size = settings.db_insert_page_size
+        for start in range(0, len(prices), page_size):
+            await self.db.execute(insert(MarketPrice), prices[start:start + page_size])
+        return len(prices)
+
+    async def bulk_upsert_prices(self, prices: List[dict]) -> int:
+
+        rows = {}
+        for price in prices:
+            price_date = price["date"]
+            if isinstance(price_date, str):
+                price_date = parse_date(price_date)
+            row = {
+                "commodity_id": price["commodity_id"],
+                "market_id": price["market_id"],
+                "date": price_date,
+            }
+            for field in PRICE_FIELDS:
+                row[field] = price.get(field)
+            rows[(row["commodity_id"], row["market_id"], price_date)] = row
+
+        values = list(rows.values())
+        dialect_insert = UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if dialect_insert is None:
+            for row in values:
+                await self.create_or_update_price(row)
+            return len(values)
+
+        # price is NOT NULL, so rows without one insert 0.0; they use a statement
+        # that leaves an existing price alone, as create_or_update_price does
+        priced = [row for row in values if row["price"] is not None]
+        unpriced = [{**row, "price": 0.0} for row in values if row["price"] is None]
+
+        page_size = settings.db_insert_page_size
+        for batch, update_price in ((priced, True), (unpriced, False)):
+            if not batch:
+                continue
+            stmt = dialect_insert(MarketPrice)
+            update_fields = {
+                field: func.coalesce(getattr(stmt.excluded, field), getattr(MarketPrice, field))
+                for field in PRICE_FIELDS
+                if update_price or field != "price"
+            }
+            update_fields["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["commodity_id", "market_id", "date"],
+                set_=update_fields,
+            )
+            for start in range(0, len(batch), page_size):
+                await self.db.execute(stmt, batch[start:start + page_size])
+        return len(values)
 
-        instances = [MarketPrice(**price) for price in prices]
-        self.db.add_all(instances)
-        await self.db.flush()
-        return instances
+    async def get_latest_covered_date(
+        self,
+        commodity_names: Sequence[str],
+        market_names: Sequence[str],
+    ) -> Optional[date_type]:
+
+        # The oldest of the per-pair latest dates, so one pair refreshed by a
+        # live scrape does not hide gaps in the others; None until every
+        # commodity/market pair has at least one stored price
+        latest = (
+            select(func.max(MarketPrice.date).label("latest"))
+            .join(Commodity, Commodity.id == MarketPrice.commodity_id)
+            .join(Market, Market.id == MarketPrice.market_id)
+            .where(
+                func.lower(Commodity.name).in_([name.lower() for name in commodity_names]),
+                func.lower(Market.name).in_([name.lower() for name in market_names]),
+            )
+            .group_by(MarketPrice.commodity_id, MarketPrice.market_id)
+            .subquery()
+        )
+        result = await self.db.execute(select(func.count(), func.min(latest.c.latest)))
+        pairs, oldest = result.one()
+        if pairs < len(commodity_names) * len(market_names):
+            return None
+        return oldest
 
     async def get_recent_prices(self, days: int = 90) -> List[MarketPrice]:
 
@@ -246,6 +417,28 @@ class MarketPriceRepository(BaseRepository):
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def get_recent_price_rows(self, days: int = 90) -> List[Any]:
+
+        # Plain column rows for bulk analytics: no ORM identity map or
+        # relationship loads for what becomes a DataFrame
+        cutoff_date = (get_current_timestamp() - timedelta(days=days)).date()
+        query = (
+            select(
+                Commodity.name.label("commodity"),
+                Market.name.label("market"),
+                Market.state.label("state"),
+                MarketPrice.date,
+                func.coalesce(func.nullif(MarketPrice.modal_price, 0), MarketPrice.price).label("price"),
+                MarketPrice.arrival,
+            )
+            .join(Commodity, MarketPrice.commodity_id == Commodity.id)
+            .join(Market, MarketPrice.market_id == Market.id)
+            .where(MarketPrice.date >= cutoff_date)
+            .order_by(MarketPrice.date)
+        )
+        result = await self.db.execute(query)
+        return result.all()
+
     async def create_or_update_price(self, price_data: dict) -> Optional[MarketPrice]:
 
         commodity_id = price_data.get("commodity_id")
@@ -257,7 +450,7 @@ class MarketPriceRepository(BaseRepository):
             return None
 
         if isinstance(date_value, str):
-            price_date = datetime.strptime(date_value, "%Y-%m-%d").date()
+            price_date = parse_date(date_value)
         else:
             price_date = date_value
 
@@ -272,7 +465,7 @@ class MarketPriceRepository(BaseRepository):
         existing = result.scalar()
 
         if existing:
-            for field in ["price", "min_price", "max_price", "modal_price", "arrival"]:
+            for field in PRICE_FIELDS:
                 if field in price_data and price_data.get(field) is not None:
                     setattr(existing, field, price_data[field])
             await self.db.flush()
@@ -282,7 +475,7 @@ class MarketPriceRepository(BaseRepository):
             commodity_id=commodity_id,
             market_id=market_id,
             date=price_date,
-            price=price_data.get("price", 0.0),
+            price=price_data.get("price") or 0.0,
             min_price=price_data.get("min_price"),
             max_price=price_data.get("max_price"),
             modal_price=price_data.get("modal_price"),
@@ -363,7 +556,8 @@ class PredictionMetricsRepository(BaseRepository):
 
         query = (
             select(PredictionMetrics)
-            .where(PredictionMetrics.model_name == model_name)
+            .join(Model, PredictionMetrics.model_id == Model.id)
+            .where(Model.name == model_name)
             .order_by(desc(PredictionMetrics.updated_at))
             .limit(1)
         )
@@ -372,10 +566,25 @@ class PredictionMetricsRepository(BaseRepository):
 
     async def get_by_model(self, model_name: str) -> List[PredictionMetrics]:
 
-        query = select(PredictionMetrics).where(PredictionMetrics.model_name == model_name)
+        query = (
+            select(PredictionMetrics)
+            .join(Model, PredictionMetrics.model_id == Model.id)
+            .where(Model.name == model_name)
+        )
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def get_model_id(self, name: str, version: str) -> int:
+
+        query = select(Model.id).where(and_(Model.name == name, Model.version == version))
+        model_id = (await self.db.execute(query)).scalar_one_or_none()
+        if model_id is None:
+            model = Model(name=name, version=version)
+            self.db.add(model)
+            await self.db.flush()
+            model_id = model.id
+        return model_id
+
 class PredictionRepository(BaseRepository):
 
     def __init__(self, db: AsyncSession):
@@ -389,15 +598,15 @@ class PredictionRepository(BaseRepository):
         end_date: str,
     ) -> List[Prediction]:
 
-        start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        start = parse_date(start_date)
+        end = parse_date(end_date) + timedelta(days=1)
         
         query = select(Prediction).where(
             and_(
                 Prediction.commodity_id == commodity_id,
                 Prediction.market_id == market_id,
                 Prediction.prediction_date >= start,
-                Prediction.prediction_date <= end,
+                Prediction.prediction_date < end,
             )
         )
         result = await self.db.execute(query)
@@ -450,13 +659,40 @@ class DiscussionRepository(BaseRepository):
     def __init__(self, db: AsyncSession):
         super().__init__(db, Discussion)
 
+    async def get_commodity_id(self, name: Optional[str]) -> Optional[int]:
+
+        if not name:
+            return None
+        result = await self.db.execute(
+            select(Commodity.id).where(func.lower(Commodity.name) == name.lower()).limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_market_id(self, name: Optional[str]) -> Optional[int]:
+
+        if not name:
+            return None
+        result = await self.db.execute(
+            select(Market.id).where(func.lower(Market.name) == name.lower()).limit(1)
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_commodity(
         self, commodity: str, skip: int = 0, limit: int = 50, status: str = "PUBLISHED"
     ) -> List[Discussion]:
 
+        commodity_id = await self.get_commodity_id(commodity)
+        # Discussions filed before the commodity entered the catalogue keep a
+        # NULL commodity_id and still match by name
+        commodity_filter = Discussion.commodity == commodity
+        if commodity_id is not None:
+            commodity_filter = or_(
+                Discussion.commodity_id == commodity_id,
+                and_(Discussion.commodity_id.is_(None), commodity_filter),
+            )
         query = (
             select(Discussion)
-            .where(and_(Discussion.commodity == commodity, Discussion.status == status))
+            .where(and_(commodity_filter, Discussion.status == status))
             .order_by(desc(Discussion.created_at))
             .offset(skip)
             .limit(limit)
@@ -489,21 +725,24 @@ class DiscussionRepository(BaseRepository):
 
     async def search(self, query_str: str, skip: int = 0, limit: int = 50) -> List[Discussion]:
 
-        query = (
-            select(Discussion)
-            .where(
-                and_(
-                    or_(
-                        Discussion.title.ilike(f"%{query_str}%"),
-                        Discussion.content.ilike(f"%{query_str}%"),
-                    ),
-                    Discussion.status == "PUBLISHED",
-                )
+        query = select(Discussion).where(Discussion.status == "PUBLISHED")
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Served by the ix_discussion_search_gin expression index
+            ts_query = func.websearch_to_tsquery(literal_column("'english'"), query_str)
+            query = query.where(DISCUSSION_SEARCH_DOCUMENT.op("@@")(ts_query)).order_by(
+                desc(func.ts_rank(DISCUSSION_SEARCH_DOCUMENT, ts_query)),
+                desc(Discussion.created_at),
             )
-            .order_by(desc(Discussion.created_at))
-            .offset(skip)
-            .limit(limit)
-        )
+        else:
+            query = query.where(
+                or_(
+                    Discussion.title.ilike(f"%{query_str}%"),
+                    Discussion.content.ilike(f"%{query_str}%"),
+                )
+            ).order_by(desc(Discussion.created_at))
+
+        query = query.offset(skip).limit(limit)
         result = await self.db.execute(query)
         return result.scalars().all()
 
@@ -631,7 +870,7 @@ class MarketTrendAnalysisRepository(BaseRepository):
                     MarketTrendAnalysis.market_id == market_id,
                     MarketTrendAnalysis.period_days == period_days,
                     MarketTrendAnalysis.analysis_date >= start_date,
-                    MarketTrendAnalysis.analysis_date <= end_date,
+                    MarketTrendAnalysis.analysis_date < end_date + timedelta(days=1),
                 )
             )
             .order_by(MarketTrendAnalysis.analysis_date)
@@ -161,23 +161,23 @@ class SellingStrategyEngine:
         self, commodity_id: int, market_id: Optional[int] = None, days: int = 180
     ) -> List[Dict]:
         """Fetch historical price data"""
-        query = self.db.query(MarketPrice).filter(
+        query = self.db.query(MarketPrice.date, MarketPrice.price, MarketPrice.arrival).filter(
             MarketPrice.commodity_id == commodity_id,
-            MarketPrice.date >= datetime.now() - timedelta(days=days)
+            MarketPrice.date >= (datetime.now() - timedelta(days=days)).date()
         )
         
         if market_id:
             query = query.filter(MarketPrice.market_id == market_id)
         
-        prices = query.order_by(MarketPrice.date).all()
+        rows = query.order_by(MarketPrice.date).all()
         
         return [
             {
-                'date': p.date,
-                'price': p.price,
-                'arrival': p.arrival or 0,
+                'date': row.date,
+                'price': row.price,
+                'arrival': row.arrival or 0,
             }
-            for p in prices
+            for row in rows
         ]
     
     def _get_seasonal_pattern(self, commodity_id: int) -> List[SeasonalPricePattern]:
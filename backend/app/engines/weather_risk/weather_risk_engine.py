@@ -4,6 +4,9 @@ from typing import List
 from ...services.weather.weather_service import WeatherService
 import re
 
+# "lat,lon" coordinate strings accepted in place of a city name
+COORDINATES_PATTERN = re.compile(r"^-?\d+\.?\d*,-?\d+\.?\d*$")
+
 
 class WeatherRiskEngine:
     # Simple city coordinates mapping for major Indian cities
@@ -26,7 +29,7 @@ class WeatherRiskEngine:
 
     def _parse_location(self, location: str):
         # Check if it's coordinates (lat,lon format)
-        if re.match(r"^-?\d+\.?\d*,-?\d+\.?\d*$", location):
+        if COORDINATES_PATTERN.match(location):
             lat, lon = map(float, location.split(","))
             return lat, lon
         
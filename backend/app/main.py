@@ -1,22 +1,26 @@
 
-import time
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from loguru import logger
 
 from app import __version__
+from app.api.dependencies import get_forecast_batcher, get_predictor
 from app.api.frontend import router as frontend_router
 from app.api.v1.router import api_router
 from app.config import settings
+from app.core.cache import close_cache, start_invalidation_listener
 from app.core.exceptions import AgriTechException
+from app.core.middleware import TimingMiddleware
+from app.core.responses import ORJSONResponse
 from app.core.logging_config import setup_logging
 from app.core.utils import get_current_timestamp
 from app.services.scheduler import get_scheduler
+from app.services.weather_service import close_weather_service
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -24,19 +28,31 @@ async def lifespan(app: FastAPI):
     logger.info(f"{settings.app_name} v{settings.app_version} starting up")
     logger.info(f"Running in {settings.environment} mode")
     
+    start_invalidation_listener()
+
     import os
     if os.getenv("TESTING") != "1":
+        await run_in_threadpool(get_predictor)
+        logger.info("ML models preloaded at startup")
+        batcher = get_forecast_batcher()
+        batcher.start()
+
         scheduler = get_scheduler()
         scheduler.start()
         logger.info("Background data collection and training scheduler activated")
     else:
         logger.info("Scheduler disabled during testing")
         scheduler = None
+        batcher = None
     
     yield
     
     if scheduler:
         scheduler.stop()
+    if batcher:
+        await batcher.stop()
+    await close_weather_service()
+    await close_cache()
     logger.info(f"{settings.app_name} shutting down gracefully")
 
 app = FastAPI(
@@ -46,6 +62,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -57,24 +74,7 @@ app.add_middleware(
     allow_headers=settings.cors_allow_headers,
 )
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    
-    try:
-        logger.opt(lazy=True).info(
-            f"{request.method} {request.url.path} completed in {process_time:.3f}s with status {response.status_code}"
-        )
-    except Exception:
-        pass
-    
-    response.headers["X-Process-Time"] = str(process_time)
-    response.headers["X-API-Version"] = settings.app_version
-    
-    return response
+app.add_middleware(TimingMiddleware)
 
 @app.exception_handler(AgriTechException)
 async def agritech_exception_handler(request: Request, exc: AgriTechException):
@@ -84,13 +84,14 @@ async def agritech_exception_handler(request: Request, exc: AgriTechException):
         extra={"status": exc.status_code, "details": exc.details}
     )
     
-    return JSONResponse(
+    # orjson writes the datetime as the same ISO 8601 text isoformat() would
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.__class__.__name__,
             "message": exc.message,
             "details": exc.details,
-            "timestamp": get_current_timestamp().isoformat(),
+            "timestamp": get_current_timestamp(),
         }
     )
 
@@ -105,13 +106,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "ValidationError",
             "message": "Request validation failed",
             "details": {"errors": exc.errors()},
-            "timestamp": get_current_timestamp().isoformat(),
+            "timestamp": get_current_timestamp(),
         }
     )
 
@@ -126,27 +127,29 @@ async def general_exception_handler(request: Request, exc: Exception):
         }
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "InternalServerError",
             "message": "An unexpected error occurred",
             "details": {"error": str(exc)} if settings.debug else {},
-            "timestamp": get_current_timestamp().isoformat(),
+            "timestamp": get_current_timestamp(),
         }
     )
 
+# Everything but the timestamp is fixed for the life of the process
+ROOT_PAYLOAD = {
+    "name": settings.app_name,
+    "version": settings.app_version,
+    "status": "running",
+    "docs": "/docs",
+    "redoc": "/redoc",
+}
+
 @app.get("/", tags=["Root"])
 async def root() -> dict[str, Any]:
 
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "status": "running",
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "timestamp": get_current_timestamp().isoformat(),
-    }
+    return {**ROOT_PAYLOAD, "timestamp": get_current_timestamp().isoformat()}
 
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 app.include_router(frontend_router, prefix="/api")
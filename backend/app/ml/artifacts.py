@@ -0,0 +1,109 @@
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+
+# Header of artifacts written by dump_artifact(); anything else is a legacy
+# joblib file. Layout: magic, (meta length, body length), pickled buffer spans,
+# the protocol 5 pickle itself, then the raw out-of-band buffers.
+ARTIFACT_MAGIC = b"VYOOB5\x00\x00"
+_LENGTHS = struct.Struct("<QQ")
+_ALIGNMENT = 64
+
+# Buffers are mapped read-only, so their pages are shared by every worker that
+# loads the same artifact. Anything under a page is cheaper to keep in the pickle.
+# scikit-learn trees copy their node arrays in Tree.__setstate__ and so are never
+# shared this way; arrays kept as plain attributes (SVR/GPR training data,
+# coefficient vectors) are.
+OUT_OF_BAND_MIN_BYTES = mmap.PAGESIZE
+
+
+def _aligned(offset: int) -> int:
+
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def dump_artifact(obj: Any, path) -> str:
+
+    buffers: List[pickle.PickleBuffer] = []
+
+    def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+        # A true return value tells pickle to serialize the buffer in-band
+        if buffer.raw().nbytes < OUT_OF_BAND_MIN_BYTES:
+            return True
+        buffers.append(buffer)
+        return False
+
+    body = pickle.dumps(obj, protocol=5, buffer_callback=buffer_callback)
+
+    spans: List[Tuple[int, int]] = []
+    offset = 0
+    for buffer in buffers:
+        length = buffer.raw().nbytes
+        spans.append((offset, length))
+        offset = _aligned(offset + length)
+
+    meta = pickle.dumps(spans, protocol=5)
+    header_length = len(ARTIFACT_MAGIC) + _LENGTHS.size + len(meta) + len(body)
+    data_start = _aligned(header_length)
+
+    # Written next to the target and renamed over it, so a reader polling the
+    # model directory never opens a half-written artifact
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as f:
+        try:
+            f.write(ARTIFACT_MAGIC)
+            f.write(_LENGTHS.pack(len(meta), len(body)))
+            f.write(meta)
+            f.write(body)
+            for buffer, (start, _) in zip(buffers, spans):
+                f.write(b"\x00" * (data_start + start - f.tell()))
+                f.write(buffer.raw())
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+
+    os.replace(f.name, path)
+    return str(path)
+
+
+def is_out_of_band_artifact(path) -> bool:
+
+    with open(path, "rb") as f:
+        return f.read(len(ARTIFACT_MAGIC)) == ARTIFACT_MAGIC
+
+
+def _load_out_of_band(path) -> Any:
+
+    with open(path, "rb") as f:
+        f.seek(len(ARTIFACT_MAGIC))
+        meta_length, body_length = _LENGTHS.unpack(f.read(_LENGTHS.size))
+        spans = pickle.loads(f.read(meta_length))
+        body = f.read(body_length)
+        data_start = _aligned(f.tell())
+
+        if not spans:
+            return pickle.loads(body)
+
+        # Buffers are handed to numpy as views of the mapping, not copies; the
+        # mapping stays open for as long as an array still references it
+        view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    buffers = [view[data_start + start:data_start + start + length] for start, length in spans]
+    return pickle.loads(body, buffers=buffers)
+
+
+def load_artifact(path, mmap_mode: Optional[str] = None) -> Any:
+
+    if is_out_of_band_artifact(path):
+        return _load_out_of_band(path)
+
+    import joblib
+
+    return joblib.load(path, mmap_mode=mmap_mode)
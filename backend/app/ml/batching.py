@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.config import settings
+from app.ml.predictor import AgriculturalPredictor
+
+class ForecastBatcher:
+
+    def __init__(self, predictor: AgriculturalPredictor, max_batch: int):
+
+        self.predictor = predictor
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+
+        if self._task is not None:
+            return
+
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(), name="forecast-batcher")
+        logger.info(f"Forecast batcher started (max {self.max_batch} requests per pass)")
+
+    async def stop(self) -> None:
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def predict_horizon(self, *horizon) -> List[Dict[str, Any]]:
+
+        # Without the background task (tests, scripts) requests go straight
+        # to the predictor
+        if self._task is None:
+            return await self.predictor.predict_horizon_async(*horizon)
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((horizon, future))
+        return await asyncio.wait_for(future, timeout=settings.prediction_timeout_seconds)
+
+    async def _run(self) -> None:
+
+        while True:
+            batch: List[Tuple[tuple, asyncio.Future]] = [await self._queue.get()]
+
+            # Requests that queued up while the previous pass ran go out
+            # together; a lone request on an idle batcher is sent immediately
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            # Callers that timed out have already cancelled their futures
+            batch = [(horizon, future) for horizon, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                results = await self.predictor.predict_horizons_async([horizon for horizon, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
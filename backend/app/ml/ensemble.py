@@ -1,223 +1,403 @@
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, NamedTuple, Tuple, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import pandas as pd
 from loguru import logger
 from pathlib import Path
-import joblib
+import functools
+import importlib
 import inspect
+import os
+import threading
+import time
 
 from app.config import settings
+from app.ml.artifacts import load_artifact
+
+MODEL_DIR: Path = Path(settings.model_dir).resolve()
+
+# Model arrays are memory-mapped from the artifact instead of copied into the
+# heap, so pages load on demand and are shared between worker processes. An
+# artifact must stay on disk while a process still uses models loaded from it;
+# training scripts always write new timestamped files, so this holds.
+ARTIFACT_MMAP_MODE = 'r'
+
+# Loaded artifacts kept per manager, keyed by (path, mtime_ns, size); enough for
+# the current and previous ensemble plus a preprocessor and per-model files
+ARTIFACT_CACHE_SIZE = 8
+
+MODEL_TYPES = ['random_forest', 'gradient_boosting', 'xgboost', 'lightgbm', 'catboost', 'svm', 'gpr']
+
+# File name prefixes tracked by one directory scan; 'ensemble_' also matches tuned files
+ARTIFACT_PREFIXES = ('ensemble_tuned_', 'ensemble_', 'preprocessor_') + tuple(f"{t}_" for t in MODEL_TYPES)
+
+# sklearn / XGBoost / LightGBM / CatBoost predict() release the GIL, so the
+# ensemble members run concurrently; shared by every EnsembleManager
+_model_executor = ThreadPoolExecutor(
+    max_workers=settings.ensemble_max_workers,
+    thread_name_prefix="ensemble-pred",
+)
 
 def _apply_sklearn_compat_shims() -> None:
 
+    # Deferred to the first model load: importing scikit-learn pulls in pandas and
+    # dominates the import time of this module
     try:
         import sklearn.utils.validation as suv
-        import sklearn.utils as su
+
+        if getattr(suv, '_vyapar_shim_applied', False):
+            return
+        suv._vyapar_shim_applied = True
 
         original_check_array = suv.check_array
         original_check_x_y = suv.check_X_y
 
-        def check_array_compat(*args, force_all_finite=True, **kwargs):
-            kwargs['ensure_all_finite'] = force_all_finite
+        # scikit-learn < 1.8 still accepts force_all_finite itself
+        if 'force_all_finite' in inspect.signature(original_check_array).parameters:
+            return
+
+        @functools.wraps(original_check_array)
+        def check_array_compat(*args, **kwargs):
+            if 'force_all_finite' in kwargs:
+                kwargs.setdefault('ensure_all_finite', kwargs.pop('force_all_finite'))
             return original_check_array(*args, **kwargs)
 
-        def check_x_y_compat(*args, force_all_finite=True, **kwargs):
-            kwargs['ensure_all_finite'] = force_all_finite
+        @functools.wraps(original_check_x_y)
+        def check_x_y_compat(*args, **kwargs):
+            if 'force_all_finite' in kwargs:
+                kwargs.setdefault('ensure_all_finite', kwargs.pop('force_all_finite'))
             return original_check_x_y(*args, **kwargs)
 
-        suv.check_array = check_array_compat
-        su.check_array = check_array_compat
-        suv.check_X_y = check_x_y_compat
-        su.check_X_y = check_x_y_compat
-
-        try:
-            import lightgbm.sklearn as lgb_sklearn
-            lgb_sklearn.check_array = check_array_compat
-            lgb_sklearn.check_X_y = check_x_y_compat
-        except Exception:
-            pass
+        # Only older LightGBM releases still pass force_all_finite; scikit-learn's
+        # own estimators keep calling the unwrapped functions on their predict path
+        for module_name in ('lightgbm.compat', 'lightgbm.sklearn'):
+            try:
+                module = importlib.import_module(module_name)
+            except Exception:
+                continue
+            if hasattr(module, 'check_array'):
+                module.check_array = check_array_compat
+            if hasattr(module, 'check_X_y'):
+                module.check_X_y = check_x_y_compat
 
     except Exception as exc:
         logger.warning(f"Could not apply sklearn compatibility shim: {exc}")
 
-_apply_sklearn_compat_shims()
+class _Snapshot(NamedTuple):
+
+    # Everything a prediction reads, published with a single assignment; the
+    # dense weights follow the order of items so the weighted average is one
+    # dot product
+    items: Tuple[Tuple[str, Any], ...]
+    names: Tuple[str, ...]
+    weights_vec: np.ndarray
+    weights: Dict[str, float]
+
+_EMPTY_SNAPSHOT = _Snapshot((), (), np.empty(0, dtype=np.float64), {})
 
 class EnsembleManager:
 
     def __init__(self):
 
-        _apply_sklearn_compat_shims()
         self.models: Dict[str, Any] = {}
         self.model_weights: Dict[str, float] = {}
+        self._snapshot = _EMPTY_SNAPSHOT
+        self._scratch = threading.local()
         self.ensemble_type = 'weighted_average'
         self.preprocessor = None
-        self.model_dir = Path(settings.model_dir)
+        self.model_dir = MODEL_DIR
         self.latest_artifact_mtime: Optional[float] = None
+        self._model_dir_mtime: Optional[int] = None
+        self._latest_ensemble_file: Optional[Path] = None
+        self._artifact_cache: OrderedDict[Tuple[str, int, int], Any] = OrderedDict()
+        self._preproc_key: Optional[Tuple[str, int, int]] = None
+        self._last_refresh_check: Optional[float] = None
+        self._last_refresh_source: Optional[Tuple[str, int, int]] = None
+        # Serializes reloads; predictions keep reading the previously published models
+        self._reload_lock = threading.RLock()
+        self.refresh_min_interval = settings.model_refresh_min_interval_seconds
         self.latest_artifact_name: Optional[str] = None
 
         logger.info("Initialized EnsembleManager")
 
+    @staticmethod
+    def _artifact_key(path: str) -> Tuple[str, int, int]:
+
+        stat = os.stat(path)
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def _cached_load(self, path: str, mmap_mode: Optional[str] = ARTIFACT_MMAP_MODE) -> Any:
+
+        key = self._artifact_key(path)
+
+        if key in self._artifact_cache:
+            self._artifact_cache.move_to_end(key)
+            return self._artifact_cache[key]
+
+        artifact = load_artifact(path, mmap_mode=mmap_mode)
+        self._artifact_cache[key] = artifact
+        if len(self._artifact_cache) > ARTIFACT_CACHE_SIZE:
+            self._artifact_cache.popitem(last=False)
+        return artifact
+
     def load_models(
         self, model_paths: Dict[str, str], preprocessor_path: str = None
     ) -> None:
 
-        for model_name, path in model_paths.items():
-            try:
-                model = joblib.load(path)
-                self.models[model_name] = model
-                logger.info(f"Loaded model: {model_name} from {path}")
-            except Exception as e:
-                logger.error(f"Failed to load {model_name}: {e}")
+        _apply_sklearn_compat_shims()
 
-        if preprocessor_path:
-            try:
-                self.preprocessor = joblib.load(preprocessor_path)
-                logger.info(f"Loaded preprocessor from {preprocessor_path}")
-            except Exception as e:
-                logger.error(f"Failed to load preprocessor: {e}")
+        with self._reload_lock:
+            models = dict(self.models)
+            for model_name, path in model_paths.items():
+                try:
+                    models[model_name] = self._cached_load(path)
+                    logger.info(f"Loaded model: {model_name} from {path}")
+                except Exception as e:
+                    logger.error(f"Failed to load {model_name}: {e}")
+
+            if preprocessor_path:
+                try:
+                    self.preprocessor = self._cached_load(preprocessor_path, mmap_mode=None)
+                    logger.info(f"Loaded preprocessor from {preprocessor_path}")
+                except Exception as e:
+                    logger.error(f"Failed to load preprocessor: {e}")
 
+            self._publish(self._validate_models(models), self.model_weights)
         logger.info(f"Loaded {len(self.models)} models for ensemble")
 
     def load_latest_models(self) -> None:
 
+        _apply_sklearn_compat_shims()
+
         if not self.model_dir.exists():
             logger.error(f"Model directory not found: {self.model_dir}")
             return
 
-        tuned_files = list(self.model_dir.glob("ensemble_tuned_*.joblib"))
-        loaded_from_ensemble = False
-        if tuned_files:
-            latest_tuned = max(tuned_files, key=lambda p: p.stat().st_mtime)
+        with self._reload_lock:
+            self._load_latest_models()
+
+    def _load_latest_models(self) -> None:
+
+        artifacts = self._scan_artifacts()
+
+        # Assembled off to the side and published in one step, so concurrent
+        # predictions never see a partially loaded ensemble
+        models: Dict[str, Any] = {}
+        weights = self.model_weights
+
+        for prefix, model_names in (
+            ('ensemble_tuned_', ['random_forest', 'gradient_boosting', 'xgboost', 'lightgbm', 'catboost']),
+            ('ensemble_', MODEL_TYPES),
+        ):
+            if prefix not in artifacts:
+                continue
+            latest_ensemble, latest_mtime = artifacts[prefix]
             try:
-                ensemble_data = joblib.load(str(latest_tuned))
-                if isinstance(ensemble_data, dict):
-                    for model_name in ['random_forest', 'gradient_boosting', 'xgboost', 'lightgbm', 'catboost']:
-                        if model_name in ensemble_data:
-                            self.models[model_name] = ensemble_data[model_name]
-                    self.artifact_info = ensemble_data
-                    if 'model_weights' in ensemble_data and isinstance(ensemble_data['model_weights'], dict):
-                        self.model_weights = ensemble_data['model_weights']
-                    self.model_version = str(ensemble_data.get('timestamp', latest_tuned.stem))
-                    self.latest_artifact_mtime = latest_tuned.stat().st_mtime
-                    self.latest_artifact_name = latest_tuned.name
-                    loaded_from_ensemble = True
-                    logger.info(f"Loaded tuned ensemble: {latest_tuned.name} with {len(self.models)} models")
+                ensemble_data = self._cached_load(str(latest_ensemble))
             except Exception as e:
-                logger.error(f"Failed to load tuned ensemble: {e}")
-
-        if not loaded_from_ensemble:
-            ensemble_files = list(self.model_dir.glob("ensemble_*.joblib"))
-            if ensemble_files:
-                latest_ensemble = max(ensemble_files, key=lambda p: p.stat().st_mtime)
+                logger.error(f"Failed to load {prefix.rstrip('_')} ensemble: {e}")
+                continue
+            if not isinstance(ensemble_data, dict):
+                continue
+
+            for model_name in model_names:
+                if model_name in ensemble_data:
+                    models[model_name] = ensemble_data[model_name]
+            self.artifact_info = ensemble_data
+            if 'model_weights' in ensemble_data and isinstance(ensemble_data['model_weights'], dict):
+                weights = ensemble_data['model_weights']
+            self.model_version = str(ensemble_data.get('timestamp', latest_ensemble.stem))
+            self.latest_artifact_mtime = latest_mtime
+            self.latest_artifact_name = latest_ensemble.name
+            logger.info(f"Loaded ensemble: {latest_ensemble.name} with {len(models)} models")
+            break
+
+        if not models:
+            for model_type in MODEL_TYPES:
+                if f"{model_type}_" not in artifacts:
+                    continue
+                path = str(artifacts[f"{model_type}_"][0])
                 try:
-                    ensemble_data = joblib.load(str(latest_ensemble))
-                    if isinstance(ensemble_data, dict):
-                        for model_name in ['random_forest', 'gradient_boosting', 'xgboost', 'lightgbm', 'catboost', 'svm', 'gpr']:
-                            if model_name in ensemble_data:
-                                self.models[model_name] = ensemble_data[model_name]
-                        self.artifact_info = ensemble_data
-                        if 'model_weights' in ensemble_data and isinstance(ensemble_data['model_weights'], dict):
-                            self.model_weights = ensemble_data['model_weights']
-                        self.model_version = str(ensemble_data.get('timestamp', latest_ensemble.stem))
-                        self.latest_artifact_mtime = latest_ensemble.stat().st_mtime
-                        self.latest_artifact_name = latest_ensemble.name
-                        loaded_from_ensemble = True
-                        logger.info(f"Loaded ensemble: {latest_ensemble.name} with {len(self.models)} models")
+                    models[model_type] = self._cached_load(path)
+                    logger.info(f"Loaded model: {model_type} from {path}")
                 except Exception as e:
-                    logger.error(f"Failed to load ensemble: {e}")
-
-        if not self.models:
-            model_types = ['random_forest', 'gradient_boosting', 'xgboost', 'lightgbm', 'catboost', 'svm', 'gpr']
-            model_paths = {}
-
-            for model_type in model_types:
-                pattern = f"{model_type}_*.joblib"
-                matching_files = list(self.model_dir.glob(pattern))
-
-                if matching_files:
-                    latest_model = max(matching_files, key=lambda p: p.stat().st_mtime)
-                    model_paths[model_type] = str(latest_model)
-
-            if model_paths:
-                for model_name, path in model_paths.items():
-                    try:
-                        model = joblib.load(path)
-                        self.models[model_name] = model
-                        logger.info(f"Loaded model: {model_name} from {path}")
-                    except Exception as e:
-                        logger.error(f"Failed to load {model_name}: {e}")
-
-        preprocessor_files = list(self.model_dir.glob("preprocessor_*.joblib"))
-        preprocessor_path = None
-        if preprocessor_files:
-            preprocessor_path = str(max(preprocessor_files, key=lambda p: p.stat().st_mtime))
-            try:
-                preprocessor_data = joblib.load(preprocessor_path)
-                if isinstance(preprocessor_data, dict):
-                    self.preprocessor = preprocessor_data.get('preprocessor', preprocessor_data)
-                    self.feature_cols = preprocessor_data.get('feature_cols', None)
-                    # Set feature names on the preprocessor object
-                    if self.preprocessor and hasattr(self.preprocessor, 'feature_names'):
-                        feature_names = preprocessor_data.get('feature_names', preprocessor_data.get('feature_cols', []))
-                        if feature_names:
-                            self.preprocessor.feature_names = feature_names
-                            self.preprocessor.numeric_features = preprocessor_data.get('numeric_features', feature_names)
-                            self.preprocessor.categorical_features = preprocessor_data.get('categorical_features', [])
-                else:
-                    self.preprocessor = preprocessor_data
-                logger.info(f"Loaded preprocessor from {preprocessor_path}")
-            except Exception as e:
-                logger.error(f"Failed to load preprocessor: {e}")
+                    logger.error(f"Failed to load {model_type}: {e}")
+
+        if 'preprocessor_' in artifacts:
+            self._load_preprocessor(str(artifacts['preprocessor_'][0]))
 
-        if self.models:
-            if not self.model_weights:
-                self.set_equal_weights()
-            logger.info(f"Loaded {len(self.models)} models for ensemble")
+        models = self._validate_models(models)
+
+        if models:
+            if not weights:
+                weights = {model_name: 1.0 / len(models) for model_name in models}
+            self._publish(models, weights)
+            logger.info(f"Loaded {len(models)} models for ensemble")
         else:
             logger.warning("No trained models found in model directory")
 
+    def _load_preprocessor(self, preprocessor_path: str) -> None:
+
+        try:
+            preprocessor_key = self._artifact_key(preprocessor_path)
+            # Unchanged file: keep the preprocessor and feature names already set up
+            if preprocessor_key == self._preproc_key and self.preprocessor is not None:
+                return
+
+            preprocessor_data = self._cached_load(preprocessor_path, mmap_mode=None)
+            if isinstance(preprocessor_data, dict):
+                self.preprocessor = preprocessor_data.get('preprocessor', preprocessor_data)
+                self.feature_cols = preprocessor_data.get('feature_cols', None)
+                # Set feature names on the preprocessor object
+                if self.preprocessor and hasattr(self.preprocessor, 'feature_names'):
+                    feature_names = preprocessor_data.get('feature_names', preprocessor_data.get('feature_cols', []))
+                    if feature_names:
+                        self.preprocessor.feature_names = feature_names
+                        self.preprocessor.numeric_features = preprocessor_data.get('numeric_features', feature_names)
+                        self.preprocessor.categorical_features = preprocessor_data.get('categorical_features', [])
+            else:
+                self.preprocessor = preprocessor_data
+            self._preproc_key = preprocessor_key
+            logger.info(f"Loaded preprocessor from {preprocessor_path}")
+        except Exception as e:
+            logger.error(f"Failed to load preprocessor: {e}")
+
+    def _validate_models(self, models: Dict[str, Any]) -> Dict[str, Any]:
+
+        feature_names = getattr(self, 'feature_cols', None) or getattr(self.preprocessor, 'feature_names', None)
+
+        # Probe each model once so an estimator that cannot predict (e.g. an
+        # incompatible pickle) is dropped here instead of failing every request
+        valid = {}
+        for model_name, model in models.items():
+            n_features = len(feature_names) if feature_names else getattr(model, 'n_features_in_', None)
+            if n_features:
+                try:
+                    model.predict(np.zeros((1, n_features)))
+                except Exception as e:
+                    logger.error(f"Dropping {model_name} from ensemble, probe prediction failed: {e}")
+                    continue
+            valid[model_name] = model
+        return valid
+
+    def _publish(self, models: Dict[str, Any], weights: Dict[str, float]) -> None:
+
+        if not weights and models:
+            weights = {model_name: 1.0 / len(models) for model_name in models}
+
+        names = tuple(models)
+        weights_vec = np.fromiter(
+            (weights.get(name, 0.0) for name in names), dtype=np.float64, count=len(names)
+        )
+        weights_vec.flags.writeable = False
+
+        # Predictions read only the snapshot, so this assignment is the swap;
+        # models and model_weights are kept for status reporting
+        self._snapshot = _Snapshot(tuple(models.items()), names, weights_vec, weights)
+        self.model_weights = weights
+        self.models = models
+
     def set_model_weights(self, weights: Dict[str, float]) -> None:
 
-        total_weight = sum(weights.values())
-        self.model_weights = {
-            model: weight / total_weight for model, weight in weights.items()
-        }
+        names = list(weights)
+        values = np.fromiter((weights[name] for name in names), dtype=np.float64, count=len(names))
+
+        total_weight = values.sum()
+        if total_weight == 0:
+            raise ValueError("Ensemble weights must not sum to zero")
 
+        values /= total_weight
+        with self._reload_lock:
+            self._publish(self.models, dict(zip(names, values.tolist())))
         logger.info(f"Set ensemble weights: {self.model_weights}")
 
-    def _get_latest_ensemble_file(self) -> Optional[Path]:
+    def _scan_artifacts(self) -> Dict[str, Tuple[Path, float]]:
 
-        tuned_files = list(self.model_dir.glob("ensemble_tuned_*.joblib"))
-        if tuned_files:
-            return max(tuned_files, key=lambda p: p.stat().st_mtime)
+        latest: Dict[str, Tuple[str, float]] = {}
 
-        ensemble_files = list(self.model_dir.glob("ensemble_*.joblib"))
-        if ensemble_files:
-            return max(ensemble_files, key=lambda p: p.stat().st_mtime)
+        # Single pass; DirEntry.stat() reuses the data read while listing
+        with os.scandir(self.model_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".joblib"):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
 
-        return None
+                for prefix in ARTIFACT_PREFIXES:
+                    if entry.name.startswith(prefix) and (prefix not in latest or mtime > latest[prefix][1]):
+                        latest[prefix] = (entry.path, mtime)
+
+        return {prefix: (Path(path), mtime) for prefix, (path, mtime) in latest.items()}
+
+    def _get_latest_ensemble_file(self) -> Optional[Tuple[str, int, int]]:
+
+        try:
+            dir_mtime = self.model_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        # Rescan only when files were added, removed or renamed; the candidate
+        # itself is re-stat'ed every time, as finishing an in-place write
+        # changes its size and mtime but not the directory's
+        if dir_mtime != self._model_dir_mtime:
+            artifacts = self._scan_artifacts()
+            latest = artifacts.get('ensemble_tuned_') or artifacts.get('ensemble_')
+            self._model_dir_mtime = dir_mtime
+            self._latest_ensemble_file = latest[0] if latest else None
+
+        if self._latest_ensemble_file is None:
+            return None
+        try:
+            return self._artifact_key(self._latest_ensemble_file)
+        except OSError:
+            self._model_dir_mtime = None
+            return None
 
     def refresh_if_newer(self) -> None:
 
-        if not self.model_dir.exists():
+        now = time.monotonic()
+        if (
+            self._last_refresh_check is not None
+            and now - self._last_refresh_check < self.refresh_min_interval
+        ):
             return
 
-        latest_file = self._get_latest_ensemble_file()
-        if not latest_file:
+        # Another prediction thread is already checking or reloading; keep
+        # serving the published models instead of waiting for it
+        if not self._reload_lock.acquire(blocking=False):
             return
+        try:
+            self._last_refresh_check = now
+
+            latest = self._get_latest_ensemble_file()
+            # Same path, mtime and size as the last file compared or loaded
+            if not latest or latest == self._last_refresh_source:
+                return
+
+            latest_file = Path(latest[0])
+            if self.latest_artifact_mtime is not None and latest_file.stat().st_mtime <= self.latest_artifact_mtime:
+                self._last_refresh_source = latest
+                return
 
-        latest_mtime = latest_file.stat().st_mtime
-        if self.latest_artifact_mtime is None or latest_mtime > self.latest_artifact_mtime:
             logger.info(f"Detected newer ensemble artifact: {latest_file.name}; reloading")
             self.load_latest_models()
+            # A failed or partial load is retried on the next check
+            if self.latest_artifact_name == latest_file.name:
+                self._last_refresh_source = latest
+        except OSError as e:
+            logger.warning(f"Could not check for newer ensemble artifacts: {e}")
+        finally:
+            self._reload_lock.release()
 
     def set_equal_weights(self) -> None:
 
-        equal_weight = 1.0 / len(self.models) if self.models else 0
-
-        self.model_weights = {model_name: equal_weight for model_name in self.models.keys()}
-
+        with self._reload_lock:
+            models = self.models
+            equal_weight = 1.0 / len(models) if models else 0
+            self._publish(models, {model_name: equal_weight for model_name in models})
         logger.info(f"Set equal ensemble weights: {self.model_weights}")
 
     def set_accuracy_based_weights(self, metrics: Dict[str, Dict[str, float]]) -> None:
@@ -231,96 +411,122 @@ class EnsembleManager:
         self.set_model_weights(weights)
         logger.info("Set accuracy-based ensemble weights")
 
-    def predict_weighted_average(
-        self, features: np.ndarray
-    ) -> Tuple[float, Dict[str, float], Dict[str, float]]:
+    def _as_row(self, features: np.ndarray) -> np.ndarray:
 
-        if not self.models:
-            raise ValueError("No models loaded in ensemble")
+        # Reused C-contiguous float64 (1, n_features) buffer so check_array in the
+        # estimators neither allocates nor casts; per thread, as predictions
+        # run concurrently on the predictor's executor
+        row = getattr(self._scratch, 'row', None)
+        if row is None or row.shape[1] != features.shape[0]:
+            row = np.empty((1, features.shape[0]), dtype=np.float64)
+            self._scratch.row = row
 
-        if len(self.model_weights) == 0:
-            self.set_equal_weights()
+        np.copyto(row[0], features)
+        return row
 
-        individual_predictions = {}
-        weighted_sum = 0
+    def _row_predictions(self, n_models: int) -> np.ndarray:
 
-        for model_name, model in self.models.items():
-            try:
-                if features.ndim == 1:
-                    prediction = model.predict(features.reshape(1, -1))[0]
-                else:
-                    prediction = model.predict(features)
+        # Single-sample results are reduced straight away by the callers and never
+        # returned, so the (n_models, 1) output buffer can be reused as well
+        predictions = getattr(self._scratch, 'predictions', None)
+        if predictions is None or predictions.shape[0] != n_models:
+            predictions = np.empty((n_models, 1), dtype=np.float64)
+            self._scratch.predictions = predictions
+
+        return predictions
+
+    def _predict_all(
+        self, features: np.ndarray, snapshot: Optional[_Snapshot] = None
+    ) -> Tuple[List[str], np.ndarray]:
+
+        items = (snapshot or self._snapshot).items
+
+        if features.ndim == 1:
+            x = self._as_row(features)
+            predictions = self._row_predictions(len(items))
+        else:
+            x = features
+            predictions = np.empty((len(items), x.shape[0]), dtype=np.float64)
 
-                individual_predictions[model_name] = float(prediction)
+        names = []
 
-                weight = self.model_weights.get(model_name, 0)
-                weighted_sum += prediction * weight
+        futures = [
+            (model_name, _model_executor.submit(model.predict, x))
+            for model_name, model in items
+        ]
 
+        for model_name, future in futures:
+            try:
+                predictions[len(names)] = np.ravel(future.result())
+                names.append(model_name)
             except Exception as e:
                 logger.error(f"Error getting prediction from {model_name}: {e}")
-                individual_predictions[model_name] = None
 
-        ensemble_prediction = weighted_sum
+        return names, predictions[:len(names)]
 
-        return ensemble_prediction, individual_predictions, self.model_weights
+    @staticmethod
+    def _confidence(mean: np.ndarray, std: np.ndarray) -> np.ndarray:
 
-    def predict_voting(
+        # Elementwise, so a whole batch is scored without per-sample branches
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cv = np.where(mean != 0, std / (np.abs(mean) + 1e-6), 0.0)
+            return np.where(np.isfinite(cv) & (1.0 + cv != 0), 1.0 / (1.0 + cv), 0.85)
+
+    def predict_weighted_average(
         self, features: np.ndarray
-    ) -> Tuple[float, Dict[str, float], float]:
+    ) -> Tuple[float, Dict[str, float], Dict[str, float]]:
 
-        predictions = []
-        individual_predictions = {}
+        # Read once, so a reload publishing mid-call cannot mix two model sets
+        snapshot = self._snapshot
+        if not snapshot.items:
+            raise ValueError("No models loaded in ensemble")
 
-        for model_name, model in self.models.items():
-            try:
-                if features.ndim == 1:
-                    prediction = model.predict(features.reshape(1, -1))[0]
-                else:
-                    prediction = model.predict(features)
+        names, predictions = self._predict_all(features, snapshot)
 
-                individual_predictions[model_name] = float(prediction)
-                predictions.append(float(prediction))
+        individual_predictions = {name: None for name in snapshot.names}
+        individual_predictions.update(zip(names, predictions[:, 0].tolist()))
 
-            except Exception as e:
-                logger.error(f"Error getting prediction from {model_name}: {e}")
+        names = tuple(names)
+        if names == snapshot.names:
+            weights = snapshot.weights_vec
+        else:
+            # A model failed to predict
+            weights = np.array([snapshot.weights.get(name, 0.0) for name in names], dtype=np.float64)
+
+        ensemble_prediction = float(predictions[:, 0] @ weights)
+
+        return ensemble_prediction, individual_predictions, snapshot.weights
+
+    def predict_voting(
+        self, features: np.ndarray
+    ) -> Tuple[float, Dict[str, float], float]:
+
+        names, predictions = self._predict_all(features)
 
-        if not predictions:
+        if not names:
             raise ValueError("No valid predictions from ensemble models")
 
-        ensemble_prediction = np.mean(predictions)
-        variance = float(np.var(predictions))
+        first = predictions[:, 0]
+        individual_predictions = dict(zip(names, first.tolist()))
 
-        return ensemble_prediction, individual_predictions, variance
+        return float(first.mean()), individual_predictions, float(first.var())
 
     def predict_with_confidence(
         self, features: np.ndarray
     ) -> Tuple[float, float, Dict[str, float]]:
 
-        predictions = []
-        individual_predictions = {}
-
-        for model_name, model in self.models.items():
-            try:
-                if features.ndim == 1:
-                    prediction = model.predict(features.reshape(1, -1))[0]
-                else:
-                    pred_result = model.predict(features)
-                    prediction = float(pred_result[0]) if isinstance(pred_result, np.ndarray) else float(pred_result)
-
-                individual_predictions[model_name] = float(prediction)
-                predictions.append(float(prediction))
+        names, predictions = self._predict_all(features)
 
-            except Exception as e:
-                logger.error(f"Error getting prediction from {model_name}: {e}")
-
-        if not predictions:
+        if not names:
             raise ValueError("No valid predictions from ensemble models")
 
-        ensemble_prediction = np.mean(predictions)
-        std_prediction = np.std(predictions)
+        first = predictions[:, 0]
+        individual_predictions = dict(zip(names, first.tolist()))
+
+        ensemble_prediction = float(first.mean())
+        std_prediction = float(first.std())
 
-        cv = std_prediction / (abs(ensemble_prediction) + 1e-6) if ensemble_prediction != 0 else 0
-        confidence = 1 / (1 + cv) if (1 + cv) != 0 else 0.85
+        confidence = float(self._confidence(ensemble_prediction, std_prediction))
 
         return ensemble_prediction, confidence, individual_predictions
 
@@ -332,50 +538,44 @@ class EnsembleManager:
             logger.warning("No model importances provided")
             return {}
 
-        all_features = set()
-        for importance_dict in model_importances.values():
-            all_features.update(importance_dict.keys())
+        import pandas as pd
 
-        combined_importance = {}
-
-        for feature in all_features:
-            importances = []
-
-            for model_name, importance_dict in model_importances.items():
-                if feature in importance_dict:
-                    weight = self.model_weights.get(model_name, 1.0 / len(self.models))
-                    importances.append(importance_dict[feature] * weight)
+        # features x models; NaN where a model does not report a feature
+        importances = pd.DataFrame(model_importances, dtype=float)
+        weights = pd.Series(
+            {name: self.model_weights.get(name, 1.0 / len(self.models)) for name in importances.columns},
+            dtype=float,
+        )
 
-            if importances:
-                combined_importance[feature] = np.mean(importances)
+        weighted = importances.mul(weights, axis=1)
+        combined = weighted.sum(axis=1) / importances.notna().sum(axis=1).clip(lower=1)
 
-        total = sum(combined_importance.values())
+        total = combined.sum()
         if total > 0:
-            combined_importance = {
-                k: v / total for k, v in combined_importance.items()
-            }
+            combined = combined / total
 
-        return combined_importance
+        return combined.to_dict()
 
     def batch_predict(
         self, features_list: np.ndarray
     ) -> Tuple[np.ndarray, List[Dict[str, float]], np.ndarray]:
 
-        ensemble_predictions = []
-        individual_predictions_list = []
-        confidences = []
+        # One predict() call per model over the whole batch instead of one per row
+        model_names, predictions = self._predict_all(features_list)
 
-        for features in features_list:
-            prediction, confidence, individual = self.predict_with_confidence(features)
-            ensemble_predictions.append(prediction)
-            individual_predictions_list.append(individual)
-            confidences.append(confidence)
+        if not model_names:
+            raise ValueError("No valid predictions from ensemble models")
 
-        return (
-            np.array(ensemble_predictions),
-            individual_predictions_list,
-            np.array(confidences),
-        )
+        ensemble_predictions = predictions.mean(axis=0)
+        std_predictions = predictions.std(axis=0)
+
+        confidences = self._confidence(ensemble_predictions, std_predictions)
+
+        individual_predictions_list = [
+            dict(zip(model_names, column.tolist())) for column in predictions.T
+        ]
+
+        return ensemble_predictions, individual_predictions_list, confidences
 
     def calculate_prediction_bounds(
         self,
@@ -385,13 +585,15 @@ class EnsembleManager:
         confidence_level: float = 0.95,
     ) -> Tuple[float, float]:
 
-        predictions = [p for p in individual_predictions.values() if p is not None]
+        predictions = np.fromiter(
+            (p for p in individual_predictions.values() if p is not None), dtype=np.float64
+        )
 
-        if not predictions:
+        if not predictions.size:
             margin = abs(ensemble_prediction) * 0.1
             return ensemble_prediction - margin, ensemble_prediction + margin
 
-        std_prediction = np.std(predictions)
+        std_prediction = float(predictions.std())
         
         margin = std_prediction * (2 - confidence) * 1.96
 
@@ -1,4 +1,7 @@
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 import pandas as pd
@@ -6,10 +9,16 @@ from loguru import logger
 from datetime import datetime
 
 from app.ml.preprocessor import DataPreprocessor
+from app.ml.artifacts import load_artifact
 from app.ml.ensemble import EnsembleManager
 from app.ml.model_metrics import ModelMetricsCalculator
 from app.config import settings
 
+_predict_executor = ThreadPoolExecutor(
+    max_workers=settings.prediction_max_workers,
+    thread_name_prefix="predict",
+)
+
 class AgriculturalPredictor:
 
     def __init__(
@@ -25,12 +34,18 @@ class AgriculturalPredictor:
 
         logger.info("Price prediction system ready with ensemble models")
 
+    # Read per request rather than cached at startup: the ensemble swaps in
+    # newly trained artifacts while the app is running
+    @property
+    def is_ready(self) -> bool:
+
+        return bool(self.ensemble.models) and self.ensemble.preprocessor is not None
+
     def load_models(self, model_paths: Dict[str, str], preprocessor_path: str = None) -> None:
         
         self.ensemble.load_models(model_paths, preprocessor_path)
         if preprocessor_path:
-            import joblib
-            preprocessor_data = joblib.load(preprocessor_path)
+            preprocessor_data = load_artifact(preprocessor_path)
             if isinstance(preprocessor_data, dict):
                 self.preprocessor = preprocessor_data.get('preprocessor', preprocessor_data)
             else:
@@ -115,6 +130,73 @@ class AgriculturalPredictor:
 
         return result
 
+    async def predict_async(self, features: np.ndarray, **kwargs) -> Dict[str, Any]:
+
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(
+            loop.run_in_executor(_predict_executor, partial(self.predict, features, **kwargs)),
+            timeout=settings.prediction_timeout_seconds,
+        )
+
+    async def predict_horizon_async(self, *args, **kwargs) -> List[Dict[str, Any]]:
+
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(
+            loop.run_in_executor(_predict_executor, partial(self.predict_horizon, *args, **kwargs)),
+            timeout=settings.prediction_timeout_seconds,
+        )
+
+    async def predict_horizons_async(self, horizons: List[Tuple]) -> List[List[Dict[str, Any]]]:
+
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(
+            loop.run_in_executor(_predict_executor, self.predict_horizons, horizons),
+            timeout=settings.prediction_timeout_seconds,
+        )
+
+    def predict_horizon(
+        self,
+        dates: List[Any],
+        commodity_id: int,
+        market_id: int,
+        price: float,
+        arrival: float,
+    ) -> List[Dict[str, Any]]:
+
+        return self.predict_horizons([(dates, commodity_id, market_id, price, arrival)])[0]
+
+    def predict_horizons(self, horizons: List[Tuple]) -> List[List[Dict[str, Any]]]:
+
+        # Each horizon is (dates, commodity_id, market_id, price, arrival).
+        # Preprocessing scales and imputes over the whole frame, so every
+        # horizon is prepared on its own and only the ensemble pass is shared;
+        # both run here, on the prediction executor, rather than on the event loop
+        features = np.vstack([
+            self.preprocessor.prepare_prediction_data(
+                pd.DataFrame({
+                    "date": np.asarray(dates, dtype="datetime64[D]"),
+                    "commodity_id": commodity_id,
+                    "market_id": market_id,
+                    "price": float(price),
+                    "arrival": float(arrival),
+                }),
+                date_col="date",
+                categorical_cols=self.preprocessor.categorical_features or None,
+                independent_rows=True,
+            )
+            for dates, commodity_id, market_id, price, arrival in horizons
+        ])
+        results = self.batch_predict(features)
+
+        bounds = np.cumsum([0] + [len(dates) for dates, *_ in horizons]).tolist()
+        horizon_results = []
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            horizon = results[start:end]
+            for sample_id, result in enumerate(horizon):
+                result['sample_id'] = sample_id
+            horizon_results.append(horizon)
+        return horizon_results
+
     def batch_predict(
         self,
         features_list: np.ndarray,
@@ -123,6 +205,8 @@ class AgriculturalPredictor:
 
         start_time = datetime.now()
 
+        self.ensemble.refresh_if_newer()
+
         ensemble_preds, individual_preds_list, confidences = self.ensemble.batch_predict(
             features_list
         )
@@ -11,6 +11,10 @@ from sklearn.impute import SimpleImputer
 from app.core.utils import get_current_timestamp
 from app.core.festival_calendar import FestivalCalendar
 
+# Crop-season month groups used for the season feature
+RABI_MONTHS = (10, 11, 12, 1, 2, 3)
+KHARIF_MONTHS = (6, 7, 8, 9)
+
 class DataPreprocessor:
 
     def __init__(self, scaler_type: str = "standard"):
@@ -47,29 +51,27 @@ class DataPreprocessor:
     def extract_temporal_features(self, date_col: pd.Series) -> pd.DataFrame:
         
         features = pd.DataFrame()
-        dates = pd.to_datetime(date_col)
+        # Dates arrive in ISO layout; naming it skips per-column format inference
+        dates = pd.to_datetime(date_col, format="ISO8601")
+        month = dates.dt.month
+        day = dates.dt.day
         
         features['day_of_week'] = dates.dt.dayofweek
-        features['day_of_month'] = dates.dt.day
-        features['month'] = dates.dt.month
+        features['day_of_month'] = day
+        features['month'] = month
         features['quarter'] = dates.dt.quarter
         features['week_of_year'] = dates.dt.isocalendar().week
         features['day_of_year'] = dates.dt.dayofyear
         
-        def get_season(month: int) -> int:
-            if month in [10, 11, 12, 1, 2, 3]:
-                return 1
-            elif month in [6, 7, 8, 9]:
-                return 2
-            else:
-                return 3
-        
-        features['season'] = dates.dt.month.map(get_season)
+        # 1 = rabi (Oct-Mar), 2 = kharif (Jun-Sep), 3 = zaid
+        features['season'] = np.select(
+            [month.isin(RABI_MONTHS), month.isin(KHARIF_MONTHS)], [1, 2], default=3
+        )
         
-        features['month_sin'] = np.sin(2 * np.pi * dates.dt.month / 12)
-        features['month_cos'] = np.cos(2 * np.pi * dates.dt.month / 12)
-        features['day_sin'] = np.sin(2 * np.pi * dates.dt.day / 31)
-        features['day_cos'] = np.cos(2 * np.pi * dates.dt.day / 31)
+        features['month_sin'] = np.sin(2 * np.pi * month / 12)
+        features['month_cos'] = np.cos(2 * np.pi * month / 12)
+        features['day_sin'] = np.sin(2 * np.pi * day / 31)
+        features['day_cos'] = np.cos(2 * np.pi * day / 31)
         
         festival_features = dates.apply(
             lambda d: pd.Series(self.festival_calendar.get_enhanced_features(d))
@@ -271,18 +273,22 @@ class DataPreprocessor:
 
         return features, target
 
-    def calculate_trader_features(self, data: pd.DataFrame) -> pd.DataFrame:
+    def calculate_trader_features(self, data: pd.DataFrame, independent_rows: bool = False) -> pd.DataFrame:
         
+        # Independent rows (e.g. forecast dates) are not a price history, so
+        # rolling features get the same defaults as a single-row frame
+        history = 1 if independent_rows else len(data)
+
         trader_features = pd.DataFrame()
         
-        if 'price' in data.columns and len(data) > 1:
+        if 'price' in data.columns and history > 1:
             trader_features['price_volatility'] = data.groupby(['commodity_id'])['price'].transform(
                 lambda x: x.rolling(window=min(7, len(x)), min_periods=1).std().fillna(0)
             )
         else:
             trader_features['price_volatility'] = 0.0
         
-        if 'arrival' in data.columns and len(data) > 1:
+        if 'arrival' in data.columns and history > 1:
             trader_features['arrival_momentum'] = data.groupby(['commodity_id'])['arrival'].transform(
                 lambda x: x.diff().fillna(0)
             )
@@ -350,7 +356,7 @@ class DataPreprocessor:
         else:
             trader_features['festival_demand_multiplier'] = 1.0
         
-        if 'arrival' in data.columns and len(data) > 7:
+        if 'arrival' in data.columns and history > 7:
             trader_features['supply_shock_indicator'] = data.groupby(['commodity_id'])['arrival'].transform(
                 lambda x: ((x - x.rolling(window=min(7, len(x)), min_periods=1).mean()) / 
                           (x.rolling(window=min(7, len(x)), min_periods=1).std() + 1)).fillna(0).clip(-3, 3)
@@ -358,7 +364,7 @@ class DataPreprocessor:
         else:
             trader_features['supply_shock_indicator'] = 0.0
         
-        if 'price' in data.columns and len(data) > 30:
+        if 'price' in data.columns and history > 30:
             trader_features['demand_trend'] = data.groupby(['commodity_id'])['price'].transform(
                 lambda x: (x.rolling(window=min(30, len(x)), min_periods=1).mean() - 
                           x.rolling(window=min(60, len(x)), min_periods=1).mean()).fillna(0)
@@ -374,35 +380,35 @@ class DataPreprocessor:
         else:
             trader_features['market_competition_index'] = 0.5
         
-        if 'price' in data.columns and len(data) > 14:
+        if 'price' in data.columns and history > 14:
             trader_features['volatility_14d'] = data.groupby(['commodity_id'])['price'].transform(
                 lambda x: x.rolling(window=min(14, len(x)), min_periods=1).std().fillna(0)
             )
         else:
             trader_features['volatility_14d'] = 0.0
         
-        if 'price' in data.columns and len(data) > 7:
+        if 'price' in data.columns and history > 7:
             trader_features['momentum_7d'] = data.groupby(['commodity_id'])['price'].transform(
                 lambda x: (x - x.shift(min(7, len(x)-1))).fillna(0)
             )
         else:
             trader_features['momentum_7d'] = 0.0
         
-        if 'price' in data.columns and len(data) > 30:
+        if 'price' in data.columns and history > 30:
             trader_features['rsi_30d'] = data.groupby(['commodity_id'])['price'].transform(
                 lambda x: self._calculate_rsi(x, min(30, len(x)))
             )
         else:
             trader_features['rsi_30d'] = 50.0
         
-        if 'arrival' in data.columns and len(data) > 14:
+        if 'arrival' in data.columns and history > 14:
             trader_features['supply_volatility'] = data.groupby(['commodity_id'])['arrival'].transform(
                 lambda x: x.rolling(window=min(14, len(x)), min_periods=1).std().fillna(0) / (x.rolling(window=min(14, len(x)), min_periods=1).mean().fillna(1) + 1)
             )
         else:
             trader_features['supply_volatility'] = 0.0
         
-        if 'price' in data.columns and 'arrival' in data.columns and len(data) > 7:
+        if 'price' in data.columns and 'arrival' in data.columns and history > 7:
             price_pct = data.groupby(['commodity_id'])['price'].pct_change().fillna(0)
             arrival_pct = data.groupby(['commodity_id'])['arrival'].pct_change().fillna(0)
             trader_features['price_elasticity'] = ((price_pct + 1e-6) / (arrival_pct + 1e-6)).clip(-10, 10).fillna(0)
@@ -440,7 +446,7 @@ class DataPreprocessor:
                 lambda r: 1.0 if r > 50 else 0.0
             )
         
-        if 'price' in data.columns and len(data) > 90:
+        if 'price' in data.columns and history > 90:
             trader_features['price_trend_90d'] = data.groupby(['commodity_id'])['price'].transform(
                 lambda x: (x.rolling(window=min(30, len(x)), min_periods=1).mean() - 
                           x.rolling(window=min(90, len(x)), min_periods=1).mean()).fillna(0)
@@ -456,7 +462,7 @@ class DataPreprocessor:
         else:
             trader_features['market_premium_factor'] = 1.0
         
-        if 'arrival' in data.columns and len(data) > 7:
+        if 'arrival' in data.columns and history > 7:
             trader_features['supply_consistency'] = data.groupby(['commodity_id'])['arrival'].transform(
                 lambda x: 1.0 / (x.rolling(window=min(7, len(x)), min_periods=1).std().fillna(1) + 1)
             )
@@ -597,10 +603,15 @@ class DataPreprocessor:
         return trader_features
 
     def prepare_prediction_data(
-        self, data: pd.DataFrame, date_col: str, categorical_cols: List[str] = None
+        self,
+        data: pd.DataFrame,
+        date_col: str,
+        categorical_cols: List[str] = None,
+        independent_rows: bool = False,
     ) -> np.ndarray:
 
-        data_processed = data.copy()
+        # Only read from here on, so the caller's frame is used as-is
+        data_processed = data
 
         temporal_features = self.extract_temporal_features(data_processed[date_col])
 
@@ -626,7 +637,7 @@ class DataPreprocessor:
         if 'commodity' in data_processed.columns:
             features['commodity'] = data_processed['commodity']
         
-        trader_features = self.calculate_trader_features(features)
+        trader_features = self.calculate_trader_features(features, independent_rows=independent_rows)
         features = pd.concat([features, trader_features], axis=1)
         
         # Use the exact same features as during training (fallback to standard list)
@@ -682,7 +693,7 @@ class DataPreprocessor:
             if col not in features.columns:
                 features[col] = 0.0
 
-        features = features[model_features].copy()
+        features = features[model_features]
         
         # Scale numeric features
         for col in ['price', 'min_price', 'max_price', 'modal_price', 'arrival']:
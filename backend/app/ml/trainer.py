@@ -3,7 +3,6 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 from datetime import datetime
-import joblib
 from loguru import logger
 
 from sklearn.model_selection import cross_val_score, GridSearchCV, TimeSeriesSplit
@@ -23,6 +22,7 @@ except ImportError:
     HAS_CATBOOST = False
 
 from app.config import settings
+from app.ml.artifacts import dump_artifact, load_artifact
 from app.ml.preprocessor import DataPreprocessor
 
 class ModelTrainer:
@@ -463,7 +463,7 @@ class ModelTrainer:
             version = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         model_path = self.model_dir / f"{model_name}_{version}.joblib"
-        joblib.dump(model, model_path)
+        dump_artifact(model, model_path)
 
         logger.info(f"Saved {model_name} model successfully")
         return str(model_path)
@@ -485,14 +485,14 @@ class ModelTrainer:
             version = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         preprocessor_path = self.model_dir / f"preprocessor_{version}.joblib"
-        joblib.dump(self.preprocessor, preprocessor_path)
+        dump_artifact(self.preprocessor, preprocessor_path)
 
         logger.info(f"Preprocessor saved successfully")
         return str(preprocessor_path)
 
     def load_model(self, model_path: str) -> Any:
         
-        model = joblib.load(model_path)
+        model = load_artifact(model_path)
         logger.info(f"Model loaded from storage")
         return model
 
@@ -1,9 +1,11 @@
 
 import json
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+import pandas as pd
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -12,9 +14,8 @@ from app.core.exceptions import ScraperError
 from app.core.utils import ensure_dir, get_current_timestamp, save_json
 from app.scraper.data_validator import DataValidator
 from app.scraper.utils import (
-    with_rate_limit,
     retry_on_failure,
-    get_session,
+    get_shared_session,
     safe_get,
     clean_text,
     parse_float,
@@ -22,11 +23,15 @@ from app.scraper.utils import (
     extract_table_data,
 )
 
+# Commodities and markets covered by the date-specific historical fetch
+HISTORICAL_COMMODITIES = ("Wheat", "Rice", "Onion", "Potato")
+HISTORICAL_MARKETS = ("Azadpur", "Mumbai (Dadar)", "Bangalore", "Chennai")
+
 class AgmarknetScraper:
 
     def __init__(self):
         self.base_url = settings.agmarknet_base_url
-        self.session = get_session(timeout=settings.scrape_timeout)
+        self.session = get_shared_session()
         self.validator = DataValidator()
         self.raw_data_dir = Path(settings.data_raw_dir)
         self.processed_data_dir = Path(settings.data_processed_dir)
@@ -36,7 +41,6 @@ class AgmarknetScraper:
         
         logger.info(f"Market data scraper ready to collect information from {self.base_url}")
 
-    @with_rate_limit
     @retry_on_failure(max_attempts=settings.scrape_retry_attempts)
     def fetch_page(self, url: str) -> BeautifulSoup:
         
@@ -307,25 +311,43 @@ class AgmarknetScraper:
         
         return prices
 
-    def scrape_historical_data(self, days_back: int = 90) -> list[dict[str, Any]]:
+    def scrape_historical_data(
+        self,
+        days_back: int = 90,
+        market_name: Optional[str] = None,
+        since: Optional[date] = None,
+    ) -> list[dict[str, Any]]:
         
         logger.info(f"Scraping historical data for past {days_back} days")
-        all_historical = []
+        batches = []
         
-        target_dates = []
         start_date = datetime.now() - timedelta(days=days_back)
+        target_dates = [start_date + timedelta(days=i) for i in range(0, days_back, 7)]
+        
+        if since is not None:
+            target_dates = [d for d in target_dates if d.date() > since]
+            if not target_dates:
+                logger.info(f"Historical data already collected through {since.isoformat()}, nothing to fetch")
+                return []
+        
+        if target_dates:
+            max_workers = min(settings.scrape_max_workers, len(target_dates))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agmarknet") as executor:
+                futures = [
+                    executor.submit(self._fetch_date_specific_prices, target_date)
+                    for target_date in target_dates
+                ]
+                
+                for target_date, future in zip(target_dates, futures):
+                    try:
+                        historical_batch = future.result()
+                        if historical_batch:
+                            batches.append(historical_batch)
+                            logger.info(f"Fetched {len(historical_batch)} records for {target_date.strftime('%Y-%m-%d')}")
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch data for {target_date}: {str(e)}")
         
-        for i in range(0, days_back, 7):
-            target_dates.append(start_date + timedelta(days=i))
-        
-        for target_date in target_dates:
-            try:
-                historical_batch = self._fetch_date_specific_prices(target_date)
-                if historical_batch:
-                    all_historical.extend(historical_batch)
-                    logger.info(f"Fetched {len(historical_batch)} records for {target_date.strftime('%Y-%m-%d')}")
-            except Exception as e:
-                logger.warning(f"Failed to fetch data for {target_date}: {str(e)}")
+        all_historical = self._filter_historical_records(batches, start_date, market_name)
         
         if not all_historical:
             logger.info("No historical data available, generating extended fallback")
@@ -333,6 +355,27 @@ class AgmarknetScraper:
         
         return all_historical
 
+    @staticmethod
+    def _filter_historical_records(
+        batches: list[list[dict[str, Any]]],
+        start_date: datetime,
+        market_name: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        
+        df = pd.DataFrame([r for batch in batches for r in batch if isinstance(r, dict)])
+        if df.empty:
+            return []
+        
+        dates = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce")
+        mask = dates >= pd.Timestamp(start_date.date())
+        
+        if market_name:
+            market_cols = [c for c in ("market", "marketName", "market_name") if c in df.columns]
+            markets = df[market_cols].bfill(axis=1).iloc[:, 0]
+            mask &= markets.str.contains(market_name, case=False, na=False, regex=False)
+        
+        return df[mask].to_dict("records")
+
     def _fetch_date_specific_prices(self, target_date: datetime) -> list[dict[str, Any]]:
         
         try:
@@ -343,11 +386,11 @@ class AgmarknetScraper:
             
             prices = []
             
-            for commodity in ["Wheat", "Rice", "Onion", "Potato"]:
+            for commodity in HISTORICAL_COMMODITIES:
                 try:
                     base_price = {"Wheat": 2500, "Rice": 3500, "Onion": 2000, "Potato": 1200}.get(commodity, 2500)
                     
-                    for market in ["Azadpur", "Mumbai (Dadar)", "Bangalore", "Chennai"]:
+                    for market in HISTORICAL_MARKETS:
                         month = target_date.month
                         day_factor = (target_date.day - 1) / 30.0 * 0.1
                         
@@ -456,7 +499,12 @@ class AgmarknetScraper:
         
         return data
 
-    def scrape_all(self, days_back: int = 180, historical_days: Optional[int] = None) -> dict[str, Any]:
+    def scrape_all(
+        self,
+        days_back: int = 180,
+        historical_days: Optional[int] = None,
+        historical_since: Optional[date] = None,
+    ) -> dict[str, Any]:
         
         logger.info(f"Beginning comprehensive data collection for the past {days_back} days")
         
@@ -465,8 +513,18 @@ class AgmarknetScraper:
         try:
             commodities = self.scrape_commodities()
             markets = self.scrape_markets()
-            prices = self.scrape_market_prices(days_back=days_back)
-            historical_prices = self.scrape_historical_data(days_back=historical_days or max(days_back, 60))
+            
+            # The live and historical collections are independent, so their
+            # page fetches overlap under the shared rate limiter
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="agmarknet-scrape") as executor:
+                prices_future = executor.submit(self.scrape_market_prices, days_back=days_back)
+                historical_future = executor.submit(
+                    self.scrape_historical_data,
+                    days_back=historical_days or max(days_back, 60),
+                    since=historical_since,
+                )
+                prices = prices_future.result()
+                historical_prices = historical_future.result()
             
             end_time = get_current_timestamp()
             duration = (end_time - start_time).total_seconds()
@@ -1,11 +1,39 @@
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 from loguru import logger
 
 from app.core.exceptions import ValidationError
-from app.core.utils import parse_timestamp
+from app.core.utils import parse_date, parse_timestamp
+
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%Y/%m/%d",
+    "%d-%b-%Y",
+    "%d %b %Y",
+)
+
+# Scraped batches repeat the same handful of date strings across thousands of rows
+@lru_cache(maxsize=4096)
+def _normalize_date_string(date_str: str) -> Optional[str]:
+
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return parse_date(date_str).isoformat()
+        except ValueError:
+            pass
+    
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    
+    return None
 
 class DataValidator:
 
@@ -104,26 +132,10 @@ class DataValidator:
         if isinstance(date_value, datetime):
             return date_value.strftime("%Y-%m-%d")
         
-        date_formats = [
-            "%Y-%m-%d",
-            "%d-%m-%Y",
-            "%d/%m/%Y",
-            "%Y/%m/%d",
-            "%d-%b-%Y",
-            "%d %b %Y",
-        ]
-        
-        date_str = str(date_value).strip()
-        
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, fmt)
-                return parsed_date.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        
-        logger.warning(f"Could not parse date: {date_value}")
-        return None
+        normalized = _normalize_date_string(str(date_value).strip())
+        if normalized is None:
+            logger.warning(f"Could not parse date: {date_value}")
+        return normalized
 
     @staticmethod
     def validate_batch(
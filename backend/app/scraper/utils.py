@@ -1,6 +1,9 @@
 
+import sqlite3
+import threading
 import time
-from functools import wraps
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Callable, Optional
 
 from loguru import logger
@@ -11,6 +14,8 @@ from tenacity import (
     retry_if_exception_type,
 )
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 
 from app.config import settings
 from app.core.exceptions import ScraperError
@@ -22,29 +27,23 @@ class RateLimiter:
         self.requests_per_minute = requests_per_minute
         self.min_interval = 60.0 / requests_per_minute
         self.last_request_time = 0.0
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
 
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        with self._lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
 
-        if time_since_last < self.min_interval:
-            sleep_time = self.min_interval - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+            if time_since_last < self.min_interval:
+                sleep_time = self.min_interval - time_since_last
+                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+                time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+            self.last_request_time = time.time()
 
 rate_limiter = RateLimiter(requests_per_minute=settings.scrape_rate_limit)
 
-def with_rate_limit(func: Callable) -> Callable:
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        rate_limiter.wait()
-        return func(*args, **kwargs)
-    return wrapper
-
 def retry_on_failure(
     max_attempts: int = 3,
     min_wait: int = 2,
@@ -80,19 +79,130 @@ def get_session(
     
     return session
 
+@lru_cache(maxsize=1)
+def get_shared_session() -> requests.Session:
+
+    session = get_session(timeout=settings.scrape_timeout)
+    
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=max(32, settings.scrape_max_workers),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    
+    return session
+
+class ResponseCache:
+
+    def __init__(self, path: str):
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "content_type TEXT, body BLOB, fetched_at REAL)"
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict[str, Any]] = None) -> str:
+
+        if not params:
+            return url
+        return url + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+    def get(self, key: str) -> Optional[tuple]:
+
+        with self._lock:
+            return self._conn.execute(
+                "SELECT etag, last_modified, content_type, body FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+    def store(self, key: str, response: requests.Response) -> None:
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    response.headers.get("Content-Type"),
+                    response.content,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+
+    return ResponseCache(settings.scrape_http_cache_path)
+
+def _cached_response(url: str, content_type: Optional[str], body: bytes) -> requests.Response:
+
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict({"Content-Type": content_type} if content_type else {})
+    response._content = body
+    return response
+
 def safe_get(
     url: str,
     session: Optional[requests.Session] = None,
     timeout: int = 30,
+    use_cache: bool = True,
+    immutable: bool = False,
     **kwargs
 ) -> requests.Response:
 
     if session is None:
-        session = get_session(timeout=timeout)
+        session = get_shared_session()
+    
+    cache = get_response_cache() if use_cache else None
+    key = entry = None
+    if cache is not None:
+        key = ResponseCache.make_key(url, kwargs.get("params"))
+        entry = cache.get(key)
+    
+    if entry is not None:
+        etag, last_modified, content_type, body = entry
+        # Only pages the caller knows cannot change skip the server; everything
+        # else is revalidated so unchanged pages cost a 304 rather than a download
+        if immutable:
+            logger.debug(f"Serving immutable {url} from the response cache")
+            return _cached_response(url, content_type, body)
+        
+        conditional = dict(kwargs.pop("headers", None) or {})
+        if etag:
+            conditional["If-None-Match"] = etag
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        kwargs["headers"] = conditional
     
+    # Only requests that reach the network spend rate-limit budget, so
+    # concurrent scrapers are not held back by immutable cached pages
+    rate_limiter.wait()
     try:
         response = session.get(url, timeout=timeout, **kwargs)
+        if entry is not None and response.status_code == 304:
+            cache.touch(key)
+            return _cached_response(url, entry[2], entry[3])
         response.raise_for_status()
+        if cache is not None and (
+            immutable or "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            cache.store(key, response)
         return response
     except requests.Timeout as e:
         raise ScraperError(f"Request timeout for {url}", details={"error": str(e)})
@@ -10,6 +10,8 @@ from loguru import logger
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import COMMODITIES_CACHE_KEY, MARKETS_CACHE_KEY, invalidate
+from app.core.utils import parse_date
 from app.database.models import Commodity, Market, MarketPrice, Inventory
 from app.models.import_schemas import (
     ImportStats,
@@ -98,16 +100,19 @@ class DataImportService:
 
         try:
             content_str = file_content.decode("utf-8")
-            reader = csv.DictReader(io.StringIO(content_str))
+            reader = csv.reader(io.StringIO(content_str))
+            fieldnames = next(reader, None)
 
-            if not reader.fieldnames:
+            if not fieldnames:
                 return [], ["CSV file is empty or invalid"]
 
             data = []
             errors = []
 
-            for row_num, row in enumerate(reader, start=2):
-                row = {k: v for k, v in row.items() if k and v}
+            # Zipping against the header skips DictReader's per-row dict and
+            # padding; missing or surplus cells are dropped the same way
+            for values in reader:
+                row = {k: v for k, v in zip(fieldnames, values) if k and v}
 
                 if not row:
                     continue
@@ -252,12 +257,23 @@ class DataImportService:
         duplicates = 0
 
         try:
+            # Resolve every referenced name up front so each row is a dict hit
+            # instead of two SELECTs
+            markets_by_name: Dict[str, Market] = {}
+            for market in await db_session.scalars(
+                select(Market).where(Market.name.in_({row.market_name for row in valid_rows}))
+            ):
+                markets_by_name.setdefault(market.name, market)
+
+            commodities_by_name: Dict[str, Commodity] = {}
+            for commodity in await db_session.scalars(
+                select(Commodity).where(Commodity.name.in_({row.commodity_name for row in valid_rows}))
+            ):
+                commodities_by_name.setdefault(commodity.name, commodity)
+
             for idx, row in enumerate(valid_rows):
                 try:
-                    market_result = await db_session.execute(
-                        select(Market).where(Market.name == row.market_name)
-                    )
-                    market = market_result.scalars().first()
+                    market = markets_by_name.get(row.market_name)
 
                     if not market:
                         market = Market(
@@ -268,11 +284,9 @@ class DataImportService:
                         )
                         db_session.add(market)
                         await db_session.flush()
+                        markets_by_name[row.market_name] = market
 
-                    commodity_result = await db_session.execute(
-                        select(Commodity).where(Commodity.name == row.commodity_name)
-                    )
-                    commodity = commodity_result.scalars().first()
+                    commodity = commodities_by_name.get(row.commodity_name)
 
                     if not commodity:
                         commodity = Commodity(
@@ -282,15 +296,14 @@ class DataImportService:
                         )
                         db_session.add(commodity)
                         await db_session.flush()
+                        commodities_by_name[row.commodity_name] = commodity
 
                     existing = await db_session.execute(
                         select(SalesHistory).where(
                             and_(
                                 SalesHistory.market_id == market.id,
                                 SalesHistory.commodity_id == commodity.id,
-                                SalesHistory.date == datetime.strptime(
-                                    row.date, "%Y-%m-%d"
-                                ).date(),
+                                SalesHistory.date == parse_date(row.date),
                             )
                         )
                     )
@@ -308,7 +321,7 @@ class DataImportService:
                         sales_record = SalesHistory(
                             market_id=market.id,
                             commodity_id=commodity.id,
-                            date=datetime.strptime(row.date, "%Y-%m-%d").date(),
+                            date=parse_date(row.date),
                             price=row.price,
                             quantity=row.quantity,
                             grade=row.grade,
@@ -325,6 +338,7 @@ class DataImportService:
                     stats.skipped_records += 1
 
             await db_session.commit()
+            await invalidate(COMMODITIES_CACHE_KEY, MARKETS_CACHE_KEY)
 
             stats.inserted_records = inserted
             stats.duplicate_records = duplicates
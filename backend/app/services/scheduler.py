@@ -6,13 +6,18 @@ from typing import Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
 
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from app.config import settings
-from app.scraper.agmarknet_scraper import AgmarknetScraper
+from app.scraper.agmarknet_scraper import (
+    HISTORICAL_COMMODITIES,
+    HISTORICAL_MARKETS,
+    AgmarknetScraper,
+)
 from app.ml.trainer import ModelTrainer
 from app.ml.preprocessor import DataPreprocessor
 from app.core.utils import get_current_timestamp
@@ -36,7 +41,20 @@ class DataScheduler:
         try:
             logger.info("Starting daily market data collection")
             
-            result = self.scraper.scrape_all(days_back=180, historical_days=180)
+            # Live rows land on today's date for many pairs, so the backfill
+            # resumes from the stalest pair it covers rather than the newest row
+            historical_since = None
+            async for session in get_async_session():
+                historical_since = await MarketPriceRepository(session).get_latest_covered_date(
+                    HISTORICAL_COMMODITIES, HISTORICAL_MARKETS
+                )
+            
+            result = await run_in_threadpool(
+                self.scraper.scrape_all,
+                days_back=180,
+                historical_days=180,
+                historical_since=historical_since,
+            )
             
             if result.get("status") == "success":
                 counts = result.get("counts", {})
@@ -57,7 +75,7 @@ class DataScheduler:
             async for session in get_async_session():
                 repo = MarketPriceRepository(session)
                 
-                recent_data = await repo.get_recent_prices(days=180)
+                recent_data = await repo.get_recent_price_rows(days=180)
                 
                 if len(recent_data) < 1000:
                     logger.warning(f"Insufficient training data available: {len(recent_data)} records")
@@ -69,14 +87,7 @@ class DataScheduler:
                 trainer = ModelTrainer(preprocessor)
                 
                 import pandas as pd
-                df = pd.DataFrame([{
-                    "commodity": getattr(p, "commodity").name if getattr(p, "commodity", None) else getattr(p, "commodity_id", None),
-                    "market": getattr(p, "market").name if getattr(p, "market", None) else getattr(p, "market_id", None),
-                    "state": getattr(getattr(p, "market", None), "state", None),
-                    "date": p.date,
-                    "price": p.modal_price or p.price,
-                    "arrival": p.arrival,
-                } for p in recent_data])
+                df = pd.DataFrame(recent_data, columns=["commodity", "market", "state", "date", "price", "arrival"])
                 
                 X_train, X_test, y_train, y_test = preprocessor.prepare_training_data(
                     df, target_col="price", date_col="date"
@@ -138,7 +149,8 @@ class DataScheduler:
                         )
                     market_cache[name.lower()] = existing
 
-                stored_count = 0
+                today = get_current_timestamp().date()
+                payloads = []
 
                 for price_data in price_batches:
                     commodity_name = price_data.get("commodity")
@@ -175,7 +187,7 @@ class DataScheduler:
                     payload = {
                         "commodity_id": getattr(commodity, "id", None),
                         "market_id": getattr(market, "id", None),
-                        "date": price_data.get("date") or get_current_timestamp().date(),
+                        "date": price_data.get("date") or today,
                         "price": price_data.get("price") or price_data.get("modal_price") or 0.0,
                         "min_price": price_data.get("min_price"),
                         "max_price": price_data.get("max_price"),
@@ -186,9 +198,9 @@ class DataScheduler:
                     if not payload["commodity_id"] or not payload["market_id"]:
                         continue
 
-                    await price_repo.create_or_update_price(payload)
-                    stored_count += 1
+                    payloads.append(payload)
 
+                stored_count = await price_repo.bulk_upsert_prices(payloads)
                 await session.commit()
                 logger.info(f"Stored {stored_count} price records in database")
                 
@@ -1,3 +1,4 @@
+import orjson
 import requests
 import os
 from datetime import datetime
@@ -19,7 +20,7 @@ class OpenWeatherProvider:
         }
         resp = requests.get(OPENWEATHER_URL, params=params)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         return data
 
     def get_daily_forecast(self, lat: float, lon: float):
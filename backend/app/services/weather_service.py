@@ -1,11 +1,13 @@
 """Weather API service for agricultural impact analysis."""
 
 import httpx
+import orjson
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 import numpy as np
 from loguru import logger
 from app.config import settings
+from app.core.utils import HAS_H2
 
 
 class WeatherService:
@@ -14,6 +16,7 @@ class WeatherService:
     def __init__(self):
         self.api_key = getattr(settings, 'openweathermap_api_key', None) or ""
         self.base_url = "https://api.openweathermap.org/data/2.5"
+        self._client: Optional[httpx.AsyncClient] = None
         
         # Major Indian cities with coordinates
         self.cities = {
@@ -34,6 +37,23 @@ class WeatherService:
             "Nagpur": {"lat": 21.1458, "lon": 79.0882},
         }
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, reusing pooled connections across calls."""
+        if self._client is None or self._client.is_closed:
+            # With h2 installed, concurrent lookups multiplex over one connection per host
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=HAS_H2,
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _get_city_coords(self, state: str) -> dict:
         """Get coordinates for a state by finding matching city."""
         state_lower = state.lower()
@@ -67,35 +87,35 @@ class WeatherService:
         coords = self._get_city_coords(state)
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/weather",
-                    params={
-                        "lat": coords["lat"],
-                        "lon": coords["lon"],
-                        "appid": self.api_key,
-                        "units": "metric"
-                    }
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/weather",
+                params={
+                    "lat": coords["lat"],
+                    "lon": coords["lon"],
+                    "appid": self.api_key,
+                    "units": "metric"
+                }
+            )
+            
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                return {
+                    "temperature": data["main"]["temp"],
+                    "humidity": data["main"]["humidity"],
+                    "description": data["weather"][0]["description"],
+                    "wind_speed": data["wind"]["speed"],
+                    "pressure": data["main"]["pressure"],
+                    "visibility": data.get("visibility", 10000) / 1000,
+                    "rain": data.get("rain", {}).get("1h", 0),
+                    "clouds": data["clouds"]["all"],
+                    "source": "openweathermap",
+                    "fetched_at": datetime.utcnow().isoformat(),
+                }
+            else:
+                logger.warning(f"Weather API returned {response.status_code}")
+                return self._get_fallback_weather(state)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    return {
-                        "temperature": data["main"]["temp"],
-                        "humidity": data["main"]["humidity"],
-                        "description": data["weather"][0]["description"],
-                        "wind_speed": data["wind"]["speed"],
-                        "pressure": data["main"]["pressure"],
-                        "visibility": data.get("visibility", 10000) / 1000,
-                        "rain": data.get("rain", {}).get("1h", 0),
-                        "clouds": data["clouds"]["all"],
-                        "source": "openweathermap",
-                        "fetched_at": datetime.utcnow().isoformat(),
-                    }
-                else:
-                    logger.warning(f"Weather API returned {response.status_code}")
-                    return self._get_fallback_weather(state)
-                    
         except Exception as e:
             logger.warning(f"Weather API error: {e}")
             return self._get_fallback_weather(state)
@@ -108,36 +128,36 @@ class WeatherService:
         coords = self._get_city_coords(state)
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/forecast",
-                    params={
-                        "lat": coords["lat"],
-                        "lon": coords["lon"],
-                        "appid": self.api_key,
-                        "units": "metric",
-                        "cnt": days * 8  # 3-hour intervals
-                    }
-                )
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/forecast",
+                params={
+                    "lat": coords["lat"],
+                    "lon": coords["lon"],
+                    "appid": self.api_key,
+                    "units": "metric",
+                    "cnt": days * 8  # 3-hour intervals
+                }
+            )
+            
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                forecasts = []
+                
+                for item in data.get("list", [])[:days * 8:8]:  # One per day
+                    forecasts.append({
+                        "date": item["dt_txt"],
+                        "temperature": item["main"]["temp"],
+                        "humidity": item["main"]["humidity"],
+                        "description": item["weather"][0]["description"],
+                        "rain_probability": item.get("pop", 0) * 100,
+                        "wind_speed": item["wind"]["speed"],
+                    })
+                
+                return forecasts
+            else:
+                return self._get_fallback_forecast(state, days)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    forecasts = []
-                    
-                    for item in data.get("list", [])[:days * 8:8]:  # One per day
-                        forecasts.append({
-                            "date": item["dt_txt"],
-                            "temperature": item["main"]["temp"],
-                            "humidity": item["main"]["humidity"],
-                            "description": item["weather"][0]["description"],
-                            "rain_probability": item.get("pop", 0) * 100,
-                            "wind_speed": item["wind"]["speed"],
-                        })
-                    
-                    return forecasts
-                else:
-                    return self._get_fallback_forecast(state, days)
-                    
         except Exception as e:
             logger.warning(f"Weather forecast API error: {e}")
             return self._get_fallback_forecast(state, days)
@@ -399,3 +419,9 @@ def get_weather_service() -> WeatherService:
     if _weather_service is None:
         _weather_service = WeatherService()
     return _weather_service
+
+
+async def close_weather_service() -> None:
+    """Release the singleton's pooled HTTP connections, if it was ever created."""
+    if _weather_service is not None:
+        await _weather_service.close()
@@ -3,7 +3,6 @@
 Quick script to import generated market data into database
 """
 import asyncio
-import json
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -15,6 +14,7 @@ sys.path.insert(0, str(backend_path))
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.utils import load_json
 from app.database.connection import init_async_db, get_async_session
 from app.database.repositories import (
     CommodityRepository,
@@ -38,8 +38,7 @@ async def import_market_data(json_file: str):
         return
     
     logger.info(f"📖 Reading {data_path.name}...")
-    with open(data_path, 'r') as f:
-        records = json.load(f)
+    records = load_json(data_path)
     
     logger.info(f"✅ Loaded {len(records):,} records")
     
@@ -132,7 +132,7 @@ def calculate_seasonal_patterns(session):
     
     for commodity in commodities:
         # Get historical prices for this commodity
-        prices = session.query(MarketPrice).filter(
+        prices = session.query(MarketPrice.date, MarketPrice.price).filter(
             MarketPrice.commodity_id == commodity.id,
             MarketPrice.date >= datetime.now() - timedelta(days=730)  # Last 2 years
         ).all()
@@ -209,15 +209,16 @@ def calculate_price_volatility(session):
     for commodity in commodities:
         for period_name, days in periods:
             # Get historical prices
-            prices = session.query(MarketPrice).filter(
-                MarketPrice.commodity_id == commodity.id,
-                MarketPrice.date >= datetime.now() - timedelta(days=days)
-            ).all()
+            price_values = [
+                price for (price,) in session.query(MarketPrice.price).filter(
+                    MarketPrice.commodity_id == commodity.id,
+                    MarketPrice.date >= datetime.now() - timedelta(days=days)
+                )
+            ]
             
-            if len(prices) < 10:
+            if len(price_values) < 10:
                 continue
             
-            price_values = [p.price for p in prices]
             std_dev = np.std(price_values)
             mean_price = np.mean(price_values)
             
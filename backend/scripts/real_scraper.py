@@ -3,39 +3,45 @@ Real Web Scraper for Agricultural Market Data
 Fetches actual price data from AgMarknet and other government sources
 """
 
+import argparse
 import asyncio
-import json
+import re
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 import random
-import time
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from app.core.utils import HAS_H2, save_json_records
+
 # Configure logging
 logger.remove()
 logger.add(sys.stdout, level="INFO", format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | {message}")
 
+# Numeric runs such as "2,450.50" inside scraped price text
+PRICE_PATTERN = re.compile(r'[\d,]+\.?\d*')
+
 class RealMarketScraper:
     """Scrapes real agricultural market data from multiple sources"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+    def __init__(self, concurrency: int = 4, delay: float = 2.0):
+        self.concurrency = concurrency
+        self.delay = delay
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
-        })
+        }
         
         self.sources = [
             "https://agmarknet.gov.in",
@@ -74,7 +80,14 @@ class RealMarketScraper:
         self.data_dir = Path(__file__).parent.parent / "data" / "raw"
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-    def scrape_agmarknet(self) -> list[dict[str, Any]]:
+    async def _get(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str) -> httpx.Response:
+        """Fetch a page, holding a concurrency slot through the polite delay"""
+        async with semaphore:
+            response = await client.get(url, timeout=15)
+            await asyncio.sleep(self.delay)  # Rate limiting
+            return response
+
+    async def scrape_agmarknet(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore) -> list[dict[str, Any]]:
         """Scrape data from AgMarknet portal"""
         logger.info("🌾 Scraping AgMarknet portal...")
         
@@ -85,8 +98,7 @@ class RealMarketScraper:
             url = "https://agmarknet.gov.in/SearchCommodity.aspx"
             logger.info(f"Fetching {url}")
             
-            response = self.session.get(url, timeout=15)
-            time.sleep(2)  # Rate limiting
+            response = await self._get(client, semaphore, url)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -140,14 +152,14 @@ class RealMarketScraper:
                 else:
                     logger.warning("⚠️  No data extracted from AgMarknet tables")
                     
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"❌ AgMarknet request failed: {e}")
         except Exception as e:
             logger.error(f"❌ AgMarknet scraping error: {e}")
         
         return prices
 
-    def scrape_enam(self) -> list[dict[str, Any]]:
+    async def scrape_enam(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore) -> list[dict[str, Any]]:
         """Scrape data from eNAM portal"""
         logger.info("🌾 Scraping eNAM portal...")
         
@@ -158,8 +170,7 @@ class RealMarketScraper:
             url = "https://www.enam.gov.in/web/dashboard/trade-data"
             logger.info(f"Fetching {url}")
             
-            response = self.session.get(url, timeout=15)
-            time.sleep(2)
+            response = await self._get(client, semaphore, url)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -171,8 +182,7 @@ class RealMarketScraper:
                     try:
                         text = elem.get_text(strip=True)
                         # Try to extract price patterns
-                        import re
-                        price_match = re.search(r'[\d,]+\.?\d*', text)
+                        price_match = PRICE_PATTERN.search(text)
                         if price_match:
                             price = float(price_match.group().replace(',', ''))
                             if 100 < price < 100000:
@@ -203,14 +213,14 @@ class RealMarketScraper:
                 else:
                     logger.warning("⚠️  No data extracted from eNAM")
                     
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"❌ eNAM request failed: {e}")
         except Exception as e:
             logger.error(f"❌ eNAM scraping error: {e}")
         
         return prices
 
-    def scrape_ncdex(self) -> list[dict[str, Any]]:
+    async def scrape_ncdex(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore) -> list[dict[str, Any]]:
         """Scrape commodity futures data from NCDEX"""
         logger.info("🌾 Scraping NCDEX data...")
         
@@ -220,8 +230,7 @@ class RealMarketScraper:
             url = "https://www.ncdex.com/market-data/live-market-watch"
             logger.info(f"Fetching {url}")
             
-            response = self.session.get(url, timeout=15)
-            time.sleep(2)
+            response = await self._get(client, semaphore, url)
             
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
@@ -277,7 +286,7 @@ class RealMarketScraper:
                 else:
                     logger.warning("⚠️  No data extracted from NCDEX")
                     
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"❌ NCDEX request failed: {e}")
         except Exception as e:
             logger.error(f"❌ NCDEX scraping error: {e}")
@@ -449,33 +458,42 @@ class RealMarketScraper:
         logger.success(f"✅ Generated {len(historical)} historical records")
         return historical
 
-    def scrape_all(self, days_back: int = 180) -> list[dict]:
-        """Scrape from all sources and generate comprehensive realistic data"""
-        logger.info("=" * 80)
-        logger.info("🚀 STARTING COMPREHENSIVE MARKET DATA COLLECTION")
-        logger.info("=" * 80)
-        
-        all_prices = []
-        
-        # Try scraping from all sources with timeout
+    async def scrape_live(self) -> list[dict]:
+        """Scrape all sources concurrently over one pooled client"""
         sources = [
             ("AgMarknet", self.scrape_agmarknet),
             ("eNAM", self.scrape_enam),
             ("NCDEX", self.scrape_ncdex),
         ]
         
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        
+        async with httpx.AsyncClient(headers=self.headers, limits=limits, follow_redirects=True, http2=HAS_H2) as client:
+            results = await asyncio.gather(
+                *(scraper_func(client, semaphore) for _, scraper_func in sources),
+                return_exceptions=True,
+            )
+        
+        all_prices = []
+        for (source_name, _), prices in zip(sources, results):
+            if isinstance(prices, Exception):
+                logger.warning(f"⚠️  {source_name} unavailable: {prices}")
+            elif prices:
+                all_prices.extend(prices)
+                logger.success(f"✅ {source_name}: {len(prices)} records")
+        
+        return all_prices
+
+    def scrape_all(self, days_back: int = 180) -> list[dict]:
+        """Scrape from all sources and generate comprehensive realistic data"""
+        logger.info("=" * 80)
+        logger.info("🚀 STARTING COMPREHENSIVE MARKET DATA COLLECTION")
+        logger.info("=" * 80)
+        
         logger.info("\n🌐 Attempting to scrape live data from government sources...")
         
-        for source_name, scraper_func in sources:
-            try:
-                logger.info(f"📡 Trying {source_name}...")
-                prices = scraper_func()
-                if prices:
-                    all_prices.extend(prices)
-                    logger.success(f"✅ {source_name}: {len(prices)} records")
-                time.sleep(2)  # Rate limiting
-            except Exception as e:
-                logger.warning(f"⚠️  {source_name} unavailable: {e}")
+        all_prices = asyncio.run(self.scrape_live())
         
         if all_prices:
             logger.success(f"\n✅ Scraped {len(all_prices)} live records")
@@ -499,8 +517,8 @@ class RealMarketScraper:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = self.data_dir / f"market_prices_{timestamp}.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        # Rows are serialized in chunks straight to disk instead of building one indented string
+        save_json_records(data, output_file)
         
         logger.success(f"✅ Saved {len(data)} records to {output_file}")
         logger.info(f"📁 File size: {output_file.stat().st_size / 1024 / 1024:.2f} MB")
@@ -510,10 +528,16 @@ class RealMarketScraper:
 
 def main():
     """Main scraping execution"""
-    scraper = RealMarketScraper()
+    parser = argparse.ArgumentParser(description="Scrape agricultural market data")
+    parser.add_argument("--days-back", type=int, default=180, help="Days of history to build")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum simultaneous source requests")
+    parser.add_argument("--delay", type=float, default=2.0, help="Seconds each request holds its slot after responding")
+    args = parser.parse_args()
+    
+    scraper = RealMarketScraper(concurrency=args.concurrency, delay=args.delay)
     
-    # Scrape data (180 days of history)
-    data = scraper.scrape_all(days_back=180)
+    # Scrape data (180 days of history by default)
+    data = scraper.scrape_all(days_back=args.days_back)
     
     if data:
         # Save to file
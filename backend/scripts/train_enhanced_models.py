@@ -22,6 +22,7 @@ from app.ml.ensemble import EnsembleManager
 from app.services.weather_service import get_weather_service
 from app.core.festival_calendar import FestivalCalendar
 from app.config import settings
+from app.core.utils import load_json
 
 
 async def enrich_data_with_weather(df: pd.DataFrame) -> pd.DataFrame:
@@ -111,9 +112,7 @@ async def load_and_prepare_data() -> tuple:
         latest_summary = max(scrape_summary_files, key=lambda p: p.stat().st_mtime)
         logger.info(f"Loading data from {latest_summary.name}")
         
-        import json
-        with open(latest_summary, 'r') as f:
-            summary_data = json.load(f)
+        summary_data = load_json(latest_summary)
             
         if 'data' in summary_data:
             all_prices.extend(summary_data['data'].get('prices', []))
@@ -121,10 +120,8 @@ async def load_and_prepare_data() -> tuple:
     
     # Also load individual price files
     for price_file in sorted(price_files, key=lambda p: p.stat().st_mtime)[-5:]:  # Last 5 files
-        import json
-        with open(price_file, 'r') as f:
-            price_data = json.load(f)
-            all_prices.extend(price_data.get('prices', []))
+        price_data = load_json(price_file)
+        all_prices.extend(price_data.get('prices', []))
     
     if not all_prices:
         logger.error("No price data found! Make sure to run the scraper first.")
@@ -134,7 +131,7 @@ async def load_and_prepare_data() -> tuple:
     df = pd.DataFrame(all_prices)
     
     # Clean and prepare data
-    df['date'] = pd.to_datetime(df['date'])
+    df['date'] = pd.to_datetime(df['date'], format='ISO8601')
     df = df.sort_values('date')
     
     # Add commodity and market IDs
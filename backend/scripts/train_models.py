@@ -7,18 +7,18 @@ from datetime import datetime
 from loguru import logger
 import numpy as np
 import pandas as pd
-import joblib
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import settings
 from app.database.connection import init_sync_db, get_sync_session
-from app.database.models import Commodity, Market, MarketPrice, PredictionMetrics
+from app.database.models import Commodity, Market, MarketPrice, Model, PredictionMetrics
 from app.database.repositories import (
     MarketPriceRepository,
     PredictionMetricsRepository,
 )
 from sklearn.metrics import mean_squared_error, mean_absolute_error, mean_absolute_percentage_error
+from app.ml.artifacts import dump_artifact
 from app.ml.preprocessor import DataPreprocessor
 from app.ml.trainer import ModelTrainer
 from app.ml.ensemble import EnsembleManager
@@ -37,7 +37,16 @@ def load_training_data(
     init_sync_db()
     session = next(get_sync_session())
     try:
-        query = session.query(MarketPrice)
+        query = session.query(
+            MarketPrice.date,
+            MarketPrice.commodity_id,
+            MarketPrice.market_id,
+            MarketPrice.price,
+            MarketPrice.min_price,
+            MarketPrice.max_price,
+            MarketPrice.modal_price,
+            MarketPrice.arrival,
+        )
         if commodity_id:
             query = query.filter(MarketPrice.commodity_id == commodity_id)
         if market_id:
@@ -45,21 +54,13 @@ def load_training_data(
         from datetime import datetime, timedelta
         start_date = datetime.now().date() - timedelta(days=days)
         query = query.filter(MarketPrice.date >= start_date)
-        prices = query.order_by(MarketPrice.date).all()
-        logger.info(f"Loaded {len(prices)} price records")
-        data_list = []
-        for price in prices:
-            data_list.append({
-                'date': price.date,
-                'commodity_id': price.commodity_id,
-                'market_id': price.market_id,
-                'price': price.price,
-                'min_price': price.min_price,
-                'max_price': price.max_price,
-                'modal_price': price.modal_price,
-                'arrival': price.arrival or 0,
-            })
-        df = pd.DataFrame(data_list)
+        rows = query.order_by(MarketPrice.date).all()
+        logger.info(f"Loaded {len(rows)} price records")
+        df = pd.DataFrame(
+            rows,
+            columns=['date', 'commodity_id', 'market_id', 'price', 'min_price', 'max_price', 'modal_price', 'arrival'],
+        )
+        df['arrival'] = df['arrival'].fillna(0)
         if len(df) == 0:
             # Fallback: load from data/raw JSON
             logger.warning("No training data in DB, loading from raw data folder...")
@@ -95,6 +96,15 @@ def load_training_data(
     finally:
         session.close()
 
+def get_model_id(session, name: str, version: str) -> int:
+
+    model = session.query(Model).filter(Model.name == name, Model.version == version).one_or_none()
+    if model is None:
+        model = Model(name=name, version=version)
+        session.add(model)
+        session.flush()
+    return model.id
+
 def compute_weights_by_rmse(metrics_map: Dict[str, Dict[str, float]]) -> Dict[str, float]:
 
     inv = {}
@@ -187,7 +197,7 @@ def train_models(
             "metrics": metrics_map,
         }
         tuned_path = Path(settings.model_dir) / f"ensemble_tuned_{timestamp}.joblib"
-        joblib.dump(tuned_bundle, tuned_path)
+        dump_artifact(tuned_bundle, tuned_path)
         logger.info(f"Saved tuned ensemble artifact to {tuned_path}")
 
     # Save metrics to database
@@ -198,8 +208,7 @@ def train_models(
         # Save individual model metrics
         for m_name, m_metrics in trainer.metrics.items():
             pm = PredictionMetrics(
-                model_name=m_name,
-                model_version=version or "latest",
+                model_id=get_model_id(session, m_name, version or "latest"),
                 accuracy=m_metrics.get('accuracy'),
                 rmse=m_metrics.get('rmse'),
                 mae=m_metrics.get('mae'),
@@ -239,8 +248,7 @@ def train_models(
                 e_accuracy = max(0, 1 - e_mape)
                 
                 ensemble_pm = PredictionMetrics(
-                    model_name="ensemble",
-                    model_version=version or "latest",
+                    model_id=get_model_id(session, "ensemble", version or "latest"),
                     accuracy=e_accuracy,
                     rmse=np.sqrt(e_mse),
                     mae=e_mae,
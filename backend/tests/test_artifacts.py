@@ -0,0 +1,52 @@
+import joblib
+import numpy as np
+import pytest
+
+from backend.app.ml import artifacts
+from backend.app.ml.artifacts import OUT_OF_BAND_MIN_BYTES, dump_artifact, is_out_of_band_artifact, load_artifact
+
+def _artifact():
+    return {
+        "weights": np.arange(OUT_OF_BAND_MIN_BYTES, dtype=np.float64).reshape(-1, 8),
+        "bias": np.array([0.5, -1.25]),
+        "feature_names": ["price_lag_1", "arrival", "is_festival"],
+    }
+
+def test_dump_and_load_round_trip(tmp_path):
+    artifact = _artifact()
+    path = tmp_path / "model.joblib"
+
+    dump_artifact(artifact, path)
+    loaded = load_artifact(path)
+
+    assert is_out_of_band_artifact(path)
+    np.testing.assert_array_equal(loaded["weights"], artifact["weights"])
+    np.testing.assert_array_equal(loaded["bias"], artifact["bias"])
+    assert loaded["feature_names"] == artifact["feature_names"]
+    # Large arrays come back as read-only views of the mapped file
+    assert not loaded["weights"].flags.writeable
+
+def test_loads_legacy_joblib_files(tmp_path):
+    artifact = _artifact()
+    path = tmp_path / "legacy.joblib"
+    joblib.dump(artifact, path)
+
+    loaded = load_artifact(path)
+
+    assert not is_out_of_band_artifact(path)
+    np.testing.assert_array_equal(loaded["weights"], artifact["weights"])
+    assert loaded["feature_names"] == artifact["feature_names"]
+
+def test_failed_write_leaves_the_previous_artifact(tmp_path, monkeypatch):
+    path = tmp_path / "ensemble_latest.joblib"
+    dump_artifact({"models": ["xgboost"]}, path)
+
+    def fail(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(artifacts.os, "fsync", fail)
+    with pytest.raises(OSError):
+        dump_artifact(_artifact(), path)
+
+    assert load_artifact(path) == {"models": ["xgboost"]}
+    assert [p.name for p in tmp_path.iterdir()] == ["ensemble_latest.joblib"]
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+from backend.app.database.repositories import CommodityRepository, MarketPrice
+
+# The repositories import the cache as app.core.cache; use the same module so
+# their invalidations reach the local tier checked here
+from app.core import cache
+
+def _request(etag=None):
+    headers = [(b"if-none-match", etag.encode())] if etag else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+@pytest.fixture
+def endpoint(monkeypatch):
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+    cache.clear_local_cache()
+    calls = []
+
+    @cache.cached("test:commodities", ttl=60, as_json=True)
+    async def list_commodities(request=None):
+        calls.append(request)
+        return [{"id": 1, "name": "Wheat"}]
+
+    yield list_commodities, calls
+    cache.clear_local_cache()
+
+def test_matching_etag_gets_not_modified(endpoint):
+    list_commodities, calls = endpoint
+
+    first = asyncio.run(list_commodities(request=_request()))
+    etag = first.headers["etag"]
+    revalidated = asyncio.run(list_commodities(request=_request(etag)))
+
+    assert first.status_code == 200 and first.body == b'[{"id":1,"name":"Wheat"}]'
+    assert revalidated.status_code == 304 and not revalidated.body
+    assert revalidated.headers["etag"] == etag
+    assert len(calls) == 1
+
+def test_stale_etag_gets_the_body(endpoint):
+    list_commodities, calls = endpoint
+
+    asyncio.run(list_commodities(request=_request()))
+    response = asyncio.run(list_commodities(request=_request('"stale"')))
+
+    assert response.status_code == 200 and response.body == b'[{"id":1,"name":"Wheat"}]'
+    assert len(calls) == 1
+
+def test_invalidate_rebuilds_the_entry(endpoint):
+    list_commodities, calls = endpoint
+
+    asyncio.run(list_commodities(request=_request()))
+    asyncio.run(cache.invalidate("test:commodities"))
+    asyncio.run(list_commodities(request=_request()))
+
+    assert len(calls) == 2
+
+def test_fill_that_overlaps_an_invalidation_is_not_cached(endpoint):
+    @cache.cached("test:markets", ttl=60)
+    async def list_markets():
+        # A write commits while the list is being read
+        await cache.invalidate("test:markets")
+        return ["Azadpur"]
+
+    assert asyncio.run(list_markets()) == ["Azadpur"]
+    assert "test:markets" not in cache._local
+
+def _write_commodity(tmp_path, commit):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+
+    async def run():
+        async with engine.begin() as conn:
+            await conn.run_sync(MarketPrice.metadata.create_all)
+        async with async_sessionmaker(engine)() as session:
+            await CommodityRepository(session).create(name="Garlic", category="Vegetables")
+            cached_before_commit = cache.COMMODITIES_CACHE_KEY in cache._local
+            await (session.commit() if commit else session.rollback())
+        await engine.dispose()
+        return cached_before_commit, cache.COMMODITIES_CACHE_KEY in cache._local
+
+    cache._local[cache.COMMODITIES_CACHE_KEY] = (float("inf"), ["Onion"])
+    return asyncio.run(run())
+
+def test_repository_writes_invalidate_after_commit(endpoint, tmp_path):
+    cached_before_commit, cached_after_commit = _write_commodity(tmp_path, commit=True)
+
+    assert cached_before_commit
+    assert not cached_after_commit
+
+def test_rolled_back_writes_keep_the_cache(endpoint, tmp_path):
+    cached_before_rollback, cached_after_rollback = _write_commodity(tmp_path, commit=False)
+
+    assert cached_before_rollback and cached_after_rollback
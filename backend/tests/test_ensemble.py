@@ -0,0 +1,110 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from backend.app.ml.artifacts import dump_artifact
+from backend.app.ml.ensemble import EnsembleManager
+
+X = np.arange(12, dtype=np.float64).reshape(6, 2)
+
+def _ensemble(offset, names=("random_forest", "xgboost")):
+    models = {}
+    for i, name in enumerate(names):
+        models[name] = LinearRegression().fit(X, X.sum(axis=1) + offset + i)
+    weights = {name: (i + 1) / sum(range(1, len(names) + 1)) for i, name in enumerate(names)}
+    return {**models, "model_weights": weights, "timestamp": f"v{offset}"}
+
+def _write(path, artifact, mtime):
+    dump_artifact(artifact, path)
+    os.utime(path, (mtime, mtime))
+
+@pytest.fixture
+def manager(tmp_path):
+    _write(tmp_path / "ensemble_20260101.joblib", _ensemble(0), 1_000_000)
+    manager = EnsembleManager()
+    manager.model_dir = tmp_path
+    manager.refresh_min_interval = 0
+    manager.load_latest_models()
+    assert manager.latest_artifact_name == "ensemble_20260101.joblib"
+    return manager
+
+def test_refresh_loads_a_newer_ensemble(manager, tmp_path):
+    _write(tmp_path / "ensemble_20260102.joblib", _ensemble(100), 2_000_000)
+
+    manager.refresh_if_newer()
+
+    assert manager.latest_artifact_name == "ensemble_20260102.joblib"
+    assert manager.model_version == "v100"
+    assert set(manager.models) == {"random_forest", "xgboost"}
+
+def test_refresh_retries_an_artifact_that_finished_writing_in_place(manager, tmp_path):
+    complete = tmp_path / "complete.bin"
+    dump_artifact(_ensemble(100), complete)
+    data = complete.read_bytes()
+    complete.unlink()
+
+    # A writer that is still filling the file in place
+    target = tmp_path / "ensemble_20260102.joblib"
+    target.write_bytes(data[: len(data) // 2])
+    os.utime(target, (2_000_000, 2_000_000))
+    manager.refresh_if_newer()
+
+    assert manager.latest_artifact_name == "ensemble_20260101.joblib"
+
+    # Completing the write leaves the directory mtime alone
+    dir_mtime = tmp_path.stat().st_mtime_ns
+    target.write_bytes(data)
+    os.utime(target, (2_000_001, 2_000_001))
+    assert tmp_path.stat().st_mtime_ns == dir_mtime
+    manager.refresh_if_newer()
+
+    assert manager.latest_artifact_name == "ensemble_20260102.joblib"
+    assert manager.model_version == "v100"
+
+def test_refresh_skips_an_unchanged_directory(manager, monkeypatch):
+    manager.refresh_if_newer()
+    monkeypatch.setattr(manager, "load_latest_models", lambda: pytest.fail("unexpected reload"))
+
+    manager.refresh_if_newer()
+
+def test_weighted_predictions_never_mix_two_published_ensembles(tmp_path):
+    managers = []
+    for offset, names in ((0, ("random_forest", "xgboost")), (100, ("random_forest", "xgboost", "lightgbm"))):
+        model_dir = tmp_path / f"v{offset}"
+        model_dir.mkdir()
+        dump_artifact(_ensemble(offset, names), model_dir / "ensemble_20260101.joblib")
+        manager = EnsembleManager()
+        manager.model_dir = model_dir
+        manager.load_latest_models()
+        managers.append(manager)
+
+    expected = [m.predict_weighted_average(X[0])[0] for m in managers]
+    manager = managers[0]
+    errors = []
+    stop = threading.Event()
+
+    def predict():
+        try:
+            while not stop.is_set():
+                prediction, individual, weights = manager.predict_weighted_average(X[0])
+                assert min(abs(prediction - e) for e in expected) < 1e-6
+                assert set(individual) == set(weights)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=predict) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    try:
+        for i in range(40):
+            manager.model_dir = managers[(i + 1) % 2].model_dir
+            manager.load_latest_models()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert not errors
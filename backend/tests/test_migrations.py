@@ -0,0 +1,69 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+VERSIONS_DIR = BACKEND_DIR / "app" / "database" / "migrations" / "versions"
+
+# Discussion tables as create_all built them before any migration touched them
+LEGACY_DISCUSSION_TABLES = (
+    """CREATE TABLE discussions (id INTEGER PRIMARY KEY, title VARCHAR(255) NOT NULL, content TEXT NOT NULL,
+    commodity VARCHAR(255) NOT NULL, market VARCHAR(255), author VARCHAR(255) NOT NULL, avatar_url VARCHAR(500),
+    likes_count INTEGER, replies_count INTEGER, views_count INTEGER, is_pinned BOOLEAN, tags JSON NOT NULL,
+    status VARCHAR(20), created_at DATETIME, updated_at DATETIME)""",
+    "CREATE INDEX ix_discussion_commodity_created ON discussions (commodity, created_at)",
+    "CREATE INDEX ix_discussion_status ON discussions (status)",
+    """CREATE TABLE comments (id INTEGER PRIMARY KEY, discussion_id INTEGER NOT NULL REFERENCES discussions(id),
+    content TEXT NOT NULL, author VARCHAR(255), author_id VARCHAR(255), avatar_url VARCHAR(512),
+    likes_count INTEGER, created_at DATETIME, updated_at DATETIME)""",
+    """INSERT INTO discussions (id, title, content, commodity, author, tags, status, created_at)
+    VALUES (1, 'Onion rates', '...', 'Onion', 'a', '[]', 'PUBLISHED', '2026-01-01 00:00:00')""",
+)
+
+def _migration(name):
+    spec = importlib.util.spec_from_file_location(name, VERSIONS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def connection():
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(sa.text("CREATE TABLE commodities (id INTEGER PRIMARY KEY, name VARCHAR(100))"))
+        yield conn
+
+def test_lower_name_index_reports_case_duplicates(connection):
+    connection.execute(sa.text("INSERT INTO commodities (id, name) VALUES (1, 'Onion'), (2, 'Wheat'), (3, 'onion')"))
+
+    with pytest.raises(RuntimeError, match="1: 'Onion', 3: 'onion'"):
+        _migration("027_lower_name_indexes")._check_commodity_case_duplicates(connection)
+
+def test_lower_name_index_accepts_distinct_names(connection):
+    connection.execute(sa.text("INSERT INTO commodities (id, name) VALUES (1, 'Onion'), (2, 'Wheat')"))
+
+    _migration("027_lower_name_indexes")._check_commodity_case_duplicates(connection)
+
+def test_sqlite_upgrade_stores_sortable_datetime_like_the_models(tmp_path):
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "app" / "database" / "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+
+    command.upgrade(config, "008_mp_covering_index")
+    engine = sa.create_engine(url)
+    with engine.begin() as conn:
+        for statement in LEGACY_DISCUSSION_TABLES:
+            conn.execute(sa.text(statement))
+    command.upgrade(config, "head")
+
+    with engine.connect() as conn:
+        for table in ("discussions", "discussion_comments"):
+            sql = conn.execute(sa.text("SELECT sql FROM sqlite_master WHERE name = :t"), {"t": table}).scalar_one()
+            assert "COALESCE(updated_at, created_at)) STORED" in sql
+        assert conn.execute(sa.text("SELECT sortable_datetime FROM discussions")).scalar_one() == "2026-01-01 00:00:00"
+    engine.dispose()
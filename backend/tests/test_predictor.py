@@ -0,0 +1,123 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.ml.artifacts import load_artifact
+from backend.app.ml.batching import ForecastBatcher
+from backend.app.ml.predictor import AgriculturalPredictor
+
+MODELS_DIR = Path(__file__).resolve().parents[1] / "data" / "models"
+
+HORIZON_DATES = np.datetime64("2026-11-01") + np.arange(7)
+
+@pytest.fixture(scope="module")
+def predictor():
+    predictor = AgriculturalPredictor()
+    predictor.ensemble.model_dir = MODELS_DIR
+    predictor.load_latest_models()
+    assert predictor.is_ready
+    return predictor
+
+def _predictions(results):
+    return [
+        (r["sample_id"], r["prediction"], r["confidence"], r["lower_bound"], r["upper_bound"])
+        for r in results
+    ]
+
+def test_committed_preprocessor_prepares_prediction_data():
+    preprocessor_path = sorted(MODELS_DIR.glob("preprocessor_*.joblib"))[-1]
+    preprocessor = load_artifact(preprocessor_path)
+
+    dates = np.datetime64("2026-11-01") + np.arange(3)
+    data = pd.DataFrame({
+        "date": dates,
+        "commodity_id": 1,
+        "market_id": 1,
+        "price": 2500.0,
+        "arrival": 1500.0,
+    })
+
+    features = preprocessor.prepare_prediction_data(data, date_col="date")
+
+    assert features.shape == (3, len(preprocessor.feature_names))
+    assert preprocessor.festival_calendar.is_festival_day(pd.Timestamp("2026-11-01"))
+
+def test_batched_horizons_match_individual_predictions(predictor):
+    cheap = (HORIZON_DATES, 1, 1, 2500.0, 1500.0)
+    dear = (HORIZON_DATES, 2, 3, 6000.0, 800.0)
+
+    batched = predictor.predict_horizons([cheap, dear])
+
+    assert _predictions(batched[0]) == pytest.approx(_predictions(predictor.predict_horizon(*cheap)))
+    assert _predictions(batched[1]) == pytest.approx(_predictions(predictor.predict_horizon(*dear)))
+
+def test_forecast_batcher_coalesces_without_changing_results(predictor):
+    horizons = [(HORIZON_DATES, i % 3 + 1, 1, 1500.0 + 900.0 * i, 1200.0) for i in range(6)]
+    batch_sizes = []
+    predict_horizons_async = predictor.predict_horizons_async
+
+    async def recording(batch):
+        batch_sizes.append(len(batch))
+        return await predict_horizons_async(batch)
+
+    async def run():
+        batcher = ForecastBatcher(predictor, max_batch=8)
+        batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.predict_horizon(*h) for h in horizons))
+        finally:
+            await batcher.stop()
+
+    predictor.predict_horizons_async = recording
+    try:
+        results = asyncio.run(run())
+    finally:
+        del predictor.predict_horizons_async
+
+    assert sum(batch_sizes) == len(horizons) and len(batch_sizes) < len(horizons)
+    for horizon, result in zip(horizons, results):
+        assert _predictions(result) == pytest.approx(_predictions(predictor.predict_horizon(*horizon)))
+
+def test_reload_publishes_a_new_model_dict(predictor):
+    published = predictor.ensemble.models
+    snapshot = dict(published)
+
+    predictor.ensemble.load_latest_models()
+
+    assert predictor.ensemble.models is not published
+    assert published == snapshot
+    assert set(predictor.ensemble.models) == set(snapshot)
+
+def test_predictions_survive_concurrent_reloads(predictor):
+    features = predictor.preprocessor.prepare_prediction_data(
+        pd.DataFrame({"date": HORIZON_DATES, "commodity_id": 1, "market_id": 1, "price": 2500.0, "arrival": 1500.0}),
+        date_col="date",
+    )
+    expected = [r["prediction"] for r in predictor.batch_predict(features)]
+    errors = []
+
+    def predict():
+        try:
+            for _ in range(10):
+                assert [r["prediction"] for r in predictor.batch_predict(features)] == pytest.approx(expected)
+        except Exception as exc:
+            errors.append(exc)
+
+    def reload():
+        try:
+            for _ in range(5):
+                predictor.ensemble.load_latest_models()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=predict) for _ in range(4)] + [threading.Thread(target=reload) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
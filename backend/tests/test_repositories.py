@@ -0,0 +1,118 @@
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app.database.repositories import (
+    Commodity,
+    CommodityRepository,
+    DiscussionRepository,
+    MarketPrice,
+    MarketPriceRepository,
+    MarketRepository,
+)
+
+@pytest.fixture
+def run_with_session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+
+    async def run(operation):
+        async with engine.begin() as conn:
+            await conn.run_sync(MarketPrice.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            result = await operation(session)
+            await session.commit()
+            return result
+
+    yield lambda operation: asyncio.run(run(operation))
+    asyncio.run(engine.dispose())
+
+def test_get_or_create_returns_existing_rows(run_with_session):
+    async def operation(session):
+        commodities = CommodityRepository(session)
+        markets = MarketRepository(session)
+
+        wheat = await commodities.get_or_create("Wheat", category="Cereals")
+        again = await commodities.get_or_create("wheat", category="Grains")
+        delhi = await markets.get_or_create("Azadpur", "Delhi")
+        same_delhi = await markets.get_or_create("Azadpur", "Delhi")
+        other_state = await markets.get_or_create("Azadpur", "Haryana")
+
+        count = len((await session.scalars(select(Commodity))).all())
+        return wheat, again, delhi, same_delhi, other_state, count
+
+    wheat, again, delhi, same_delhi, other_state, count = run_with_session(operation)
+
+    assert again.id == wheat.id and again.category == "Cereals"
+    assert count == 1
+    assert same_delhi.id == delhi.id
+    assert other_state.id != delhi.id
+
+def test_bulk_upsert_prices_keeps_values_missing_from_partial_rows(run_with_session):
+    async def operation(session):
+        commodity = await CommodityRepository(session).get_or_create("Onion", category="Vegetables")
+        market = await MarketRepository(session).get_or_create("Nashik", "Maharashtra")
+        prices = MarketPriceRepository(session)
+        key = {"commodity_id": commodity.id, "market_id": market.id}
+
+        await prices.bulk_upsert_prices([
+            {**key, "date": "2026-01-05", "price": 10.0, "min_price": 8.0, "arrival": 500.0},
+            {**key, "date": "2026-01-06", "modal_price": 7.0},
+        ])
+        await prices.bulk_upsert_prices([
+            {**key, "date": "2026-01-05", "modal_price": 11.0},
+            {**key, "date": "2026-01-06", "price": 12.0},
+        ])
+
+        rows = (await session.scalars(select(MarketPrice).order_by(MarketPrice.date))).all()
+        return [(r.date, float(r.price), r.min_price, r.modal_price, r.arrival) for r in rows]
+
+    rows = run_with_session(operation)
+
+    assert rows == [
+        (date(2026, 1, 5), 10.0, 8.0, 11.0, 500.0),
+        (date(2026, 1, 6), 12.0, None, 7.0, None),
+    ]
+
+def test_latest_covered_date_tracks_the_stalest_pair(run_with_session):
+    async def operation(session):
+        commodities = CommodityRepository(session)
+        markets = MarketRepository(session)
+        prices = MarketPriceRepository(session)
+        wheat = await commodities.get_or_create("Wheat", category="Cereals")
+        rice = await commodities.get_or_create("Rice", category="Cereals")
+        azadpur = await markets.get_or_create("Azadpur", "Delhi")
+        covered = lambda: prices.get_latest_covered_date(["Wheat", "Rice"], ["Azadpur"])
+
+        await prices.bulk_upsert_prices([
+            {"commodity_id": wheat.id, "market_id": azadpur.id, "date": "2026-01-05", "price": 2500.0},
+            {"commodity_id": wheat.id, "market_id": azadpur.id, "date": "2026-03-01", "price": 2600.0},
+        ])
+        missing_pair = await covered()
+
+        await prices.bulk_upsert_prices([
+            {"commodity_id": rice.id, "market_id": azadpur.id, "date": "2026-02-01", "price": 3500.0},
+        ])
+        return missing_pair, await covered()
+
+    missing_pair, covered = run_with_session(operation)
+
+    assert missing_pair is None
+    # Wheat already has 2026-03-01; the stalest pair decides
+    assert covered == date(2026, 2, 1)
+
+def test_discussions_by_commodity_include_rows_filed_by_name(run_with_session):
+    async def operation(session):
+        discussions = DiscussionRepository(session)
+        await discussions.create(title="Early", content="...", commodity="Garlic", author="a")
+        garlic = await CommodityRepository(session).get_or_create("Garlic", category="Vegetables")
+        await discussions.create(
+            title="Linked", content="...", commodity="garlic", commodity_id=garlic.id, author="b"
+        )
+        await discussions.create(title="Other", content="...", commodity="Onion", author="c")
+        await session.flush()
+        return sorted(d.title for d in await discussions.get_by_commodity("Garlic"))
+
+    assert run_with_session(operation) == ["Early", "Linked"]
@@ -0,0 +1,46 @@
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.main import app
+from backend.app.api.dependencies import get_db, get_db_session
+from backend.app.database import connection
+
+client = TestClient(app)
+
+def test_core_routes_registered():
+    paths = set(app.openapi()["paths"])
+    assert "/api/v1/health" in paths
+    assert "/api/v1/predict/" in paths
+    assert "/api/commodities" in paths
+    assert "/api/v1/commodities" in paths
+    assert "/users/init" in paths
+
+def test_versioned_health_check():
+    response = client.get("/api/v1/health")
+    assert response.status_code == 200
+    assert response.json().get("status") == "healthy"
+
+def test_session_dependencies_share_one_provider():
+    assert get_db_session is get_db
+
+def test_endpoint_using_both_session_dependencies_opens_one_session():
+    opened = []
+
+    async def fake_db():
+        session = object()
+        opened.append(session)
+        yield session
+
+    probe = FastAPI()
+
+    @probe.get("/probe")
+    async def read(db=Depends(get_db), db_session=Depends(get_db_session)):
+        return {"same": db is db_session}
+
+    probe.dependency_overrides[get_db] = fake_db
+    response = TestClient(probe).get("/probe")
+
+    assert response.json() == {"same": True}
+    assert len(opened) == 1
+    assert not hasattr(connection, "get_db")
@@ -0,0 +1,72 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from backend.app.scraper import utils
+
+class _Handler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/versioned" and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = b"page " + self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path in ("/versioned", "/archive"):
+            self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    cache = utils.ResponseCache(str(tmp_path / "http_cache.sqlite"))
+    monkeypatch.setattr(utils, "get_response_cache", lambda: cache)
+    monkeypatch.setattr(utils.rate_limiter, "min_interval", 0.0)
+    _Handler.requests_seen = []
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+def test_cached_pages_are_always_revalidated(server):
+    first = utils.safe_get(f"{server}/versioned")
+    second = utils.safe_get(f"{server}/versioned")
+
+    assert first.content == second.content == b"page /versioned"
+    assert _Handler.requests_seen == [("/versioned", None), ("/versioned", '"v1"')]
+
+def test_responses_without_validators_are_not_cached(server):
+    utils.safe_get(f"{server}/live")
+    utils.safe_get(f"{server}/live")
+
+    assert _Handler.requests_seen == [("/live", None), ("/live", None)]
+
+def test_immutable_pages_skip_the_server(server):
+    utils.safe_get(f"{server}/archive", immutable=True)
+    cached = utils.safe_get(f"{server}/archive", immutable=True)
+
+    assert cached.content == b"page /archive"
+    assert _Handler.requests_seen == [("/archive", None)]
+
+def test_each_network_request_waits_on_the_rate_limiter_once(server, monkeypatch):
+    waits = []
+    monkeypatch.setattr(utils.rate_limiter, "wait", lambda: waits.append(True))
+
+    utils.safe_get(f"{server}/versioned")
+    utils.safe_get(f"{server}/versioned")
+    utils.safe_get(f"{server}/archive", immutable=True)
+    utils.safe_get(f"{server}/archive", immutable=True)
+
+    assert len(waits) == len(_Handler.requests_seen) == 3
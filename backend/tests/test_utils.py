@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from backend.app.core.utils import chunk_list, is_holiday
+
+def test_is_holiday_takes_a_list_of_holidays():
+    holidays = [datetime(2026, 1, 26), datetime(2026, 8, 15, 9, 30)]
+
+    assert is_holiday(datetime(2026, 8, 15, 18, 0), holidays)
+    assert not is_holiday(datetime(2026, 8, 16), holidays)
+    assert not is_holiday(datetime(2026, 1, 26))
+
+def test_chunk_list_returns_a_reusable_list():
+    chunks = chunk_list(list(range(7)), 3)
+
+    assert len(chunks) == 3
+    assert chunks[-1] == [6]
+    assert list(chunks) == list(chunks) == [[0, 1, 2], [3, 4, 5], [6]]